@@ -20,6 +20,7 @@ from src.entity.config_entity import (TrainingRawDataTransformationConfig,
 from src.logger import logger
 from src.pipeline.training_pipeline import TrainingPipeline
 from src.pipeline.prediction_pipeline import PredictionPipeline
+from src.db_management.validation_log_store import ValidationLogStore, get_validation_summary
 from src.utilities.utils import (clear_artifact_folder,
                                  read_json,
                                  create_folder_using_file_path,
@@ -239,8 +240,7 @@ async def get_training_results_route(request: Request, background_tasks: Backgro
     Workflow:
     1. Check if the training process is completed and if upload status is not complete; 
        if so, initiate a background task to synchronize training data with S3.
-    2. Load and process the validation report data from an Excel file, summarizing the 
-       status and reasons for validation failures.
+    2. Load the precomputed validation summary (status and reasons for validation failures).
     3. Read preprocessing summary data from a JSON file and prepare statistics related to 
        preprocessing actions taken during training.
     4. Load results for all models and the best performing models, removing unnecessary 
@@ -266,15 +266,11 @@ async def get_training_results_route(request: Request, background_tasks: Backgro
     if os.path.exists(TrainingRawDataTransformationConfig.dashboard_validation_show):    
         hide_validation_report = True
     
-    # get the validation data    
-    validation_data = pd.read_excel(TrainingRawDataTransformationConfig.dashboard_validation_report_file_path)
-    
-    # Process validation data for plots
-    validation_sub_dict = validation_data['STATUS'].value_counts().to_dict()
-    no_of_files = validation_data['FILENAME'].nunique()
-    validation_sub_dict['Passed'] = no_of_files - validation_sub_dict['Failed'] # passed validation will count more in validation report
-    validation_summary = validation_sub_dict
-    validation_status_reasons = validation_data[validation_data['STATUS'] == 'Failed']['STATUS_REASON'].value_counts().to_dict()
+    # get the precomputed validation summary for plots
+    validation_data = get_validation_summary(summary_file_path=TrainingRawDataTransformationConfig.dashboard_validation_summary_file_path,
+                                             legacy_excel_file_path=TrainingRawDataTransformationConfig.dashboard_validation_report_file_path)
+    validation_summary = validation_data["validation_summary"]
+    validation_status_reasons = validation_data["status_reasons"]
     
     # read model result json files        
     preprocessing_data = read_json(PreprocessorConfig.dashboard_preprocessor_json_file_path)
@@ -651,10 +647,9 @@ def get_validation_results() -> JSONResponse:
     """
     Retrieves a summary of the validation results from the validation report.
 
-    This endpoint reads the validation report from an Excel file, processes
-    the validation statuses of files, and summarizes the validation results
-    by counting the number of files that passed or failed. Additionally, it 
-    identifies the main reasons for validation failures.
+    This endpoint reads the validation summary precomputed by the validation
+    process (the number of files that passed or failed and the main reasons
+    for validation failures). Legacy Excel reports are summarized on the fly.
 
     The response includes:
     - "validation_summary": Dictionary summarizing the number of files that 
@@ -667,15 +662,11 @@ def get_validation_results() -> JSONResponse:
                       with counts of passed and failed files, and 
                       `status_reasons` with counts for each failure reason.
     """
-    # read the validation report
-    validation_data = pd.read_excel(prediction_pipeline.prediction_rawdata_validation_config.dashboard_validation_report_file_path)
-
-    # Process validation data for plots (for validation failed files report)
-    validation_sub_dict = validation_data['STATUS'].value_counts().to_dict()
-    no_of_files = validation_data['FILENAME'].nunique()
-    validation_sub_dict['Passed'] = no_of_files - validation_sub_dict['Failed'] # passed validation will count more in validation report we need only 4 stages of validation passed files
-    validation_summary = validation_sub_dict
-    validation_status_reasons = validation_data[validation_data['STATUS'] == 'Failed']['STATUS_REASON'].value_counts().to_dict()
+    # read the precomputed validation summary (for validation failed files report)
+    validation_data = get_validation_summary(summary_file_path=prediction_pipeline.prediction_rawdata_validation_config.dashboard_validation_summary_file_path,
+                                             legacy_excel_file_path=prediction_pipeline.prediction_rawdata_validation_config.dashboard_validation_report_file_path)
+    validation_summary = validation_data["validation_summary"]
+    validation_status_reasons = validation_data["status_reasons"]
 
     return JSONResponse({
         "validation_summary": validation_summary,
@@ -740,13 +731,18 @@ def download_validation_report() -> FileResponse:
     Downloads the validation report as an Excel file.
 
     This endpoint provides a download link for the validation report generated 
-    during the prediction pipeline's data validation process. The report 
-    is returned as an Excel file named `validation_logs.xlsx`.
+    during the prediction pipeline's data validation process. The styled report 
+    written during the run is returned (rendered again from the validation log 
+    store when missing or outdated) as an Excel file named `validation_logs.xlsx`.
 
     Returns:
         FileResponse: A response containing the `validation_logs.xlsx` file for download.
     """
-    return FileResponse(prediction_pipeline.prediction_rawdata_validation_config.dashboard_validation_report_file_path, filename='validation_logs.xlsx')
+    config = prediction_pipeline.prediction_rawdata_validation_config
+    excel_file_path = config.dashboard_validation_report_file_path
+    if os.path.exists(config.dashboard_validation_log_store_file_path):
+        excel_file_path = ValidationLogStore(db_file_path=config.dashboard_validation_log_store_file_path).render_excel(excel_file_path=excel_file_path)
+    return FileResponse(excel_file_path, filename='validation_logs.xlsx')
 
 @app.get("/download/failed_files")
 def download_failed_files() -> FileResponse:
@@ -4,18 +4,20 @@ import sys
 import pandas as pd
 from typing import Literal
 import numpy as np
+import pyarrow.parquet as pq
 from pandas import DataFrame
 from src.logger import logger
 from src.exception import SensorFaultException
-from src.utilities.utils import read_csv_file,create_folder_using_folder_path
+from src.utilities.utils import read_intermediate_file,read_csv_header,read_excel_file_fast,create_folder_using_folder_path
 from src.entity.artifact_entity import DataIngestionArtifacts
 from src.entity.config_entity import S3Config, DataIngestionConfig
 from mypy_boto3_s3.service_resource import Bucket
 from src.db_management.aws_storage import SimpleStorageService
 
 class DataIngestion:
-    def __init__(self,input_dataset_path:Path) -> None:
+    def __init__(self,input_dataset_path:Path,schema_dtypes:dict[str, str] | None=None) -> None:
         self.input_dataset_path = input_dataset_path
+        self.schema_dtypes = schema_dtypes
          
     def get_data(self) -> DataFrame:
         """get_data :Used for getting the data from input dataset path
@@ -27,7 +29,7 @@ class DataIngestion:
             DataFrame: input dataframe
         """
         try:
-            input_dataframe = read_csv_file(self.input_dataset_path)
+            input_dataframe = read_intermediate_file(self.input_dataset_path,schema_dtypes=self.schema_dtypes)
             
             logger.info(f"Getting data :: Status:Successfully")
             
@@ -75,13 +77,13 @@ class GetTrainingData:
             tuple: file_path, status(retraining,training, default_training)
         """
         try:
-            if not self.s3_obj.check_s3_folder_empty(bucket_object=self.s3_bucket_obj,s3_folder_path=self.s3_config.retraining_files_path):
+            if not self.s3_obj.is_s3_prefix_empty(bucket_obj=self.s3_bucket_obj,prefix=self.s3_config.retraining_files_path):
                 file_path = self.s3_config.retraining_files_path
                 logger.info("Retraining Process started!")
                 logger.info(f"get_file_path:: Status:Success :: file_path = {file_path}")
                 status='retraining'
                 return file_path,status
-            elif not self.s3_obj.check_s3_folder_empty(bucket_object=self.s3_bucket_obj,s3_folder_path=self.s3_config.training_files_path):
+            elif not self.s3_obj.is_s3_prefix_empty(bucket_obj=self.s3_bucket_obj,prefix=self.s3_config.training_files_path):
                 file_path = self.s3_config.training_files_path
                 logger.info("training Process started on Existing Validated Data!")
                 logger.info(f"get_file_path:: Status:Success :: file_path = {file_path}")
@@ -115,9 +117,16 @@ class GetTrainingData:
         try:
             logger.info(f"files_store_in_local_path:: create folder for storing cloud training files into local")
             create_folder_using_folder_path(self.config.training_batch_files_folder_path)
-            self.s3_obj.download_files_from_s3(bucket_obj=self.s3_bucket_obj,
-                                               local_folder_path=self.config.training_batch_files_folder_path,
-                                               s3_subfolder_path=s3_files_path)
+            if self.config.s3_incremental_sync:
+                # only new or changed files are downloaded (local mirror keeps previously synced files)
+                self.s3_obj.sync_s3_folder_to_local(bucket_obj=self.s3_bucket_obj,
+                                                    s3_folder_path=s3_files_path,
+                                                    local_folder_path=self.config.training_batch_files_folder_path,
+                                                    mirror_folder_path=self.config.s3_mirror_folder_path)
+            else:
+                self.s3_obj.download_files_from_s3(bucket_obj=self.s3_bucket_obj,
+                                                   local_folder_path=self.config.training_batch_files_folder_path,
+                                                   s3_subfolder_path=s3_files_path)
             logger.info(f"files_store_in_local_path :: Status: Success")
             logger.info(f"Data stored in Local_path:{self.config.training_batch_files_folder_path} from Cloud_path:{s3_files_path}")
             
@@ -127,8 +136,76 @@ class GetTrainingData:
             logger.info(f"files_store_in_local_path :: Status:Failed :: Error:{error_message}")
             raise error_message
     
+    def get_feedback_and_prediction_files(self,local_training_files_path: Path) -> tuple[list[Path], list[Path]]:
+        """get_feedback_and_prediction_files :Used for separate the retraining files into feedback files and prediction files,
+        excel files or csv/parquet files contains feedback column are feedback files
+
+        Args:
+            local_training_files_path (Path): local training files path : artifacts/Training_batch_files
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            tuple[list[Path], list[Path]]: feedback file paths, prediction file paths (sorted by file name)
+        """
+        try:
+            feedback_file_paths, prediction_file_paths = [], []
+            for file_name in sorted(os.listdir(local_training_files_path)):
+                if file_name in (self.config.final_file_name, self.config.final_file_name_prediction):
+                    continue
+                file_path = Path(os.path.join(local_training_files_path,file_name))
+                if file_name.endswith("xlsx"):
+                    feedback_file_paths.append(file_path)
+                    continue
+                
+                if file_name.endswith(".parquet"):
+                    columns = pq.read_schema(file_path).names
+                else:
+                    columns = read_csv_header(file_path)
+                if self.config.feedback_column_name in columns:
+                    feedback_file_paths.append(file_path)
+                else:
+                    prediction_file_paths.append(file_path)
+            
+            logger.info(f"get_feedback_and_prediction_files :: Status:Success :: feedback_files:{feedback_file_paths} :: prediction_files:{prediction_file_paths}")
+            return feedback_file_paths, prediction_file_paths
+        
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.info(f"get_feedback_and_prediction_files :: Status:Failed :: Error:{error_message}")
+            raise error_message
+    
+    def read_feedback_file(self,file_path: Path) -> pd.DataFrame:
+        """read_feedback_file :Used for read the feedback file (excel in read only mode, csv or parquet)
+
+        Args:
+            file_path (Path): feedback file path
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            pd.DataFrame: feedback dataframe with wafer, output and feedback columns
+        """
+        try:
+            columns = [self.config.wafer_column_name,self.config.output_column_name,self.config.feedback_column_name]
+            if str(file_path).endswith("xlsx"):
+                feedback_df = read_excel_file_fast(file_path)
+            elif str(file_path).endswith(".parquet"):
+                feedback_df = pd.read_parquet(file_path, columns=columns)
+            else:
+                feedback_df = pd.read_csv(file_path, usecols=columns)
+            return feedback_df[columns]
+        
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.info(f"read_feedback_file :: Status:Failed :: file_path:{file_path} :: Error:{error_message}")
+            raise error_message
+    
     def add_feedback_to_prediction_file(self,local_training_files_path: Path):
-        """add_feedback_to_prediction_file :This method used for merge the prediction file and feedback file
+        """add_feedback_to_prediction_file :This method used for merge all the prediction files and feedback files into single retraining file,
+        feedback of later file (by file name) wins for same wafer
 
         Args:
             local_training_files_path (Path): local training files path : artifacts/Training_batch_files
@@ -137,27 +214,25 @@ class GetTrainingData:
             error_message: _description_
         """
         try:
-            prediction_file_paths = {}
-            for file_name in os.listdir(local_training_files_path):
-                if file_name!=self.config.final_file_name:
-                    file_path = os.path.join(local_training_files_path,file_name)
-                    if file_name.endswith("xlsx"):
-                        prediction_file_paths['feedback_file_path'] = file_path
-                    else:
-                        prediction_file_paths['prediction_file_path'] = file_path    
-            
+            feedback_file_paths, prediction_file_paths = self.get_feedback_and_prediction_files(local_training_files_path=local_training_files_path)
+            if len(feedback_file_paths)==0 or len(prediction_file_paths)==0:
+                raise ValueError(f"feedback files and prediction files are needed for retraining :: feedback_files:{feedback_file_paths} :: prediction_files:{prediction_file_paths}")
             
-            feedback_df = pd.read_excel(prediction_file_paths['feedback_file_path'])
-            prediction_file_df = pd.read_csv(prediction_file_paths['prediction_file_path'])
+            # combine all the feedback files and prediction files (latest row wins for same wafer)
+            feedback_df = pd.concat([self.read_feedback_file(file_path) for file_path in feedback_file_paths], ignore_index=True)
+            feedback_df = feedback_df.drop_duplicates(subset=[self.config.wafer_column_name], keep='last')
+            prediction_file_df = pd.concat([read_intermediate_file(file_path) for file_path in prediction_file_paths], ignore_index=True)
+            prediction_file_df = prediction_file_df.drop_duplicates(subset=[self.config.wafer_column_name], keep='last')
                             
-            # preprocess the feedback_df
-            feedback_df[self.config.final_output_column_name] = np.where(pd.isna(feedback_df[self.config.feedback_column_name]),feedback_df[self.config.output_column_name],feedback_df[self.config.feedback_column_name])
-            feedback_df[self.config.final_output_column_name] = feedback_df[self.config.final_output_column_name].map({self.config.target_feature_zero_map:0,
-                                                                                                                       self.config.target_feature_one_map:1})
+            # preprocess the feedback_df (feedback overrides the predicted output)
+            final_output = feedback_df[self.config.feedback_column_name].where(feedback_df[self.config.feedback_column_name].notna(),
+                                                                                 feedback_df[self.config.output_column_name])
+            feedback_df[self.config.final_output_column_name] = final_output.map({self.config.target_feature_zero_map:0,
+                                                                                   self.config.target_feature_one_map:1})
                   
             final_feedback_df = feedback_df[[self.config.wafer_column_name,self.config.final_output_column_name]]    
             
-            # merge feedback into prediction data file
+            # merge feedback into prediction data file (single hash join on wafer for all files)
             merged_df = pd.merge(prediction_file_df,final_feedback_df,on=self.config.wafer_column_name,how='left')
             merged_df.drop(columns=[self.config.output_column_name],inplace=True)
             merged_df.rename(columns={self.config.final_output_column_name:self.config.output_column_name},inplace=True)
@@ -166,10 +241,10 @@ class GetTrainingData:
             merged_df.to_csv(final_file_prediction_path,index=False)
             
             # remove the preprocessed files
-            os.remove(prediction_file_paths['feedback_file_path'])
-            os.remove( prediction_file_paths['prediction_file_path'])
+            for file_path in feedback_file_paths + prediction_file_paths:
+                os.remove(file_path)
             
-            logger.info(f'add_feedback_to_prediction_file :: prediction file and feedback file merged :: file_path:{final_file_prediction_path}')
+            logger.info(f'add_feedback_to_prediction_file :: {len(prediction_file_paths)} prediction files and {len(feedback_file_paths)} feedback files merged :: file_path:{final_file_prediction_path}')
 
         except Exception as e:
             error_message = SensorFaultException(error_message=str(e),error_detail=sys)
@@ -1,20 +1,101 @@
 import pandas  as pd
+import numpy as np
 import sys,os
-from sklearn.base import BaseEstimator, TransformerMixin
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.base import BaseEstimator, TransformerMixin, clone
 from sklearn.preprocessing import PowerTransformer
 from sklearn.impute import KNNImputer
+from sklearn.decomposition import PCA
+from sklearn.neighbors import KDTree
+from sklearn.metrics.pairwise import nan_euclidean_distances
 from src.exception import SensorFaultException
 from src.logger import logger
 from src.entity.config_entity import PreprocessorConfig,BaseArtifactConfig
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import FunctionTransformer
-from src.utilities.utils import create_folder_using_file_path,save_obj,save_json,copy_file
+from src.utilities.utils import (create_folder_using_file_path,save_obj,save_json,read_json,
+                                 save_intermediate_file,read_intermediate_file)
+from src.utilities.artifact_cache import ArtifactCache
 from src.entity.artifact_entity import PreprocessorArtifacts
+from src.components.preprocessor_kernel import yeo_johnson
 
 
 preprocessing_results = {}
 target_column = PreprocessorConfig.target_feature
+PROFILE_STATISTICS = ("std", "null_ratio", "skew", "percentiles")
+
+
+def compute_column_profile(X:pd.DataFrame, percentiles:list[float], statistics:tuple=PROFILE_STATISTICS) -> pd.DataFrame:
+    """compute_column_profile :Used for compute the column statistics (std, null ratio, skew and percentiles)
+    of all columns with single vectorized dataframe reduction for each statistic (same results as column wise pandas calls)
+
+    Args:
+        X (pd.DataFrame): numeric dataframe
+        percentiles (list[float]): percentiles to compute (0-1)
+        statistics (tuple): statistics to compute. Defaults to PROFILE_STATISTICS.
+
+    Raises:
+        error_message: Custom Exception
+
+    Returns:
+        pd.DataFrame: profile indexed by column name, percentile columns are named "p_<percentile>"
+    """
+    try:
+        profile = pd.DataFrame(index=X.columns)
+        if "null_ratio" in statistics:
+            profile["null_ratio"] = X.isnull().mean()
+        if "std" in statistics:
+            profile["std"] = X.std()
+        if "skew" in statistics:
+            profile["skew"] = X.skew()
+        if "percentiles" in statistics and len(percentiles):
+            quantiles = X.quantile(percentiles)
+            for percentile in percentiles:
+                profile[f"p_{percentile}"] = quantiles.loc[percentile]
+
+        logger.info(f"compute_column_profile :: Status:Success :: no_of_columns:{X.shape[1]} :: statistics:{statistics}")
+        return profile
+
+    except Exception as e:
+        error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(msg=f"compute_column_profile :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+
+def get_pipeline_preprocessor(pipeline:Pipeline) -> "Preprocessor":
+    """get_pipeline_preprocessor :Used for getting the Preprocessor object of drop_duplicate_rows step of pipeline
+
+    Args:
+        pipeline (Pipeline): stage one preprocessing pipeline
+
+    Returns:
+        Preprocessor: preprocessor object
+    """
+    return pipeline.named_steps["drop_duplicate_rows"].func.__self__
+
+
+def get_non_duplicate_index(pipeline:Pipeline) -> pd.Index:
+    """get_non_duplicate_index :Used for getting the input index of rows kept by last drop_duplicate_rows step run of pipeline
+
+    Args:
+        pipeline (Pipeline): stage one preprocessing pipeline
+
+    Returns:
+        pd.Index: index of non duplicate rows
+    """
+    return get_pipeline_preprocessor(pipeline).non_duplicate_index
+
+
 class Preprocessor:
+    # changed when cached preprocessing files change, cache entries of old files are not reused
+    cache_files_version: int = 4
+    # config values preprocessing output depends on (paths are not part of cache key, they change with run timestamp)
+    cache_key_config_names: tuple = ("unwanted_columns_list", "target_feature", "wafer_column_name", "lower_percentile",
+                                     "upper_percentile", "iqr_multiplier", "knn_imputer_n_neighbors", "knn_imputer_backend",
+                                     "fast_knn_n_components", "fast_knn_n_candidates", "fast_knn_latency_budget_seconds",
+                                     "fast_knn_validation_sample_size", "fast_knn_tolerance", "downcast_float")
+
     def __init__(self,config:PreprocessorConfig, input_file:pd.DataFrame) -> None:
         self.input_input_file = input_file
         self.config = config
@@ -35,7 +116,8 @@ class Preprocessor:
             preprocessing_results["total_records"] = df.shape[0]
             preprocessing_results["total_columns"] = df.shape[1]
             dropped_columns = self.config.unwanted_columns_list
-            df.drop(columns=dropped_columns, inplace=True)
+            # not dropped in place, caller dataframe keeps the wafer column
+            df = df.drop(columns=dropped_columns)
             logger.info(f'Dropped columns :: Status: Success :: dropped_columns:{dropped_columns}')
             return df
         except Exception as e:
@@ -44,7 +126,8 @@ class Preprocessor:
             raise error_message
         
     def drop_duplicate_rows(self, df: pd.DataFrame) -> pd.DataFrame:
-        """drop_duplicate_rows :Used for drop duplicate data in dataframe
+        """drop_duplicate_rows :Used for drop duplicate data in dataframe, rows are compared by hash of all column values,
+        index of kept rows is stored in non_duplicate_index and non duplicate data is saved only when config.save_non_duplicate_data is True
 
         Args:
             df (pd.DataFrame): Input Dataframe
@@ -56,14 +139,16 @@ class Preprocessor:
             pd.DataFrame: clean dataframe
         """
         try:
-            before_shape = df.shape
-            df.drop_duplicates(inplace=True)
-            after_shape = df.shape
-            no_of_dropped_rows = before_shape[0]-after_shape[0]
+            duplicated_rows = pd.util.hash_pandas_object(df, index=False).duplicated().to_numpy()
+            no_of_dropped_rows = int(duplicated_rows.sum())
+            if no_of_dropped_rows:
+                df = df[~duplicated_rows]
+            self.non_duplicate_index = df.index
             preprocessing_results['no_of_duplicate_rows']=no_of_dropped_rows
             logger.info(f'Dropped Duplicate rows :: Status: Success :: no_of_rows_dropped:{no_of_dropped_rows}')
-            create_folder_using_file_path(self.config.non_duplicate_data_clear_df_path)
-            df.to_csv(self.config.non_duplicate_data_clear_df_path,index=False)
+            if getattr(self.config, 'save_non_duplicate_data', False):
+                create_folder_using_file_path(self.config.non_duplicate_data_clear_df_path)
+                save_intermediate_file(df=df,file_path=self.config.non_duplicate_data_clear_df_path)
             return df
         
         except Exception as e:
@@ -71,16 +156,73 @@ class Preprocessor:
             logger.error(msg=f"Dropped Duplicate rows :: Status: Failed :: Error:{error_message}")
             raise error_message
     
+    class ColumnProfiler(BaseEstimator, TransformerMixin):
+        """ColumnProfiler :It is custom transformer used for compute the column profile (statistics) of input data in single pass,
+        profile is shared by next transformers fit and stored in preprocessing report, no change in data
+        """
+        def __init__(self,config: PreprocessorConfig, statistics:tuple=PROFILE_STATISTICS):
+            self.profile = None
+            self.config = config
+            self.statistics = statistics
+            self.changed_columns = set()
+
+        def fit(self,X,y=None):
+            try:
+                self.profile = compute_column_profile(X, percentiles=[self.config.lower_percentile, self.config.upper_percentile],
+                                                      statistics=self.statistics)
+                self.profile_dtypes = X.dtypes
+                self.changed_columns = set()
+                # NaN is not valid json, stored as null
+                preprocessing_results['column_profile'] = self.profile.astype(object).where(self.profile.notna(), None).to_dict(orient='index')
+                logger.info(f"ColumnProfiler fitted successfully :: no_of_columns:{self.profile.shape[0]} :: statistics:{self.statistics}")
+
+            except Exception as e:
+                logger.error(f"An error occurred during fitting: {e}")
+                raise e
+
+            return self
+
+        def transform(self, X, y=None):
+            return X
+
+        def mark_changed(self, columns) -> None:
+            """mark_changed :Used for mark the columns whose values are changed by a step after profiling (imputed or power transformed)
+            """
+            self.changed_columns.update(columns)
+
+        def get_profile(self, X, statistics:tuple | None=None) -> pd.DataFrame:
+            """get_profile :Used for getting the profile of X columns from fitted profile, statistics of columns changed after profiling
+            (marked by steps, dtype changed or not profiled) are computed again on X
+            """
+            statistics = statistics or self.statistics
+            percentiles = [self.config.lower_percentile, self.config.upper_percentile]
+            if self.profile is None:
+                return compute_column_profile(X, percentiles=percentiles, statistics=statistics)
+
+            profile_dtypes = getattr(self, 'profile_dtypes', pd.Series(dtype=object)).reindex(X.columns)
+            changed = X.columns[~X.columns.isin(self.profile.index) | X.columns.isin(list(getattr(self, 'changed_columns', ())))
+                                | (X.dtypes.astype(str) != profile_dtypes.astype(str))]
+            profile = self.profile.reindex(X.columns)
+            if len(changed):
+                changed_profile = compute_column_profile(X[changed], percentiles=percentiles, statistics=statistics)
+                profile.loc[changed, changed_profile.columns] = changed_profile
+            return profile
+
     class HandleZeroStdColumns(BaseEstimator, TransformerMixin):
-        def __init__(self,config: PreprocessorConfig) -> None:
+        def __init__(self,config: PreprocessorConfig, column_profiler=None) -> None:
             """__init__ :Custom Transformer used for handle zero standard deviation columns
             """
             self.zero_std_columns =[]
             self.config = config
+            self.column_profiler = column_profiler
 
         def fit(self,X,y=None):
             try:
-                self.zero_std_columns = [column for column in X.columns if X[column].std() == 0]
+                if self.column_profiler is not None:
+                    column_std = self.column_profiler.get_profile(X, statistics=("std",))["std"]
+                else:
+                    column_std = compute_column_profile(X, percentiles=[], statistics=("std",))["std"]
+                self.zero_std_columns = column_std.index[column_std == 0].tolist()
                 preprocessing_results['zero_std_columns'] = int(len(self.zero_std_columns))
                 if self.config.target_feature in self.zero_std_columns:
                     self.zero_std_columns.remove(self.config.target_feature)
@@ -120,20 +262,34 @@ class Preprocessor:
     class HandleHighSkewColumns(BaseEstimator, TransformerMixin):
         """HandleHighSkewColumns :It is custom transformer used for handle high skew columns 
         """
-        def __init__(self,config: PreprocessorConfig):
+        def __init__(self,config: PreprocessorConfig, column_profiler=None):
             self.skewed_columns =[]
             self.power_transformation = PowerTransformer()    
             self.config = config
+            self.column_profiler = column_profiler
 
         def fit(self,X,y=None):
             try:
-                high_skew_columns = X.columns[(X.skew() < -1) | (X.skew() > 1)]
+                # skew of imputed columns is computed again on imputed data (input of this step)
+                if self.column_profiler is not None:
+                    column_skew = self.column_profiler.get_profile(X, statistics=("skew",))["skew"]
+                else:
+                    column_skew = X.skew()
+                high_skew_columns = X.columns[(column_skew < -1) | (column_skew > 1)]
                 self.skewed_columns = list(high_skew_columns)
                 preprocessing_results['highskew_columns']= int(len(self.skewed_columns))
                 if self.config.target_feature in self.skewed_columns:
                     self.skewed_columns.remove(self.config.target_feature) 
+                if self.column_profiler is not None:
+                    self.column_profiler.mark_changed(self.skewed_columns)
                 
                 self.power_transformation.fit(X[self.skewed_columns])
+                if self.skewed_columns and self.power_transformation.method == 'yeo-johnson' and self.power_transformation.standardize:
+                    # standardization parameters of transformed training data, kernel uses them with public lambdas_
+                    transformed = yeo_johnson(X[self.skewed_columns].to_numpy(dtype=np.float64), self.power_transformation.lambdas_)
+                    self.standardize_mean = np.nanmean(transformed, axis=0)
+                    standardize_scale = np.nanstd(transformed, axis=0)
+                    self.standardize_scale = np.where(standardize_scale == 0, 1.0, standardize_scale)
                 logger.info("HandleHighSkewColumns PowerTransformer  fitted successfully.")  
 
             except Exception as e:
@@ -167,19 +323,173 @@ class Preprocessor:
             
             return transformed_data        
     
+    class FastKNNImputer(BaseEstimator, TransformerMixin):
+        """FastKNNImputer :It is custom imputer gives KNNImputer (uniform weights) results without brute force search,
+        candidate donors are searched in KDTree over standardized pca reduced training rows and re-ranked with exact nan_euclidean distance
+        """
+        def __init__(self, n_neighbors:int=5, n_components:int=20, n_candidates:int=100, chunk_size:int=64,
+                     n_jobs:int=1, latency_budget_seconds:float=0, validation_sample_size:int=0, tolerance:float=1e-6):
+            self.n_neighbors = n_neighbors
+            self.n_components = n_components
+            self.n_candidates = n_candidates
+            self.chunk_size = chunk_size
+            self.n_jobs = n_jobs
+            self.latency_budget_seconds = latency_budget_seconds
+            self.validation_sample_size = validation_sample_size
+            self.tolerance = tolerance
+
+        def reduce(self, X:np.ndarray) -> np.ndarray:
+            """reduce :Used for project rows into neighbor index space (missing values filled with training mean)
+            """
+            X = np.where(np.isnan(X), self.fit_mean_, X)
+            return self.pca_.transform((X - self.fit_mean_) / self.fit_scale_)
+
+        def fit(self, X, y=None):
+            try:
+                self.fit_X_ = np.asarray(X, dtype=np.float64)
+                self.fit_mask_ = np.isnan(self.fit_X_)
+                with np.errstate(all='ignore'):
+                    self.fit_mean_ = np.nan_to_num(np.nanmean(self.fit_X_, axis=0))
+                    self.fit_median_ = np.nan_to_num(np.nanmedian(self.fit_X_, axis=0))
+                    fit_std = np.nanstd(self.fit_X_, axis=0)
+                self.fit_scale_ = np.where(np.isnan(fit_std) | (fit_std == 0), 1, fit_std)
+
+                n_components = max(1, min(self.n_components, *self.fit_X_.shape))
+                self.pca_ = PCA(n_components=n_components)
+                self.pca_.fit((np.where(self.fit_mask_, self.fit_mean_, self.fit_X_) - self.fit_mean_) / self.fit_scale_)
+                self.tree_ = KDTree(self.reduce(self.fit_X_))
+                logger.info(f"FastKNNImputer fitted successfully :: no_of_rows:{self.fit_X_.shape[0]} :: n_components:{n_components}")
+
+                self.validation_max_abs_error_ = 0.0
+                if self.validation_sample_size:
+                    self.validate(X)
+
+            except Exception as e:
+                logger.error(f"An error occurred during fitting: {e}")
+                raise e
+
+            return self
+
+        def validate(self, X) -> float:
+            """validate :Used for compare the imputed values of held-out training rows having NaN with KNNImputer result,
+            both imputers are fitted on remaining training rows (held-out rows are never donors of themselves)
+
+            Returns:
+                float: maximum absolute difference
+            """
+            X = np.asarray(X, dtype=np.float64)
+            rows_with_nan = np.flatnonzero(np.isnan(X).any(axis=1))
+            held_out_rows = np.sort(np.random.default_rng(42).permutation(rows_with_nan)[:self.validation_sample_size])
+            fit_rows = np.setdiff1d(np.arange(len(X)), held_out_rows)
+            if not len(held_out_rows) or len(fit_rows) < self.n_neighbors:
+                return 0.0
+            expected = KNNImputer(n_neighbors=self.n_neighbors, weights='uniform', keep_empty_features=True).fit(X[fit_rows]).transform(X[held_out_rows])
+            actual = clone(self).set_params(validation_sample_size=0).fit(X[fit_rows]).impute_chunk(X[held_out_rows], deadline=None)
+            self.validation_max_abs_error_ = float(np.max(np.abs(expected - actual)))
+            preprocessing_results['knn_imputer_max_abs_error'] = self.validation_max_abs_error_
+            logger.info(f"FastKNNImputer validated with KNNImputer on held-out rows :: no_of_rows:{len(held_out_rows)} :: max_abs_error:{self.validation_max_abs_error_}")
+            return self.validation_max_abs_error_
+
+        def brute_force_value(self, row:np.ndarray, column:int) -> float:
+            """brute_force_value :Used for impute single value with exact KNNImputer search over all training donors of column
+            """
+            donors = np.flatnonzero(~self.fit_mask_[:, column])
+            if not len(donors):
+                return self.fit_mean_[column]
+            distances = nan_euclidean_distances(row[None, :], self.fit_X_[donors])[0]
+            # donors without common features (NaN distance) get zero weight in KNNImputer, never selected here
+            donors, distances = donors[~np.isnan(distances)], distances[~np.isnan(distances)]
+            if not len(donors):
+                return self.fit_mean_[column]
+            n_neighbors = min(self.n_neighbors, len(donors))
+            nearest = np.argpartition(distances, n_neighbors - 1)[:n_neighbors]
+            return self.fit_X_[donors[nearest], column].mean()
+
+        def impute_chunk(self, X_chunk:np.ndarray, deadline:float | None) -> np.ndarray:
+            """impute_chunk :Used for impute the missing values of chunk rows, column medians are used after deadline
+            """
+            original_chunk = X_chunk
+            X_chunk = X_chunk.copy()
+            missing = np.isnan(X_chunk)
+            if deadline is not None and time.perf_counter() > deadline:
+                X_chunk[missing] = np.broadcast_to(self.fit_median_, X_chunk.shape)[missing]
+                return X_chunk
+
+            n_features = self.fit_X_.shape[1]
+            n_candidates = min(max(self.n_candidates, self.n_neighbors), self.fit_X_.shape[0])
+            _, candidate_index = self.tree_.query(self.reduce(X_chunk), k=n_candidates)
+            candidates = self.fit_X_[candidate_index]
+            candidates_mask = self.fit_mask_[candidate_index]
+
+            # exact nan_euclidean distance between each row and its candidates
+            present = ~missing[:, None, :] & ~candidates_mask
+            difference = np.where(present, X_chunk[:, None, :] - np.nan_to_num(candidates), 0)
+            n_present = present.sum(axis=2)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                distances = np.sqrt(n_features / n_present * (difference * difference).sum(axis=2))
+            distances[n_present == 0] = np.inf
+
+            for column in np.flatnonzero(missing.any(axis=0)):
+                rows = np.flatnonzero(missing[:, column])
+                column_distances = np.where(candidates_mask[rows, :, column], np.inf, distances[rows])
+                nearest = np.argpartition(column_distances, self.n_neighbors - 1, axis=1)[:, :self.n_neighbors]
+                enough_donors = np.isfinite(np.take_along_axis(column_distances, nearest, axis=1)).all(axis=1)
+                donor_rows = rows[enough_donors]
+                X_chunk[donor_rows, column] = candidates[donor_rows[:, None], nearest[enough_donors], column].mean(axis=1)
+                for row in rows[~enough_donors]:
+                    X_chunk[row, column] = self.brute_force_value(original_chunk[row], column)
+
+            return X_chunk
+
+        def transform(self, X, y=None):
+            try:
+                X = np.array(X, dtype=np.float64)
+                rows = np.flatnonzero(np.isnan(X).any(axis=1))
+                deadline = time.perf_counter() + self.latency_budget_seconds if self.latency_budget_seconds else None
+                chunks = [rows[start:start + self.chunk_size] for start in range(0, len(rows), self.chunk_size)]
+                with ThreadPoolExecutor(max_workers=max(1, self.n_jobs)) as executor:
+                    imputed_chunks = executor.map(lambda chunk: self.impute_chunk(X[chunk], deadline=deadline), chunks)
+                    for chunk, imputed_chunk in zip(chunks, imputed_chunks):
+                        X[chunk] = imputed_chunk
+
+                if deadline is not None and time.perf_counter() > deadline:
+                    logger.warning(f"FastKNNImputer latency budget exceeded, remaining rows imputed with column medians :: latency_budget_seconds:{self.latency_budget_seconds}")
+                logger.info(f"FastKNNImputer transform successfully :: no_of_rows_imputed:{len(rows)} :: no_of_chunks:{len(chunks)}")
+
+            except Exception as e:
+                logger.error(f"An error occurred during Transform: {e}")
+                raise e
+
+            return X
+
     class HandleNaNValues(BaseEstimator, TransformerMixin):
         """HandleNaNValues:It is custom Transformer used for handle nan values
         """
-        def __init__(self, config: PreprocessorConfig):
+        def __init__(self, config: PreprocessorConfig, column_profiler=None):
             self.columns_to_drop = []
-            self.knn_imputer = KNNImputer(n_neighbors=5, weights='uniform')
             self.config = config 
+            if getattr(config, 'knn_imputer_backend', 'sklearn') == 'fast':
+                self.knn_imputer = Preprocessor.FastKNNImputer(n_neighbors=config.knn_imputer_n_neighbors,
+                                                               n_components=config.fast_knn_n_components,
+                                                               n_candidates=config.fast_knn_n_candidates,
+                                                               chunk_size=config.fast_knn_chunk_size,
+                                                               n_jobs=config.fast_knn_n_jobs,
+                                                               latency_budget_seconds=config.fast_knn_latency_budget_seconds,
+                                                               validation_sample_size=config.fast_knn_validation_sample_size,
+                                                               tolerance=config.fast_knn_tolerance)
+            else:
+                self.knn_imputer = KNNImputer(n_neighbors=getattr(config, 'knn_imputer_n_neighbors', 5), weights='uniform')
+            self.column_profiler = column_profiler
 
         def fit(self, X, y=None):
             try:
                 # Determine which columns to drop based on training data
-                self.columns_to_drop = X.columns[X.isnull().mean() * 100 > 50].tolist()
-                self.nan_imputed_columns = X.columns[X.isnull().mean() * 100 < 50].tolist()
+                if self.column_profiler is not None:
+                    null_percentage = self.column_profiler.get_profile(X, statistics=("null_ratio",))["null_ratio"] * 100
+                else:
+                    null_percentage = X.isnull().mean() * 100
+                self.columns_to_drop = X.columns[null_percentage > 50].tolist()
+                self.nan_imputed_columns = X.columns[null_percentage < 50].tolist()
                 preprocessing_results['hight_nan_columns_dropped'] = int(len(self.columns_to_drop))
                 preprocessing_results['Nan_imputed_columns'] = int(len(self.nan_imputed_columns))
                 
@@ -188,8 +498,15 @@ class Preprocessor:
                 X_to_impute = X.drop(columns=self.columns_to_drop, errors='ignore')
 
                 X_to_impute = X_to_impute.drop(columns=[self.config.target_feature])
+                self.imputed_columns = X_to_impute.columns.tolist()
+                if self.column_profiler is not None:
+                    # only columns having NaN are changed by imputation
+                    self.column_profiler.mark_changed([column for column in self.imputed_columns if null_percentage[column] > 0])
                 # Fit the KNN imputer on the remaining data
                 self.knn_imputer.fit(X_to_impute)
+                if isinstance(self.knn_imputer, Preprocessor.FastKNNImputer) and self.knn_imputer.validation_max_abs_error_ > self.knn_imputer.tolerance:
+                    logger.warning(f"handle nan values FastKNNImputer not matched KNNImputer, using KNNImputer :: max_abs_error:{self.knn_imputer.validation_max_abs_error_} :: tolerance:{self.knn_imputer.tolerance}")
+                    self.knn_imputer = KNNImputer(n_neighbors=self.knn_imputer.n_neighbors, weights='uniform').fit(X_to_impute)
                 logger.info("handle nan values KNN Imputer fitted successfully.")
             
             except Exception as e:
@@ -207,13 +524,13 @@ class Preprocessor:
                 if self.config.target_feature in X.columns:
                     X_to_impute = X.drop(columns=[self.config.target_feature])
                     imputed_data = self.knn_imputer.transform(X_to_impute)
-                    X_imputed = pd.DataFrame(imputed_data, columns=X_to_impute.columns)
+                    X_imputed = pd.DataFrame(imputed_data, columns=X_to_impute.columns, index=X.index)
                     
                      # Concatenate the target column back to the DataFrame
                     X_imputed[self.config.target_feature] = X[self.config.target_feature].values
                 else:
                     imputed_data = self.knn_imputer.transform(X)
-                    X_imputed = pd.DataFrame(imputed_data, columns=X.columns)
+                    X_imputed = pd.DataFrame(imputed_data, columns=X.columns, index=X.index)
                 
                 logger.info(f"handle nan values imputed using KNN Imputer. total_imputed_columns:{len(self.nan_imputed_columns)} :: columns_list:{self.nan_imputed_columns}")
             
@@ -238,22 +555,34 @@ class Preprocessor:
     class OutlierHandler(BaseEstimator, TransformerMixin):
         """OutlierHandler :It is custom transformer handle outliers
         """
-        def __init__(self,config: PreprocessorConfig):
+        def __init__(self,config: PreprocessorConfig, column_profiler=None):
             self.lower_limits = {}
             self.upper_limits = {}
             self.config = config
-        
+            self.column_profiler = column_profiler
+
+        def __sklearn_is_fitted__(self) -> bool:
+            # fitted attributes have no trailing underscore, sklearn checks last pipeline step with this before transform
+            return bool(self.lower_limits) or getattr(self, 'limit_columns', None) is not None
+
         def fit(self, X, y=None):
             # Calculate the lower and upper limits based on the training data
             try:
-                for column in X.columns:
-                    if column != self.config.target_feature:
-                        lower_bound = X[column].quantile(self.config.lower_percentile)
-                        upper_bound = X[column].quantile(self.config.upper_percentile)
-                        IQR = upper_bound - lower_bound
-                        self.lower_limits[column] = lower_bound - (IQR * self.config.iqr_multiplier)
-                        self.upper_limits[column] = upper_bound + (IQR * self.config.iqr_multiplier)
-                    
+                # percentiles of imputed and power transformed columns are computed again on input of this step
+                if self.column_profiler is not None:
+                    profile = self.column_profiler.get_profile(X, statistics=("percentiles",))
+                else:
+                    profile = compute_column_profile(X, percentiles=[self.config.lower_percentile, self.config.upper_percentile],
+                                                     statistics=("percentiles",))
+                self.limit_columns = [column for column in X.columns if column != self.config.target_feature]
+                lower_bound = profile.loc[self.limit_columns, f"p_{self.config.lower_percentile}"].to_numpy()
+                upper_bound = profile.loc[self.limit_columns, f"p_{self.config.upper_percentile}"].to_numpy()
+                IQR = upper_bound - lower_bound
+                self.lower_limit_array = lower_bound - (IQR * self.config.iqr_multiplier)
+                self.upper_limit_array = upper_bound + (IQR * self.config.iqr_multiplier)
+                self.lower_limits = dict(zip(self.limit_columns, self.lower_limit_array))
+                self.upper_limits = dict(zip(self.limit_columns, self.upper_limit_array))
+
                 logger.info(f"OutlierHandler Fitted successfully ")
                 logger.info(f"Lower_limits:{self.lower_limits}")
                 logger.info(f"Upper_limits:{self.upper_limits}")
@@ -266,19 +595,37 @@ class Preprocessor:
 
         def transform(self, X, y=None):
             try:
-                # Clip the values based on the calculated limits
-                count_clipped_columns = 0  # Counter for how many columns had outliers clipped
-                clipped_columns = []       # List to track clipped column names
-
-                for column in X.columns:
-                    if column != self.config.target_feature:
-                        original_data = X[column].copy()  # Backup original data to compare later
-                        X[column] = X[column].clip(lower=self.lower_limits[column], upper=self.upper_limits[column])
-
-                        # Check if the column had any values clipped
-                        if not original_data.equals(X[column]):
-                            count_clipped_columns += 1
-                            clipped_columns.append(column)
+                # limits arrays are not exist in preprocessor objects saved before, build them from limits dicts
+                if getattr(self, 'limit_columns', None) is None:
+                    self.limit_columns = list(self.lower_limits.keys())
+                    self.lower_limit_array = np.array([self.lower_limits[column] for column in self.limit_columns])
+                    self.upper_limit_array = np.array([self.upper_limits[column] for column in self.limit_columns])
+
+                # Clip the values based on the calculated limits (NaN limit means no limit like Series.clip)
+                columns = [column for column in X.columns if column != self.config.target_feature]
+                limit_position = pd.Index(self.limit_columns).get_indexer(columns)
+                if (limit_position == -1).any():
+                    raise KeyError(f"OutlierHandler limits not fitted for columns:{[column for column, position in zip(columns, limit_position) if position == -1]}")
+                lower_limits = self.lower_limit_array[limit_position]
+                upper_limits = self.upper_limit_array[limit_position]
+                lower_limits = np.where(np.isnan(lower_limits), -np.inf, lower_limits)
+                upper_limits = np.where(np.isnan(upper_limits), np.inf, upper_limits)
+
+                # columns are clipped per dtype with limits cast to column dtype (float32 columns are not upcast)
+                column_dtypes = X[columns].dtypes.to_numpy()
+                clipped_mask = np.zeros(len(columns), dtype=bool)
+                for dtype in pd.unique(column_dtypes):
+                    positions = np.flatnonzero(column_dtypes == dtype)
+                    dtype_columns = [columns[position] for position in positions]
+                    limits_dtype = dtype if np.issubdtype(dtype, np.floating) else np.float64
+                    dtype_lower_limits = lower_limits[positions].astype(limits_dtype)
+                    dtype_upper_limits = upper_limits[positions].astype(limits_dtype)
+                    values = X[dtype_columns].to_numpy()
+                    clipped_mask[positions] = ((values < dtype_lower_limits) | (values > dtype_upper_limits)).any(axis=0)
+                    X[dtype_columns] = np.clip(values, dtype_lower_limits, dtype_upper_limits)
+
+                clipped_columns = [column for column, clipped in zip(columns, clipped_mask) if clipped]
+                count_clipped_columns = len(clipped_columns)
 
                 preprocessing_results["outlier_handled_columns"] = count_clipped_columns
                 # preprocessing_results["clipped_columns"] = clipped_columns  # Optional: Store names of clipped columns
@@ -303,24 +650,92 @@ class Preprocessor:
             
             return transformed_data
     
+    def get_config_keys(self) -> list[str]:
+        """get_config_keys :Used for getting the preprocessor config values as cache key parts (same for every run of same config)
+        """
+        return [f"{name}={getattr(self.config, name)}" for name in self.cache_key_config_names] + [f"cache_files_version={self.cache_files_version}"]
+
+    def load_cached_preprocessing(self, cache:ArtifactCache, fingerprint:str) -> PreprocessorArtifacts | None:
+        """load_cached_preprocessing :Used for restore the fitted preprocessor object, preprocessed data and preprocessing report from cache
+
+        Args:
+            cache (ArtifactCache): preprocessor cache
+            fingerprint (str): input data and config fingerprint
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            PreprocessorArtifacts | None: artifacts if all files are in cache else None
+        """
+        try:
+            file_paths = [self.config.preprocessor_object_path, self.config.preprocessed_data_file_path, self.config.preprocessor_json_file_path]
+            for file_path in file_paths:
+                create_folder_using_file_path(file_path)
+            if not cache.get_entry(key=fingerprint, file_paths=file_paths):
+                return None
+
+            # index of preprocessed data (input rows kept by drop_duplicate_rows) is same as not cached run
+            preprocessed_data = read_intermediate_file(self.config.preprocessed_data_file_path, index=True)
+            preprocessing_results.clear()
+            preprocessing_results.update(read_json(self.config.preprocessor_json_file_path).to_dict())
+            self.save_dashboard_report()
+            logger.info(f"load_cached_preprocessing :: Status:Success :: fingerprint:{fingerprint} :: shape:{preprocessed_data.shape}")
+            return PreprocessorArtifacts(preprocessed_data=preprocessed_data,preprocessed_object_path=self.config.preprocessor_object_path)   # type: ignore
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"load_cached_preprocessing :: Status:Failed :: Error:{error_message}")
+            raise error_message
+
+    def save_dashboard_report(self) -> None:
+        """save_dashboard_report :Used for save the preprocessing results into dashboard data dir,
+        column profile is kept only in preprocessing report (dashboard shows step summaries)
+        """
+        create_folder_using_file_path(self.config.dashboard_preprocessor_json_file_path)
+        save_json(self.config.dashboard_preprocessor_json_file_path,
+                  {name: value for name, value in preprocessing_results.items() if name != 'column_profile'})
+
+    def build_pipeline(self) -> Pipeline:
+        """build_pipeline :Used for create the (not fitted) stage one preprocessing pipeline
+
+        Returns:
+            Pipeline: preprocessing pipeline
+        """
+        # Define the FunctionTransformer for each function
+        drop_unwanted_columns_ = FunctionTransformer(func=self.drop_unwanted_columns)
+        drop_duplicate_rows_ = FunctionTransformer(func=self.drop_duplicate_rows)
+        # column profile is computed once and shared by all steps
+        column_profiler = Preprocessor.ColumnProfiler(config=self.config)
+
+        preprocessing_pipeline = Pipeline(
+            [
+                ("drop_duplicate_rows", drop_duplicate_rows_),
+                ("drop_unwanted_columns", drop_unwanted_columns_),
+                ("column_profile", column_profiler),
+                ("drop_zero_std_columns", Preprocessor.HandleZeroStdColumns(config=self.config, column_profiler=column_profiler)),  
+                ("handle_nan_values", Preprocessor.HandleNaNValues(config=self.config, column_profiler=column_profiler)),           
+                ("handle_high_skew_columns", Preprocessor.HandleHighSkewColumns(config=self.config, column_profiler=column_profiler)),
+                ("handle_outlier", Preprocessor.OutlierHandler(config=self.config, column_profiler=column_profiler))
+            ]
+        )
+        return preprocessing_pipeline
+
     def initialize_preprocessing(self):
         try:
             logger.info("started the initialize_preprocessing process!")
-            # Define the FunctionTransformer for each function
-            drop_unwanted_columns_ = FunctionTransformer(func=self.drop_unwanted_columns)
-            drop_duplicate_rows_ = FunctionTransformer(func=self.drop_duplicate_rows)
-
-            preprocessing_pipeline = Pipeline(
-                [
-                    ("drop_duplicate_rows", drop_duplicate_rows_),
-                    ("drop_unwanted_columns", drop_unwanted_columns_),
-                    ("drop_zero_std_columns", Preprocessor.HandleZeroStdColumns(config=self.config)),  
-                    ("handle_nan_values", Preprocessor.HandleNaNValues(config=self.config)),           
-                    ("handle_high_skew_columns", Preprocessor.HandleHighSkewColumns(config=self.config)),
-                    ("handle_outlier", Preprocessor.OutlierHandler(config=self.config))
-                ]
-            )
-            
+
+            # identical input data and config reuses previously fitted preprocessor
+            use_cache = self.config.preprocessor_cache_max_size_mb > 0
+            if use_cache:
+                preprocessor_cache = ArtifactCache(cache_folder_path=self.config.preprocessor_cache_folder_path,
+                                                   max_size_mb=self.config.preprocessor_cache_max_size_mb)
+                fingerprint = ArtifactCache.fingerprint_dataframe(df=self.input_input_file, extra_keys=self.get_config_keys())
+                result = self.load_cached_preprocessing(cache=preprocessor_cache, fingerprint=fingerprint)
+                if result is not None:
+                    logger.info(f"initialize_preprocessing :: Status:Preprocessor taken from cache :: fingerprint:{fingerprint}")
+                    return result
+            preprocessing_pipeline = self.build_pipeline()
             preprocessed_data = preprocessing_pipeline.fit_transform(self.input_input_file)
             
             # storing the preprocessing object
@@ -334,9 +749,15 @@ class Preprocessor:
             logger.info('initialize_preprocessing :: create folder for preprocessing json file if not exist')
             create_folder_using_file_path(self.config.preprocessor_json_file_path)
             save_json(self.config.preprocessor_json_file_path,preprocessing_results)
-            #copy file to data dir
-            copy_file(src_file_path=self.config.preprocessor_json_file_path,
-                      dst_folder_path=self.config.dashboard_preprocessor_json_file_path)
+            #save dashboard copy to data dir
+            self.save_dashboard_report()
+
+            if use_cache:
+                create_folder_using_file_path(self.config.preprocessed_data_file_path)
+                save_intermediate_file(df=preprocessed_data,file_path=self.config.preprocessed_data_file_path,index=True)
+                preprocessor_cache.put_entry(key=fingerprint, file_paths=[self.config.preprocessor_object_path,
+                                                                         self.config.preprocessed_data_file_path,
+                                                                         self.config.preprocessor_json_file_path])
             
             logger.info("Ended the initialize_preprocessing process!")
             return result
@@ -1,5 +1,6 @@
 import pandas as pd
 import sys,os
+from pathlib import Path
 from src.exception import SensorFaultException
 from src.logger import logger
 from src.entity.config_entity import ModelTrainerConfig,ClusterConfig,PreprocessorConfig,ModelTunerConfig,ModelEvaluationConfig
@@ -10,7 +11,8 @@ from src.utilities.utils import (save_models_data,proper_conversion_for_excel_fi
                                  save_json,
                                  save_obj,
                                  copy_file,
-                                 create_folder_using_file_path)    
+                                 create_folder_using_file_path,
+                                 save_intermediate_file)    
 
 class ModelTrainer:
     def __init__(self,config:ModelTrainerConfig,input_file:pd.DataFrame,modeltunerconfig:ModelTunerConfig,model_evolution_config:ModelEvaluationConfig):
@@ -39,8 +41,8 @@ class ModelTrainer:
                 cluster_data = dataset[dataset[ClusterConfig.cluster_column_name]==cluster]
                 
                 # save the cluster data
-                cluster_dataset_path = os.path.join(self.config.cluster_dataset_path ,f"cluster_{cluster}.csv" )
-                cluster_data.to_csv(cluster_dataset_path)                
+                cluster_dataset_path = os.path.join(self.config.cluster_dataset_path ,f"cluster_{cluster}.{self.config.cluster_dataset_file_format}" )
+                save_intermediate_file(df=cluster_data,file_path=Path(cluster_dataset_path),index=True)
                 
                 X = cluster_data.drop(columns=[ClusterConfig.cluster_column_name,PreprocessorConfig.target_feature])
                 y = cluster_data[PreprocessorConfig.target_feature]
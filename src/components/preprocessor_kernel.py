@@ -0,0 +1,247 @@
+import sys
+import warnings
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from src.logger import logger
+from src.exception import SensorFaultException
+
+
+def yeo_johnson(values:np.ndarray, lambdas:np.ndarray) -> np.ndarray:
+    """yeo_johnson :Used for apply yeo-johnson power transform with fitted lambdas (same as PowerTransformer.transform without standardize)
+
+    Args:
+        values (np.ndarray): values of columns (rows x columns)
+        lambdas (np.ndarray): lambda of each column
+
+    Returns:
+        np.ndarray: transformed values
+    """
+    lambdas = np.broadcast_to(lambdas, values.shape)
+    eps = np.spacing(1.0)
+    positive = values >= 0
+    positive_log = np.abs(lambdas) < eps
+    negative_log = np.abs(lambdas - 2) > eps
+    with np.errstate(all='ignore'):
+        positive_values = np.where(positive_log, np.log1p(np.where(positive, values, 0)),
+                                   (np.power(np.where(positive, values, 0) + 1, lambdas) - 1) / np.where(positive_log, 1, lambdas))
+        negative_values = np.where(negative_log,
+                                   -(np.power(-np.where(positive, 0, values) + 1, 2 - lambdas) - 1) / np.where(negative_log, 2 - lambdas, 1),
+                                   -np.log1p(-np.where(positive, 0, values)))
+    return np.where(positive, positive_values, negative_values)
+
+
+class PreprocessorKernel:
+    """PreprocessorKernel :Compiled form of fitted stage one preprocessing pipeline, runs imputation, power transform
+    and outlier clipping on single float array using column index arrays instead of dataframe for every step
+    """
+    def __init__(self,pipeline:Pipeline,drop_duplicate_rows,feature_columns:list,target_feature:str,imputer,
+                 skew_positions:np.ndarray,skew_lambdas:np.ndarray,skew_mean:np.ndarray | None,skew_scale:np.ndarray | None,
+                 clip_positions:np.ndarray,clip_lower:np.ndarray,clip_upper:np.ndarray):
+        self.pipeline = pipeline
+        self.drop_duplicate_rows = drop_duplicate_rows
+        self.feature_columns = feature_columns
+        self.target_feature = target_feature
+        self.imputer = imputer
+        self.skew_positions = skew_positions
+        self.skew_lambdas = skew_lambdas
+        self.skew_mean = skew_mean
+        self.skew_scale = skew_scale
+        self.clip_positions = clip_positions
+        self.clip_lower = clip_lower
+        self.clip_upper = clip_upper
+
+    @classmethod
+    def compile(cls,pipeline:Pipeline) -> "PreprocessorKernel":
+        """compile :Used for compile the fitted stage one preprocessing pipeline into kernel
+
+        Args:
+            pipeline (Pipeline): fitted pipeline of Preprocessor.initialize_preprocessing
+
+        Raises:
+            error_message: Custom Exception (pipeline has step not supported by kernel)
+
+        Returns:
+            PreprocessorKernel: compiled kernel
+        """
+        try:
+            steps = dict(pipeline.steps)
+            # skew_profile and outlier_profile steps exist only in preprocessor objects saved before single column profile
+            supported_steps = {"drop_duplicate_rows", "drop_unwanted_columns", "column_profile", "drop_zero_std_columns",
+                               "handle_nan_values", "skew_profile", "handle_high_skew_columns", "outlier_profile", "handle_outlier"}
+            if set(steps) - supported_steps:
+                raise ValueError(f"pipeline steps not supported by kernel:{sorted(set(steps) - supported_steps)}")
+
+            # columns imputed by nan handler are the features of all next steps (target is appended at end if present)
+            nan_handler = steps["handle_nan_values"]
+            target_feature = nan_handler.config.target_feature
+            feature_columns = getattr(nan_handler, 'imputed_columns', None)
+            if feature_columns is None:
+                feature_columns = list(getattr(nan_handler.knn_imputer, 'feature_names_in_', []))
+            if not feature_columns:
+                raise ValueError("imputed columns of handle_nan_values step not found")
+            feature_position = {column: position for position, column in enumerate(feature_columns)}
+
+            # power transform parameters of skewed columns
+            skew_handler = steps["handle_high_skew_columns"]
+            power_transformation = skew_handler.power_transformation
+            skew_positions = np.array([feature_position[column] for column in skew_handler.skewed_columns], dtype=np.intp)
+            if len(skew_positions):
+                if power_transformation.method != 'yeo-johnson':
+                    raise ValueError(f"power transform method not supported by kernel:{power_transformation.method}")
+                skew_lambdas = power_transformation.lambdas_
+                skew_mean, skew_scale = None, None
+                if power_transformation.standardize:
+                    # standardization parameters stored by HandleHighSkewColumns fit (preprocessor objects saved before don't have them)
+                    skew_mean = getattr(skew_handler, 'standardize_mean', None)
+                    skew_scale = getattr(skew_handler, 'standardize_scale', None)
+                    if skew_mean is None or skew_scale is None:
+                        raise ValueError("standardization parameters of handle_high_skew_columns step not found")
+            else:
+                skew_lambdas, skew_mean, skew_scale = np.array([]), None, None
+
+            # outlier clip bounds (NaN bound means no bound like Series.clip)
+            outlier_handler = steps["handle_outlier"]
+            limit_columns = [column for column in outlier_handler.lower_limits if column in feature_position]
+            clip_positions = np.array([feature_position[column] for column in limit_columns], dtype=np.intp)
+            clip_lower = np.array([outlier_handler.lower_limits[column] for column in limit_columns], dtype=np.float64)
+            clip_upper = np.array([outlier_handler.upper_limits[column] for column in limit_columns], dtype=np.float64)
+            clip_lower[np.isnan(clip_lower)] = -np.inf
+            clip_upper[np.isnan(clip_upper)] = np.inf
+
+            kernel = cls(pipeline=pipeline,
+                         drop_duplicate_rows=steps.get("drop_duplicate_rows"),
+                         feature_columns=feature_columns,
+                         target_feature=target_feature,
+                         imputer=nan_handler.knn_imputer,
+                         skew_positions=skew_positions,
+                         skew_lambdas=skew_lambdas,
+                         skew_mean=skew_mean,
+                         skew_scale=skew_scale,
+                         clip_positions=clip_positions,
+                         clip_lower=clip_lower,
+                         clip_upper=clip_upper)
+            logger.info(f"PreprocessorKernel compile :: Status:Success :: no_of_features:{len(feature_columns)} :: no_of_skew_columns:{len(skew_positions)} :: no_of_clip_columns:{len(clip_positions)}")
+            return kernel
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"PreprocessorKernel compile :: Status:Failed :: Error:{error_message}")
+            raise error_message
+
+    def power_transform(self,values:np.ndarray) -> np.ndarray:
+        """power_transform :Used for apply fitted power transform (yeo-johnson and standardize) on skewed columns block
+        """
+        transformed = yeo_johnson(values, self.skew_lambdas)
+        if self.skew_mean is not None:
+            transformed = (transformed - self.skew_mean) / self.skew_scale
+        return transformed
+
+    def transform_array(self,values:np.ndarray) -> np.ndarray:
+        """transform_array :Used for run the imputation, power transform and clip steps in place on feature array
+
+        Args:
+            values (np.ndarray): float array of feature_columns
+
+        Returns:
+            np.ndarray: transformed feature array
+        """
+        # only rows having NaN are sent to imputer
+        nan_rows = np.flatnonzero(np.isnan(values).any(axis=1))
+        if len(nan_rows):
+            with warnings.catch_warnings():
+                # imputer is fitted with dataframe, kernel passes array of same columns
+                warnings.filterwarnings("ignore", message="X does not have valid feature names")
+                imputed_rows = np.asarray(self.imputer.transform(values[nan_rows]), dtype=np.float64)
+            if imputed_rows.shape[1] != values.shape[1]:
+                raise ValueError(f"imputer output columns:{imputed_rows.shape[1]} not match features:{values.shape[1]}")
+            values[nan_rows] = imputed_rows
+
+        if len(self.skew_positions):
+            values[:, self.skew_positions] = self.power_transform(values[:, self.skew_positions])
+
+        if len(self.clip_positions):
+            values[:, self.clip_positions] = np.clip(values[:, self.clip_positions], self.clip_lower, self.clip_upper)
+
+        return values
+
+    def transform(self,X:pd.DataFrame) -> pd.DataFrame:
+        """transform :Used for preprocess the input data same as pipeline.transform
+
+        Args:
+            X (pd.DataFrame): input data (ingested prediction data)
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            pd.DataFrame: preprocessed data
+        """
+        try:
+            # duplicate rows step also saves the non duplicate data used for wafer names
+            if self.drop_duplicate_rows is not None:
+                X = self.drop_duplicate_rows.transform(X)
+
+            values = self.transform_array(X[self.feature_columns].to_numpy(dtype=np.float64))
+            # input index is kept, rows can be matched with input rows (wafer names)
+            preprocessed_data = pd.DataFrame(values, columns=self.feature_columns, index=X.index)
+            if self.target_feature in X.columns:
+                preprocessed_data[self.target_feature] = X[self.target_feature].to_numpy()
+
+            logger.info(f"PreprocessorKernel transform :: Status:Success :: shape:{preprocessed_data.shape}")
+            return preprocessed_data
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"PreprocessorKernel transform :: Status:Failed :: Error:{error_message}")
+            raise error_message
+
+    def verify(self,X:pd.DataFrame,tolerance:float) -> bool:
+        """verify :Used for compare kernel output with pipeline output on sample rows (duplicate rows step is skipped)
+
+        Args:
+            X (pd.DataFrame): sample input data
+            tolerance (float): maximum absolute difference allowed
+
+        Returns:
+            bool: True if outputs match
+        """
+        try:
+            remaining_steps = [name for name, _ in self.pipeline.steps].index("drop_unwanted_columns")
+            expected = self.pipeline[remaining_steps:].transform(X.copy())
+            actual = pd.DataFrame(self.transform_array(X[self.feature_columns].to_numpy(dtype=np.float64)), columns=self.feature_columns)
+            max_abs_error = float(np.nanmax(np.abs(expected[self.feature_columns].to_numpy(dtype=np.float64) - actual.to_numpy())))
+            status = list(expected.columns.drop(self.target_feature, errors='ignore')) == self.feature_columns and max_abs_error <= tolerance
+            logger.info(f"PreprocessorKernel verify :: Status:{'Matched' if status else 'Not Matched'} :: no_of_rows:{len(X)} :: max_abs_error:{max_abs_error}")
+            return status
+
+        except Exception as e:
+            logger.warning(f"PreprocessorKernel verify :: Status:Failed :: Error:{e}")
+            return False
+
+
+def load_preprocessor_kernel(pipeline:Pipeline,sample_data:pd.DataFrame,verify_sample_size:int,tolerance:float):
+    """load_preprocessor_kernel :Used for compile the fitted pipeline into kernel and verify it on sample rows,
+    pipeline itself is returned when pipeline cannot be compiled or kernel output not match pipeline output
+
+    Args:
+        pipeline (Pipeline): fitted stage one preprocessing pipeline
+        sample_data (pd.DataFrame): input data used for verification
+        verify_sample_size (int): no of sample rows (0 skips verification)
+        tolerance (float): maximum absolute difference allowed
+
+    Returns:
+        PreprocessorKernel | Pipeline: object with transform method
+    """
+    try:
+        kernel = PreprocessorKernel.compile(pipeline)
+    except Exception as e:
+        logger.warning(f"load_preprocessor_kernel :: Status:Using pipeline :: Reason:compile failed :: Error:{e}")
+        return pipeline
+
+    if verify_sample_size and not kernel.verify(sample_data.head(verify_sample_size), tolerance=tolerance):
+        logger.warning("load_preprocessor_kernel :: Status:Using pipeline :: Reason:kernel output not match pipeline output")
+        return pipeline
+
+    logger.info(f"load_preprocessor_kernel :: Status:Using kernel :: verify_sample_size:{verify_sample_size}")
+    return kernel
@@ -6,7 +6,9 @@ from src.logger import logger
 from src.exception import SensorFaultException
 from src.entity.artifact_entity import RawDataValidationArtifacts,RawDataTransformationArtifacts
 from src.entity.config_entity import TrainingRawDataTransformationConfig,PredictionRawDataTransformationConfig
-from src.utilities.utils import read_csv_file,create_folder_using_file_path
+from src.utilities.artifact_cache import ArtifactCache
+from src.utilities.utils import (read_csv_files,create_folder_using_file_path,get_file_names_from_manifest,
+                                 get_schema_dtypes)
 
 
 
@@ -16,6 +18,38 @@ class RawDataTransformation:
         self.rawdata_validation_artifacts_= rawdata_validation_artifacts
         self.raw_data_folder = self.rawdata_validation_artifacts_.good_raw_data_folder
         self.merge_file_path = self.config.merge_file_path
+        self.validation_manifest_file_path = self.rawdata_validation_artifacts_.validation_manifest_file_path
+        # dtype map of raw columns and renamed columns (also used for reading the final file)
+        self.schema_dtypes = get_schema_dtypes(schema_file_path=self.config.schema_file_path,
+                                               downcast_float=self.config.downcast_float,
+                                               column_renames={self.config.old_wafer_column_name:self.config.new_wafer_column_name,
+                                                               self.config.old_output_column_name:self.config.new_output_column_name})
+        self.merged_dataset_cache = ArtifactCache(cache_folder_path=self.config.merged_dataset_cache_folder_path,
+                                                  max_size_mb=self.config.merged_dataset_cache_max_size_mb)
+    
+    def get_good_raw_file_names(self,input_folder:Path) -> list[str]:
+        """get_good_raw_file_names :Used for getting the good raw file names from validation manifest (listing the folder if manifest not available)
+
+        Args:
+            input_folder (Path): good raw folder path
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            list[str]: good raw file names
+        """
+        try:
+            if self.validation_manifest_file_path is not None and os.path.exists(self.validation_manifest_file_path):
+                file_names = get_file_names_from_manifest(manifest_file_path=self.validation_manifest_file_path,status="Passed")
+            else:
+                file_names = sorted(os.listdir(input_folder))
+            logger.info(msg=f"get_good_raw_file_names :: Status:Success :: no_of_files:{len(file_names)}")
+            return file_names
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"get_good_raw_file_names :: Status:Failed :: Error:{error_message}")
+            raise error_message
     
     def convert_good_raw_into_single_file(self,input_folder:Path) -> pd.DataFrame:
         """convert_good_raw_into_single_file :Used for convert good raw files into single 
@@ -30,15 +64,9 @@ class RawDataTransformation:
             pd.DataFrame: merge_df
         """
         try:
-            csv_list = []
-            
-            
-            # Iterate over all files in the input directory
-            for filename in os.listdir(input_folder):
-                if filename.endswith(".csv"): 
-                    file_path = Path(os.path.join(input_folder, filename))
-                    df = read_csv_file(file_path=file_path)
-                    csv_list.append(df) 
+            # parse all good raw files on thread pool (frames are in file order)
+            file_paths = [Path(os.path.join(input_folder, filename)) for filename in self.get_good_raw_file_names(input_folder) if filename.endswith(".csv")]
+            csv_list = read_csv_files(file_paths=file_paths,schema_dtypes=self.schema_dtypes,n_threads=self.config.csv_read_n_threads)
 
             # Concatenate all dataframes in the list into a single dataframe
             merged_df = pd.concat(csv_list, ignore_index=True)
@@ -76,15 +104,17 @@ class RawDataTransformation:
             raise error_message
                 
     
-    def rename_column_names(self,merge_df:pd.DataFrame,output_file:Path) -> None:
-        """rename_column_names :Used for rename the column 
+    def rename_columns(self,merge_df:pd.DataFrame) -> pd.DataFrame:
+        """rename_columns :Used for rename the wafer and output columns
 
         Args:
             merge_df (pd.DataFrame): merged_df
-            output_file (Path): outfile_path store into single file
 
         Raises:
             error_message: Custom Exception
+
+        Returns:
+            pd.DataFrame: renamed dataframe
         """
         try:
             
@@ -99,7 +129,25 @@ class RawDataTransformation:
                 columns_data = {self.config.old_output_column_name:self.config.new_output_column_name}
                 merge_df.rename(columns=columns_data,inplace=True)
                 logger.info(msg=f"Rename_column_names :: Status:Success :: Columns data:{columns_data}")    
-                
+            return merge_df
+            
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"Rename_column_names :: Status:Failed :: Error:{error_message}")
+            raise error_message
+    
+    def rename_column_names(self,merge_df:pd.DataFrame,output_file:Path) -> None:
+        """rename_column_names :Used for rename the column 
+
+        Args:
+            merge_df (pd.DataFrame): merged_df
+            output_file (Path): outfile_path store into single file
+
+        Raises:
+            error_message: Custom Exception
+        """
+        try:
+            merge_df = self.rename_columns(merge_df=merge_df)
             
             merge_df.to_csv(output_file, index=False)
             logger.info(f"good raw data merged to single file:: Status: Success :: File_path:{output_file}")
@@ -110,6 +158,46 @@ class RawDataTransformation:
             logger.info(f"good raw data merged to single file:: Status: Failed")
             raise error_message
     
+    def stream_good_raw_into_single_file(self,input_folder:Path,output_file:Path) -> None:
+        """stream_good_raw_into_single_file :Used for append good raw files into single file chunk by chunk,
+        target variable reformat and column renames are applied per chunk (memory bounded by one chunk)
+
+        Args:
+            input_folder (Path): input folder path
+            output_file (Path): outfile_path store into single file
+
+        Raises:
+            error_message: Custom Exception
+        """
+        try:
+            output_columns = None
+            no_of_rows = 0
+            # only float dtypes are forced for chunks (cast of other columns can't be retried in middle of file)
+            float_dtypes = {column: dtype for column, dtype in self.schema_dtypes.items() if dtype.startswith('float')}
+            
+            for filename in self.get_good_raw_file_names(input_folder):
+                if filename.endswith(".csv"):
+                    file_path = Path(os.path.join(input_folder, filename))
+                    for chunk in pd.read_csv(file_path, chunksize=self.config.merge_chunk_size, dtype=float_dtypes):
+                        chunk = self.reformat_target_variable(merge_df=chunk)
+                        chunk = self.rename_columns(merge_df=chunk)
+                        
+                        # first chunk creates the file with header, next chunks are aligned to same column order
+                        if output_columns is None:
+                            output_columns = chunk.columns.to_list()
+                            chunk.to_csv(output_file, index=False, mode='w')
+                        else:
+                            chunk.reindex(columns=output_columns).to_csv(output_file, index=False, mode='a', header=False)
+                        no_of_rows += len(chunk)
+            
+            if output_columns is None:
+                raise ValueError(f"No good raw files found to merge :: input_folder:{input_folder}")
+            logger.info(f"good raw data streamed to single file:: Status: Success :: File_path:{output_file} :: no_of_rows:{no_of_rows}")
+            
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"stream_good_raw_into_single_file :: Status:Failed :: Error:{error_message}")
+            raise error_message
         
     def initialize_data_transformation_process(self) -> RawDataTransformationArtifacts:
         """initialize_data_transformation_process:Used for start the raw data transformation process
@@ -126,11 +214,27 @@ class RawDataTransformation:
             logger.info('crate folder for store transformed input file ')
             create_folder_using_file_path(self.merge_file_path)
             
-            merge_df = self.convert_good_raw_into_single_file(self.raw_data_folder)
-            
-            merge_df = self.reformat_target_variable(merge_df=merge_df)
+            # identical good file set (names + content) reuses the previously merged file
+            use_cache = self.config.merged_dataset_cache_max_size_mb > 0
+            if use_cache:
+                file_paths = [Path(os.path.join(self.raw_data_folder, filename)) for filename in self.get_good_raw_file_names(self.raw_data_folder) if filename.endswith(".csv")]
+                fingerprint = ArtifactCache.fingerprint_files(file_paths=file_paths,
+                                                              extra_keys=[self.config.purpose, str(sorted(self.schema_dtypes.items()))])
             
-            self.rename_column_names(merge_df=merge_df,output_file=self.merge_file_path)
+            if use_cache and self.merged_dataset_cache.get(key=fingerprint,file_path=self.merge_file_path):
+                logger.info(f"initialize_data_transformation_process :: Status:Merged file taken from cache :: fingerprint:{fingerprint}")
+            else:
+                if self.config.streaming_merge:
+                    self.stream_good_raw_into_single_file(input_folder=self.raw_data_folder,output_file=self.merge_file_path)
+                else:
+                    merge_df = self.convert_good_raw_into_single_file(self.raw_data_folder)
+                    
+                    merge_df = self.reformat_target_variable(merge_df=merge_df)
+                    
+                    self.rename_column_names(merge_df=merge_df,output_file=self.merge_file_path)
+                
+                if use_cache:
+                    self.merged_dataset_cache.put(key=fingerprint,file_path=self.merge_file_path)
             
             result = RawDataTransformationArtifacts(final_file_path=self.merge_file_path)
             logger.info(f"started the raw data transformation Ended!: Artifacts:{result}")
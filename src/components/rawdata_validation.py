@@ -1,30 +1,123 @@
-import sys,os,re,shutil
+import sys,os,re,shutil,hashlib,zipfile
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union,Literal
 from src.entity.config_entity import TrainingRawDataValidationConfig, PredictionRawDataValidationConfig
 from pathlib import Path
-from src.utilities.utils import (read_json,read_csv_file,
-                                 append_log_to_excel,
+from src.utilities.utils import (read_json,read_csv_header,
                                  create_folder_using_file_path,
                                  create_folder_using_folder_path,copy_file,
-                                 create_zip_from_folder,
+                                 add_file_to_zip,
                                  save_json,
                                  remove_file,
-                                 save_bad_file_names)
+                                 save_bad_file_names,
+                                 get_local_file_md5)
 from src.logger import logger
+from src.db_management.validation_log_store import ValidationLogStore
 from src.exception import SensorFaultException
 import pandas as pd
+import numpy as np
 from src.entity.artifact_entity import RawDataValidationArtifacts
 
 class RawDataValidation:
+    # compiled schema files shared by all instances (schema json read once per process)
+    compiled_schemas: dict[str, dict] = {}
+    # changed when validation stages or their logs change, cached validation results of old stages are not reused
+    validation_stages_version: int = 3
+    
     def __init__(self,config: Union[TrainingRawDataValidationConfig, PredictionRawDataValidationConfig], folder_path: Path):
         self.data_files_path = folder_path
         self.config = config
-        self.schema_file = read_json(file_path=config.schema_file_path)
+        compiled_schema = RawDataValidation.compile_schema(schema_file_path=config.schema_file_path)
+        self.schema_file = compiled_schema['schema_file']
+        self.schema_dtypes = compiled_schema['schema_dtypes']
+        self.schema_column_names = compiled_schema['column_names']
+        self.schema_column_dtypes = compiled_schema['column_dtypes']
         self.good_raw_data_path = self.config.good_raw_data_folder_path
         self.bad_raw_data_path = self.config.bad_raw_data_folder_path
         self.regex_file_name_format = self.config.raw_file_name_regex_format
+        # validation cache entries are valid only for same schema file, file name format and validation stages
+        self.header_column_names_validation = getattr(self.config, 'header_column_names_validation', True)
+        self.schema_version = hashlib.md5(f"{compiled_schema['schema_md5']}:{self.regex_file_name_format}:{self.validation_stages_version}:{self.header_column_names_validation}".encode()).hexdigest()
         self.validation_report_file_path = self.config.validation_report_file_path
         self.dashboard_validation_report_file_path = self.config.dashboard_validation_report_file_path
+        self.validation_log_store_file_path = self.config.validation_log_store_file_path
+        self.dashboard_validation_log_store_file_path = self.config.dashboard_validation_log_store_file_path
+        self.validation_logs: list[dict] = []
+    
+    @classmethod
+    def compile_schema(cls, schema_file_path:Path) -> dict:
+        """compile_schema :Used for compile the schema json into arrays of expected column names and dtypes, cached at class level
+
+        Args:
+            schema_file_path (Path): schema json file path
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            dict: schema_file, schema_md5, schema_dtypes, column_names, column_dtypes
+        """
+        try:
+            schema_key = str(schema_file_path)
+            if schema_key not in cls.compiled_schemas:
+                schema_file = read_json(file_path=schema_file_path)
+                schema_dtypes = dict(schema_file.ColName)
+                cls.compiled_schemas[schema_key] = {'schema_file': schema_file,
+                                                    'schema_md5': get_local_file_md5(schema_file_path),
+                                                    'schema_dtypes': schema_dtypes,
+                                                    'column_names': np.array(list(schema_dtypes.keys()), dtype=object),
+                                                    'column_dtypes': np.array(list(schema_dtypes.values()), dtype=object)}
+                logger.info(f"compile_schema :: Status:Compiled :: schema_file_path:{schema_file_path}")
+            return cls.compiled_schemas[schema_key]
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
+    
+    def append_validation_log(self, file_name:str, status:str, status_reason:str, remark:str) -> None:
+        """append_validation_log :Used for buffer the validation log in memory, logs are written once into excel by save_validation_logs
+
+        Args:
+            file_name (str): validating file name
+            status (str): validation status
+            status_reason (str): validation name
+            remark (str): any remark related to validation
+        """
+        self.validation_logs.append({'DATE': datetime.now().strftime('%Y-%m-%d'),
+                                     'FILENAME': file_name,
+                                     'STATUS': status,
+                                     'STATUS_REASON': status_reason,
+                                     'REMARK': remark})
+    
+    def save_validation_logs(self) -> None:
+        """save_validation_logs :Used for flush the buffered validation logs into validation log store, styled excel report
+        (written into artifacts folder uploaded with run artifacts), dashboard copies and dashboard summary
+
+        Raises:
+            SensorFaultException: Custom Exception
+        """
+        try:
+            validation_log_store = ValidationLogStore(db_file_path=self.validation_log_store_file_path)
+            validation_log_store.save_logs(validation_logs=self.validation_logs)
+            self.validation_logs = []
+            # excel report is written again from all stored logs (previous report removed, it never looks up to date)
+            remove_file(self.validation_report_file_path)
+            validation_log_store.render_excel(excel_file_path=self.validation_report_file_path)
+            
+            # copy validation log store to data folder for report and precompute the summary
+            logger.info(f"save_validation_logs :: copy the validation log store into data folder for report")
+            create_folder_using_file_path(self.dashboard_validation_log_store_file_path)
+            copy_file(self.validation_log_store_file_path,self.dashboard_validation_log_store_file_path)
+            ValidationLogStore(db_file_path=self.dashboard_validation_log_store_file_path).save_summary(summary_file_path=self.config.dashboard_validation_summary_file_path)
+            
+            # dashboard report copy is newer than dashboard store copy, it is not rendered again on download
+            create_folder_using_file_path(self.dashboard_validation_report_file_path)
+            copy_file(self.validation_report_file_path,self.dashboard_validation_report_file_path)
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
         
     def filename_validation(self,file_name:str) -> Literal['Passed'] | Literal['Failed']:
         """filename_validation: Used for validate the file name format
@@ -45,12 +138,12 @@ class RawDataValidation:
             if re.match(pattern=self.regex_file_name_format,string=file_name):
                 status = "Passed"
                 logger.info(msg=f"file name validation :: Status:{status} :: File:{file_name}")
-                append_log_to_excel(filename=file_name,status=status,status_reason="FILE NAME VALIDATION",remark="FILE NAME VALIDATION COMPLETED",excel_filename=self.validation_report_file_path)
+                self.append_validation_log(file_name=file_name,status=status,status_reason="FILE NAME VALIDATION",remark="FILE NAME VALIDATION COMPLETED")
                 
             else:
                 status = "Failed"
                 logger.info(msg=f"file name validation :: Status:{status} :: File:{file_name}")
-                append_log_to_excel(filename=file_name,status=status,status_reason="FILE NAME VALIDATION",remark="FILE NAME VALIDATION FAILED",excel_filename=self.validation_report_file_path)
+                self.append_validation_log(file_name=file_name,status=status,status_reason="FILE NAME VALIDATION",remark="FILE NAME VALIDATION FAILED")
                     
             return status
         
@@ -58,12 +151,12 @@ class RawDataValidation:
             logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
             raise SensorFaultException(error_message=str(e),error_detail=sys)
             
-    def numberofcolumns_validation(self, file_name:str, dataframe:pd.DataFrame) -> Literal['Passed'] | Literal['Failed']:
+    def numberofcolumns_validation(self, file_name:str, columns:list[str]) -> Literal['Passed'] | Literal['Failed']:
         """numberofcolumns_validation : Used for validate the number of columns in file
 
         Args:
             file_name (str): file_name for log
-            dataframe (DataFrame): dataframe for getting number of columns
+            columns (list[str]): column names from header row of file
 
         Returns:
             -> Literal['Passed'] | Literal['Failed']: return Passed if match the number of columns else returns Failed
@@ -71,18 +164,18 @@ class RawDataValidation:
         try:
             
            # get number of columns in file
-            number_of_column_in_file = dataframe.shape[1]
+            number_of_column_in_file = len(columns)
            
            # check number of columns equal or not
             columns_difference = number_of_column_in_file-self.schema_file.NumberofColumns
             if columns_difference==0: 
                 status = "Passed"
                 logger.info(msg=f"Number of columns validation :: Status:{status} :: File:{file_name}")
-                append_log_to_excel(filename=file_name ,status=status, status_reason="NUMBER OF COLUMNS VALIDATION",remark="NUMBER OF COLUMNS VALIDATION COMPLETED",excel_filename=self.validation_report_file_path)
+                self.append_validation_log(file_name=file_name,status=status,status_reason="NUMBER OF COLUMNS VALIDATION",remark="NUMBER OF COLUMNS VALIDATION COMPLETED")
             else:
                 status = "Failed"
                 logger.info(f"Number of columns validation :: Status:{status} :: File:{file_name} :: columns_difference:{columns_difference}")
-                append_log_to_excel(filename=file_name ,status=status, status_reason="NUMBER OF COLUMNS VALIDATION",remark=f"COLUMN_DIFF BETWEEN DSA FILE AND PREDICTION FILE:{columns_difference}",excel_filename=self.validation_report_file_path)
+                self.append_validation_log(file_name=file_name,status=status,status_reason="NUMBER OF COLUMNS VALIDATION",remark=f"COLUMN_DIFF BETWEEN DSA FILE AND PREDICTION FILE:{columns_difference}")
             
             return status
             
@@ -90,6 +183,66 @@ class RawDataValidation:
             logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
             raise SensorFaultException(error_message=str(e),error_detail=sys)
         
+    def columnnames_validation(self, file_name: str, columns: list[str]) -> Literal['Passed'] | Literal['Failed']:
+        """columnnames_validation : Used for column name validation (column series wise) from header row, no need to parse the file body,
+        failed file is logged as column data validation with same column name mismatch list
+
+        Args:
+            file_name (str): file_name for log
+            columns (list[str]): column names from header row of file
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            Literal['Passed'] | Literal['Failed']: return Passed if column names match with schema file else returns Failed
+        """
+        try:
+            # check column name validation by order wise in DSA
+            raw_file_columns = np.array(columns, dtype=object)
+            name_mismatch = self.schema_column_names != raw_file_columns
+            mismatch_columns_data = [{"schema_file": f"Column_name:{self.schema_column_names[slno]}",
+                                      "raw_file": f"Column_name:{raw_file_columns[slno]}"} for slno in np.flatnonzero(name_mismatch)]
+
+            # passed file gets no log here, column data validation logs it after parsing the body
+            if len(mismatch_columns_data)==0:
+                status = "Passed"
+                logger.info(msg=f"Column name validation :: Status:{status} :: File:{file_name}")
+            else:
+                status = "Failed"
+                logger.info(msg=f"Column name validation :: Status:Failed :: File:{file_name} :: Mismatch column list:{mismatch_columns_data}")
+                self.append_validation_log(
+                    file_name=file_name,
+                    status=status,
+                    status_reason="COLUMN DATA VALIDATION",
+                    remark=f"COLUMN DATA VALIDATION FAILED, MISMATCH COLUMN LIST:{mismatch_columns_data}"
+                )
+            return status
+
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e), error_detail=sys))
+            raise SensorFaultException(error_message=str(e), error_detail=sys)
+
+    def read_raw_file(self, file_path: Path) -> pd.DataFrame:
+        """read_raw_file : Used for parse the body of raw file with inferred dtypes, columnsdata_validation compares
+        inferred dtypes with schema dtypes (parsing with schema dtypes would cast integer valued columns to float and hide the mismatch)
+
+        Args:
+            file_path (Path): raw file path
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            pd.DataFrame: raw dataframe
+        """
+        try:
+            return pd.read_csv(file_path)
+
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e), error_detail=sys))
+            raise SensorFaultException(error_message=str(e), error_detail=sys)
+
     def columnsdata_validation(self, file_name: str, dataframe: pd.DataFrame) -> Literal['Passed'] | Literal['Failed']:
         """columnsdata_validation : Used for Columns data (column name, column type, column series wise) validation
         
@@ -106,48 +259,43 @@ class RawDataValidation:
         try:
             mismatch_columns_data = []
             
-            # get columns 
-            schema_file_columns_data = self.schema_file.ColName  # Keep as a dictionary
-            raw_file_columns_data = dataframe.dtypes.to_dict()   # Keep as a dictionary
-            schema_file_columns = list(schema_file_columns_data.keys())
-            raw_file_columns = list(raw_file_columns_data.keys())
-
-            for slno, column in enumerate(schema_file_columns):
+            # get columns names and dtypes as arrays 
+            raw_file_columns = dataframe.columns.to_numpy(dtype=object)
+            raw_file_dtypes = dataframe.dtypes.astype(str).to_numpy(dtype=object)
+            
+            # check column name validation by order wise in DSA
+            name_mismatch = self.schema_column_names != raw_file_columns
+            # check if schema file column datatype is equal to raw file columns datatype or not
+            dtype_mismatch = ~name_mismatch & (self.schema_column_dtypes != raw_file_dtypes)
+            
+            for slno in np.flatnonzero(name_mismatch | dtype_mismatch):
                 column_data = {}
-                # check column name validation by order wise in DSA
-                if column != raw_file_columns[slno]:
-                    column_data["schema_file"] = f"Column_name:{column}"
+                if name_mismatch[slno]:
+                    column_data["schema_file"] = f"Column_name:{self.schema_column_names[slno]}"
                     column_data["raw_file"] = f"Column_name:{raw_file_columns[slno]}"
-                    mismatch_columns_data.append(column_data)
-                    continue
-                    
-                # check if schema file column datatype is equal to raw file columns datatype or not
-                if schema_file_columns_data[column] != raw_file_columns_data[column]:
-                    column_data["schema_file"] = f"Column_name:{column}, Column_dtype:{schema_file_columns_data[column]}"
-                    column_data["raw_file"] = f"Column_name:{column}, Column_dtype:{raw_file_columns_data[column]}"
-                    mismatch_columns_data.append(column_data)  
-                    continue
+                else:
+                    column_data["schema_file"] = f"Column_name:{raw_file_columns[slno]}, Column_dtype:{self.schema_column_dtypes[slno]}"
+                    column_data["raw_file"] = f"Column_name:{raw_file_columns[slno]}, Column_dtype:{raw_file_dtypes[slno]}"
+                mismatch_columns_data.append(column_data)
             
             # check if there are any mismatched columns
             if len(mismatch_columns_data)==0: 
                 status = "Passed"
                 logger.info(msg=f"Columns data (column name, column type, column series wise) validation :: Status:{status} :: File:{file_name}")
-                append_log_to_excel(
-                    filename=file_name,
+                self.append_validation_log(
+                    file_name=file_name,
                     status=status,
                     status_reason="COLUMN DATA VALIDATION",
-                    remark="COLUMN DATA VALIDATION COMPLETED",
-                    excel_filename=self.validation_report_file_path
+                    remark="COLUMN DATA VALIDATION COMPLETED"
                 )
             else:
                 status = "Failed"
                 logger.info(msg=f"Columns data (column name, column type, column series wise) validation :: Status:Failed :: File:{file_name} :: Mismatch column list:{mismatch_columns_data}")
-                append_log_to_excel(
-                    filename=file_name,
+                self.append_validation_log(
+                    file_name=file_name,
                     status=status,
                     status_reason="COLUMN DATA VALIDATION",
-                    remark=f"COLUMN DATA VALIDATION FAILED, MISMATCH COLUMN LIST:{mismatch_columns_data}",
-                    excel_filename=self.validation_report_file_path
+                    remark=f"COLUMN DATA VALIDATION FAILED, MISMATCH COLUMN LIST:{mismatch_columns_data}"
                 )
             return status
 
@@ -170,30 +318,228 @@ class RawDataValidation:
         """
         try:
             total_columns_data= dataframe.shape[0]
-            mismatch_columns_data = []
             
-            for column in dataframe.columns:
-                column_data = {}
-                # # check entire data of column is missing or not 
-                if total_columns_data-int(dataframe[column].count())==total_columns_data:
-                    column_data["Sensor_Name"]= column
-                    column_data["Column_Data"]=[total_columns_data,int(dataframe[column].count())]
-                    mismatch_columns_data.append(column_data)
+            # check entire data of column is missing or not (non missing count of all columns in single pass)
+            non_missing_counts = dataframe.count()
+            whole_missing_columns = non_missing_counts.index[non_missing_counts.to_numpy()==0]
+            mismatch_columns_data = [{"Sensor_Name": column, "Column_Data": [total_columns_data, 0]} for column in whole_missing_columns]
                     
             if len(mismatch_columns_data)==0: 
                 status = "Passed"
                 logger.info(msg=f"COLUMNDATA_WHOLE_MISSING_VALIDATION :: Status:{status} :: File:{file_name}")
-                append_log_to_excel(filename=file_name,status=status, status_reason="COLUMNDATA_WHOLE_MISSING_VALIDATION",remark="COLUMN DATA WHOLE MISSING VALIDATION COMPLETED",excel_filename=self.validation_report_file_path)
+                self.append_validation_log(file_name=file_name,status=status,status_reason="COLUMNDATA_WHOLE_MISSING_VALIDATION",remark="COLUMN DATA WHOLE MISSING VALIDATION COMPLETED")
             else:
                 status = "Failed"
                 logger.info(msg=f"COLUMNDATA_WHOLE_MISSING_VALIDATION :: Status:Failed :: File:{file_name} :: Mismatch column list:{mismatch_columns_data}")
-                append_log_to_excel(filename=file_name ,status=status, status_reason="COLUMNDATA_WHOLE_MISSING_VALIDATION",remark=f"COLUMN DATA WHOLE MISSING VALIDATION FAILED, MISMATCH COLUMN LIST:{mismatch_columns_data}",excel_filename=self.validation_report_file_path)
+                self.append_validation_log(file_name=file_name,status=status,status_reason="COLUMNDATA_WHOLE_MISSING_VALIDATION",remark=f"COLUMN DATA WHOLE MISSING VALIDATION FAILED, MISMATCH COLUMN LIST:{mismatch_columns_data}")
             return status
         
         except Exception as e:
             logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
             raise SensorFaultException(error_message=e,error_detail=sys)
                      
+    def validate_file(self, file_name:str) -> tuple[str, list[dict]]:
+        """validate_file :Used for run all validations on single raw file, file is not moved here
+
+        Args:
+            file_name (str): raw file name inside data files path
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            tuple[str, list[dict]]: validation status (Passed/Failed), validation logs of the file
+        """
+        try:
+            file_path = Path(os.path.join(self.data_files_path, file_name))
+            logs_start = len(self.validation_logs)
+            
+            # stage 1: file name validation (file is not opened)
+            status = self.filename_validation(file_name=file_name)
+            
+            # stage 2: number of columns and column names validation from header row only
+            if status=="Passed":
+                columns = read_csv_header(file_path=file_path)
+                status = self.numberofcolumns_validation(file_name=file_name,columns=columns)
+            if status=="Passed" and self.header_column_names_validation:
+                status = self.columnnames_validation(file_name=file_name,columns=columns)
+            
+            # stage 3: parse the body only for files passed the header validations
+            if status=="Passed":
+                raw_dataframe = self.read_raw_file(file_path=file_path)
+                status = self.columndata_whole_missing_validation(file_name=file_name,dataframe=raw_dataframe)
+            
+            # Check columns data type validation
+            if status=="Passed":
+                status = self.columnsdata_validation(file_name=file_name,dataframe=raw_dataframe)
+            
+            # hand over the logs of this file to caller (worker process logs can't share the buffer)
+            file_logs = self.validation_logs[logs_start:]
+            del self.validation_logs[logs_start:]
+            return status, file_logs
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
+    
+    def validate_files(self, file_names:list[str]) -> list[tuple[str, list[dict]]]:
+        """validate_files :Used for validate the raw files serially or with pool of worker processes based on validation_n_jobs
+
+        Args:
+            file_names (list[str]): raw file names
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            list[tuple[str, list[dict]]]: (status, validation logs) of each file in the same order of file_names
+        """
+        try:
+            n_jobs = min(self.config.validation_n_jobs, len(file_names))
+            if n_jobs > 1:
+                logger.info(f"validate_files :: Status:Parallel :: n_jobs:{n_jobs} :: no_of_files:{len(file_names)}")
+                chunksize = max(1, len(file_names) // (n_jobs * 4))
+                with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                    # map keeps the input order so the merge is deterministic
+                    results = list(executor.map(self.validate_file, file_names, chunksize=chunksize))
+            else:
+                logger.info(f"validate_files :: Status:Serial :: no_of_files:{len(file_names)}")
+                results = [self.validate_file(file_name) for file_name in file_names]
+            return results
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
+    
+    def load_validation_cache(self) -> dict[str, dict]:
+        """load_validation_cache :Used for load the validation cache entries of previously validated files,
+        cache is discarded when schema file or file name format changed
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            dict[str, dict]: cache entries {file_name:md5 : {status, logs}} ordered from least to most recently used
+        """
+        try:
+            cache_file_path = self.config.validation_cache_file_path
+            if not os.path.exists(cache_file_path):
+                logger.info(f"load_validation_cache :: Status:Cache not exist :: file_path:{cache_file_path}")
+                return {}
+            
+            validation_cache = read_json(file_path=cache_file_path).to_dict()
+            if validation_cache.get('schema_version') != self.schema_version:
+                logger.info(f"load_validation_cache :: Status:Schema changed, cache invalidated :: file_path:{cache_file_path}")
+                return {}
+            
+            logger.info(f"load_validation_cache :: Status:Success :: no_of_entries:{len(validation_cache['entries'])}")
+            return validation_cache['entries']
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
+    
+    def save_validation_cache(self, cache_entries:dict[str, dict]) -> None:
+        """save_validation_cache :Used for save the validation cache, least recently used entries are evicted above validation_cache_max_entries
+
+        Args:
+            cache_entries (dict[str, dict]): cache entries ordered from least to most recently used
+
+        Raises:
+            SensorFaultException: Custom Exception
+        """
+        try:
+            no_of_evicted_entries = max(0, len(cache_entries) - self.config.validation_cache_max_entries)
+            for cache_key in list(cache_entries)[:no_of_evicted_entries]:
+                del cache_entries[cache_key]
+            
+            create_folder_using_file_path(self.config.validation_cache_file_path)
+            save_json(file_path=self.config.validation_cache_file_path,
+                      file_obj={'schema_version': self.schema_version, 'entries': cache_entries})
+            logger.info(f"save_validation_cache :: Status:Success :: no_of_entries:{len(cache_entries)} :: no_of_evicted_entries:{no_of_evicted_entries}")
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
+    
+    def validate_files_with_cache(self, file_names:list[str]) -> list[tuple[str, list[dict]]]:
+        """validate_files_with_cache :Used for validate only the files not seen before (by file name and content hash),
+        verdict and logs of unchanged files are taken from validation cache
+
+        Args:
+            file_names (list[str]): raw file names
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            list[tuple[str, list[dict]]]: (status, validation logs) of each file in the same order of file_names
+        """
+        try:
+            cache_entries = self.load_validation_cache()
+            # files failing the file name format are rejected without opening, only other files are hashed for cache key
+            cache_keys = {file_name: f"{file_name}:{get_local_file_md5(os.path.join(self.data_files_path, file_name))}"
+                          for file_name in file_names if re.match(pattern=self.regex_file_name_format,string=file_name)}
+            
+            # validate the cache missed and file name failed files (serial or parallel)
+            new_file_names = [file_name for file_name in file_names if cache_keys.get(file_name) not in cache_entries]
+            logger.info(f"validate_files_with_cache :: no_of_files:{len(file_names)} :: cache_hits:{len(file_names)-len(new_file_names)}")
+            new_results = dict(zip(new_file_names, self.validate_files(file_names=new_file_names)))
+            
+            results = []
+            for file_name in file_names:
+                cache_key = cache_keys.get(file_name)
+                if file_name in new_results:
+                    status, file_logs = new_results[file_name]
+                    if cache_key is None:
+                        results.append((status, file_logs))
+                        continue
+                    cache_entries[cache_key] = {'status': status,
+                                                'logs': [{column: log[column] for column in ('STATUS','STATUS_REASON','REMARK')} for log in file_logs]}
+                else:
+                    # move the hit entry to most recently used position
+                    cache_entry = cache_entries.pop(cache_key)
+                    cache_entries[cache_key] = cache_entry
+                    status = cache_entry['status']
+                    file_logs = [{'DATE': datetime.now().strftime('%Y-%m-%d'), 'FILENAME': file_name, **log} for log in cache_entry['logs']]
+                    logger.info(msg=f"validate_files_with_cache :: Status:Cache hit :: File:{file_name} :: Validation Status:{status}")
+                results.append((status, file_logs))
+            
+            self.save_validation_cache(cache_entries=cache_entries)
+            return results
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
+    
+    def route_file(self, file_name:str, status:str) -> Path:
+        """route_file :Used for move the validated file into good raw folder or bad raw folder,
+        rename is used (same filesystem) and falls back to move when folders are on different devices
+
+        Args:
+            file_name (str): raw file name
+            status (str): validation status (Passed/Failed)
+
+        Raises:
+            SensorFaultException: Custom Exception
+
+        Returns:
+            Path: destination file path
+        """
+        try:
+            file_path = Path(os.path.join(self.data_files_path, file_name))
+            destination_folder = self.good_raw_data_path if status=="Passed" else self.bad_raw_data_path
+            destination_path = Path(os.path.join(destination_folder, file_name))
+            try:
+                os.replace(file_path, destination_path)
+            except OSError:
+                shutil.move(file_path, destination_path)
+            return destination_path
+        
+        except Exception as e:
+            logger.error(msg=SensorFaultException(error_message=str(e),error_detail=sys))
+            raise SensorFaultException(error_message=str(e),error_detail=sys)
+                     
     def initialize_rawdata_validation_process(self) -> RawDataValidationArtifacts:
         """initialize_rawdata_validation_process :Used for start the raw validation process
 
@@ -201,7 +547,7 @@ class RawDataValidation:
             SensorFaultException: Custom Exception
 
         Returns:
-            RawDataValidationArtifacts: provides good raw folder path, bad raw folder path ,validation_logs.xlsx file path
+            RawDataValidationArtifacts: provides good raw folder path, bad raw folder path ,validation logs store file path
         """
         try:
             logger.info("started the raw data validation process!")
@@ -209,64 +555,56 @@ class RawDataValidation:
             logger.info(f"create folders for storing good raw data,bad raw data,validation report if not exist")
             create_folder_using_folder_path(self.good_raw_data_path)
             create_folder_using_folder_path(self.bad_raw_data_path)
-            create_folder_using_file_path(self.validation_report_file_path)
+            create_folder_using_file_path(self.validation_log_store_file_path)
             
             # remove bad_raw_zip if exists to avoid getting previous data
             remove_file(self.config.dashboard_bad_raw_zip_file_path)
             
             
-            for file in os.listdir(path=self.data_files_path):
-                file_path = Path(os.path.join(self.data_files_path, file))
+            file_names = sorted(os.listdir(path=self.data_files_path))
+            validation_results = self.validate_files_with_cache(file_names=file_names)
             
-                
-                #read raw_data
-                raw_dataframe = read_csv_file(file_path=file_path)
-                if self.filename_validation(file_name=file)=="Failed":
-                    shutil.copy2(src=file_path, dst=self.bad_raw_data_path)
-                    os.remove(file_path)
-                    continue
-
-                # Check number of columns validation
-                if self.numberofcolumns_validation(file_name=file,dataframe=raw_dataframe)=="Failed":
-                    shutil.copy2(src=file_path, dst=self.bad_raw_data_path)
-                    os.remove(file_path)
-                    continue
-                
-                # Check number of columns validation
-                if self.columndata_whole_missing_validation(file_name=file,dataframe=raw_dataframe)=="Failed":
-                    shutil.copy2(src=file_path, dst=self.bad_raw_data_path)
-                    os.remove(file_path)
-                    continue
-                
-                # Check columns name validation
-                if self.columnsdata_validation(file_name=file,dataframe=raw_dataframe)=="Failed":
-                    shutil.copy2(src=file_path, dst=self.bad_raw_data_path)
-                    os.remove(file_path)
-                    continue
-
-                # If all validations pass, move to good_raw_folder
-                shutil.copy2(src=file_path, dst=self.good_raw_data_path)
-                os.remove(file_path)
+            # zip the bad raw data only prediction, rejected files are appended to zip while routing
+            bad_raw_zip = None
+            if self.bad_raw_data_path == PredictionRawDataValidationConfig.bad_raw_data_folder_path:
+                create_folder_using_file_path(self.config.dashboard_bad_raw_zip_file_path)
+                bad_raw_zip = zipfile.ZipFile(self.config.dashboard_bad_raw_zip_file_path, 'w')
+            
+            # merge the verdicts and logs in file order then move files into good or bad raw folder
+            manifest_files = {}
+            try:
+                for file_name, (status, file_logs) in zip(file_names, validation_results):
+                    self.validation_logs.extend(file_logs)
+                    destination_path = self.route_file(file_name=file_name, status=status)
+                    manifest_files[file_name] = {'status': status,
+                                                 'destination': str(destination_path),
+                                                 'reasons': [log['REMARK'] for log in file_logs if log['STATUS']=="Failed"]}
+                    if bad_raw_zip is not None and status=="Failed":
+                        add_file_to_zip(zip_file=bad_raw_zip, file_path=destination_path, arcname=file_name,
+                                        compress_level=self.config.bad_raw_zip_compress_level)
+            finally:
+                if bad_raw_zip is not None:
+                    bad_raw_zip.close()
+            
+            # manifest of routed files, downstream stages read it instead of listing the folders
+            save_json(self.config.validation_manifest_file_path, {'good_raw_data_folder': str(self.good_raw_data_path),
+                                                                  'bad_raw_data_folder': str(self.bad_raw_data_path),
+                                                                  'files': manifest_files})
             
             #for validation report show only default training
             test_data = {"Dashboard":"show_validation_report"}
             save_json(self.config.dashboard_validation_show,test_data)
-            # copy validation report file to data folder 
-            logger.info(f"initialize_rawdata_validation_process :: copy the validation file into data folder for report")
-            create_folder_using_file_path(self.dashboard_validation_report_file_path)
-            copy_file(self.validation_report_file_path,self.dashboard_validation_report_file_path)
-            
-            # zip the bad raw data only prediction
+            # write the validation report and dashboard copy once
+            self.save_validation_logs()
             
-            if self.bad_raw_data_path == PredictionRawDataValidationConfig.bad_raw_data_folder_path:
-                create_folder_using_file_path(self.config.dashboard_bad_raw_zip_file_path)
-                logger.info(f"initialize_rawdata_validation_process :: zip the bad data files for providing")
-                create_zip_from_folder(self.bad_raw_data_path,self.config.dashboard_bad_raw_zip_file_path)
-                save_bad_file_names() # save the bad file names
+            if bad_raw_zip is not None:
+                logger.info(f"initialize_rawdata_validation_process :: bad data files zipped for providing :: zip_file_path:{self.config.dashboard_bad_raw_zip_file_path}")
+                save_bad_file_names(manifest_file_path=self.config.validation_manifest_file_path) # save the bad file names
                 
             result = RawDataValidationArtifacts(good_raw_data_folder=self.good_raw_data_path,
                                                 bad_raw_data_folder=self.bad_raw_data_path,
-                                                validation_log_file_path=self.validation_report_file_path)
+                                                validation_log_file_path=self.validation_log_store_file_path,
+                                                validation_manifest_file_path=self.config.validation_manifest_file_path)
             logger.info(msg=f"started the raw data validation Ended!: Artifacts:{result}")
             return result
                 
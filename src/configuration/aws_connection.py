@@ -1,8 +1,10 @@
 import boto3
 import os
+from botocore.config import Config
 from dotenv import load_dotenv
 from pathlib import Path
 from mypy_boto3_s3 import S3ServiceResource 
+from src.constants import S3_MAX_POOL_CONNECTIONS
 load_dotenv()
 
 
@@ -21,10 +23,12 @@ class S3Client:
             if __secret_access_key is None:
                 raise Exception(f"Environment variable AWS_SECRET_ACCESS_KEY not set")
             
+            # connection pool sized for concurrent downloads (client is thread safe and shared)
             S3Client.s3_client = boto3.client('s3',
                                         aws_access_key_id=__access_key_id,
                                         aws_secret_access_key=__secret_access_key,
-                                        region_name=_region_name
+                                        region_name=_region_name,
+                                        config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
                                         )
             
             S3Client.s3_resource:S3ServiceResource = boto3.resource('s3',
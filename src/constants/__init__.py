@@ -16,6 +16,9 @@ LOG_FILE_NAME:str = f"{datetime.now().strftime('%d_%m_%Y_%H_%M_%S')}.log"
 # LOG_FILE_NAME:str = "logs_file.log"
 
 
+# intermediate files (passed between pipeline stages) format : parquet, feather or csv
+INTERMEDIATE_FILE_FORMAT:str = "parquet"
+
 #data ingestion constants
 FINAL_FILE_TWO_NAME:str = 'final_file_prediction.csv'
 
@@ -31,8 +34,20 @@ BAD_RAW_DATA_FOLDER_NAME: str = "bad_raw_data"
 EVALUATION_DATA_FOLDER_NAME: str  = "evaluation_data"
 TRAINING_VALIDATION_LOG_FILE: str = "training_validation_logs.xlsx"
 PREDICTION_VALIDATION_LOG_FILE: str = "prediction_validation_logs.xlsx"
+TRAINING_VALIDATION_LOG_STORE_FILE: str = "training_validation_logs.db"
+PREDICTION_VALIDATION_LOG_STORE_FILE: str = "prediction_validation_logs.db"
+TRAINING_VALIDATION_SUMMARY_FILE: str = "training_validation_summary.json"
+PREDICTION_VALIDATION_SUMMARY_FILE: str = "prediction_validation_summary.json"
 BAD_RAW_ZIP_FILE_NAME:str = "bad_raw_data.zip"
+BAD_RAW_ZIP_COMPRESS_LEVEL:int = 1 # deflate level for rejected files (1 is fastest)
+ZIP_STORED_FILE_EXTENSIONS:tuple = (".zip", ".gz", ".bz2", ".xz", ".7z", ".rar", ".parquet", ".xlsx", ".png", ".jpg", ".jpeg") # already compressed, added without compression
 BAD_FILE_NAMES_FILE_NAME:str = "bad_file_names.json"
+VALIDATION_MANIFEST_FILE_NAME:str = "validation_manifest.json"
+VALIDATION_N_JOBS:int = 1 # number of worker processes for raw file validation (1 runs serial validation)
+HEADER_COLUMN_NAMES_VALIDATION:bool = True # reject files with column name mismatch from header row before parsing the body
+TRAINING_VALIDATION_CACHE_FILE_NAME:str = "training_validation_cache.json"
+PREDICTION_VALIDATION_CACHE_FILE_NAME:str = "prediction_validation_cache.json"
+VALIDATION_CACHE_MAX_ENTRIES:int = 10000 # least recently used entries are evicted above this limit
 
 # transformation constants
 OLD_WAFER_COLUMN_NAME: str = "Unnamed: 0"
@@ -42,17 +57,43 @@ NEW_OUTPUT_COLUMN_NAME: str = "Output"
 FINAL_TRAINING_FILE_FOLDER_NAME: str = "training_file_data"
 FINAL_PREDICTION_FILE_FOLDER_NAME: str = "prediction_file_data"
 FINAL_FILE_NAME: str = "final_file.csv"
+STREAMING_MERGE:bool = False # append good raw files into final file chunk by chunk (memory bounded by one chunk)
+MERGE_CHUNK_SIZE:int = 50000 # number of rows per chunk in streaming merge
+CSV_READ_N_THREADS:int = 8 # number of threads for reading good raw files in merge
+DOWNCAST_SENSOR_FLOAT:bool = False # read sensor columns as float32 instead of float64 (half memory)
+
+ARTIFACT_CACHE_FOLDER_NAME:str = "artifact_cache"
+MERGED_DATASET_CACHE_FOLDER_NAME:str = "merged_dataset"
+MERGED_DATASET_CACHE_MAX_SIZE_MB:int = 2048 # least recently used merged files are evicted above this size (0 disables the cache)
 
 # preprocessing_constants
 LOWER_PERCENTILE:float = 0.05
 UPPER_PERCENTILE:float = 0.95
 IQR_MULTIPLIER:float = 1.5
+SAVE_NON_DUPLICATE_DATA:bool = False # save the non duplicate data of drop_duplicate_rows step for debugging
+# rows (same wafer and values) predicted in previous runs reuse the stored prediction
+# (only used at prediction, training always fits on the whole training data)
+PREDICTION_ROW_HASH_INDEX_ENABLED:bool = False
+PREDICTION_ROW_HASH_INDEX_FILE_NAME:str = "prediction_row_hash_index.db"
+ROW_HASH_INDEX_MAX_AGE_DAYS:int = 90 # rows older than this are evicted and predicted again
+KNN_IMPUTER_N_NEIGHBORS:int = 5
+KNN_IMPUTER_BACKEND:str = "sklearn" # "sklearn" (brute force KNNImputer) or "fast" (indexed candidate search)
+FAST_KNN_N_COMPONENTS:int = 20 # pca dimensions of neighbor index
+FAST_KNN_N_CANDIDATES:int = 100 # index candidates re-ranked with exact nan_euclidean distance
+FAST_KNN_CHUNK_SIZE:int = 64 # rows imputed per vectorized chunk
+FAST_KNN_N_JOBS:int = 4
+FAST_KNN_LATENCY_BUDGET_SECONDS:float = 0 # rows not imputed within budget are filled with column medians (0 disables)
+FAST_KNN_VALIDATION_SAMPLE_SIZE:int = 50 # held-out training rows compared against KNNImputer after fit (0 disables)
+FAST_KNN_TOLERANCE:float = 1e-6 # KNNImputer is used when max abs difference on validation rows is above this
 EXPERIMENT_FOLDER_NAME:str = "experiment_model_data"
 STABLE_FOLDER_NAME:str = "stable_model_data"
 PREPROCESSOR_FOLDER_NAME:str = "preprocessor_stage_one"
 PREPROCESSOR_OBJECT_NAME:str = "preprocessor_obj.dill"
 PREPROCESSOR_JSON_FILE_NAME:str = "preprocessing_report.json"
-NON_DUPLICATE_DF_NAME :str = "final_non_duplicate_df.csv"
+PREPROCESSED_DATA_FILE_NAME:str = f"preprocessed_data.{INTERMEDIATE_FILE_FORMAT}"
+PREPROCESSOR_CACHE_FOLDER_NAME:str = "preprocessor"
+PREPROCESSOR_CACHE_MAX_SIZE_MB:int = 2048 # least recently used fitted preprocessors are evicted above this size (0 disables the cache)
+NON_DUPLICATE_DF_NAME :str = f"final_non_duplicate_df.{INTERMEDIATE_FILE_FORMAT}"
 
 # cluster constants
 CLUSTER_COLUMN_NAME:str = "Cluster"
@@ -125,6 +166,12 @@ S3_PREDICTION_DATA_FOLDERNAME: str = "predicted_files"
 DEFAULT_TRAINING_BATCH_FILES:str = "training_batch_files"
 LOCAL_PREDICTION_MODELS_FOLDER_NAME: str = "prediction_models"
 ETAG_DATA_JSON_FILE_NAME:str = "etag_data.json"
+S3_MAX_POOL_CONNECTIONS:int = 32 # http connection pool size of boto3 client (shared by download threads)
+S3_DOWNLOAD_MAX_WORKERS:int = 16 # number of concurrent download threads (1 downloads serially)
+S3_DOWNLOAD_MAX_RETRIES:int = 3
+S3_DOWNLOAD_PROGRESS_BATCH_SIZE:int = 50 # download progress is logged after every batch of files
+S3_MIRROR_FOLDER_NAME:str = "s3_mirror" # persistent local copy of synced S3 folders (ETag based incremental sync)
+S3_INCREMENTAL_SYNC:bool = True
 
 # model evolution constants
 DAGSHUB_REPO_OWNER_NAME:str = 'Raveenkumar'
@@ -143,6 +190,9 @@ FEEDBACK_COLUMN_NAME:str = "Feedback"
 CONFIDENCE_COLUMN_NAME:str = "Confidence"
 TARGET_FEATURE_ZERO_MAP:str = 'Working'
 TARGET_FEATURE_ONE_MAP:str = 'NotWorking'
+PREPROCESSOR_KERNEL_ENABLED:bool = False # compile stage one preprocessor pipeline into numpy kernel at prediction
+PREPROCESSOR_KERNEL_VERIFY_SAMPLE_SIZE:int = 20 # rows compared with pipeline output before using kernel (0 disables)
+PREPROCESSOR_KERNEL_TOLERANCE:float = 1e-6
 
 
 
@@ -1,6 +1,8 @@
 import json
 import shutil
-import os,sys
+import os,sys,time
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.logger import logger
 from src.exception import SensorFaultException
 from src.configuration.aws_connection import S3Client
@@ -15,6 +17,8 @@ class SimpleStorageService:
         s3_client = S3Client()
         self.s3_resource = s3_client.s3_resource
         self.s3_client = s3_client.s3_client
+        # prefix listings {prefix: {key: etag}} cached for pipeline run (cleared with clear_listing_cache)
+        self.listing_cache: dict[str, dict[str, str]] = {}
         
     def get_bucket(self,bucket_name:str)-> Bucket:
         """get_bucket :Used for getting the bucket 
@@ -86,6 +90,7 @@ class SimpleStorageService:
             s3_folder_path = format_as_s3_path(path=folder_path)
             if not self.check_s3_subfolder_exists(bucket_obj,s3_folder_path):
                 bucket_obj.put_object(Key=s3_folder_path)    
+                self.invalidate_listing_cache(key=s3_folder_path)
                 logger.info(msg=f"create_s3_subfolder :: Status: Successful :: Bucket_Obj:{bucket_obj} :: folder_path:{folder_path}")
             else:
                 logger.info(msg=f"create_s3_subfolder :: Status: Already Exists :: Bucket_Obj:{bucket_obj} :: folder_path:{folder_path}")   
@@ -172,6 +177,7 @@ class SimpleStorageService:
         """
         try:
             bucket_obj.upload_file(Filename=local_file_path,Key=s3_filepath_path)
+            self.invalidate_listing_cache(key=s3_filepath_path)
             logger.info(msg=f"upload_file_to_s3 :: Status: Successful :: Bucket_Obj:{bucket_obj} :: local_file_path:{local_file_path} :: s3_file_path:{s3_filepath_path} ")
 
         except Exception as e:
@@ -179,13 +185,98 @@ class SimpleStorageService:
             logger.error(msg=f"upload_file_to_s3 execution failed :: Error:{error_message}")
             raise error_message    
     
-    def list_files_in_s3_folder(self,bucket_obj:Bucket, s3_folder_path:str) -> list[str]: 
+    def clear_listing_cache(self) -> None:
+        """clear_listing_cache :Used for clear the cached prefix listings (called at start of pipeline run)
+        """
+        self.listing_cache = {}
+        logger.info(msg=f"clear_listing_cache :: Status: Successful")
+    
+    def invalidate_listing_cache(self, key:str) -> None:
+        """invalidate_listing_cache :Used for remove the cached listings of prefixes containing the key (called after upload/copy/delete of key)
+        
+        Args:
+            key (str): s3 key changed in bucket
+        """
+        for prefix in [prefix for prefix in self.listing_cache if key.startswith(prefix)]:
+            del self.listing_cache[prefix]
+            logger.info(msg=f"invalidate_listing_cache :: Status: Successful :: prefix:{prefix} :: key:{key}")
+    
+    def list_s3_objects(self, bucket_obj:Bucket, prefix:str, use_cache:bool=False) -> dict[str, str]:
+        """
+        list_s3_objects: Lists all files (not folder keys) of S3 prefix with their ETags using paginated list_objects_v2,
+        listing is cached for the pipeline run only when use_cache is True (run-scoped sync path only, other callers always list S3).
+
+        Args:
+            bucket_obj (Bucket): The S3 bucket object.
+            prefix (str): The S3 folder path.
+            use_cache (bool): use the cached listing of prefix if available. Defaults to False.
+
+        Raises:
+            SensorFaultException: Custom exception if listing files fails.
+
+        Returns:
+            dict[str, str]: {file key: etag}
+        """
+        try:
+            if use_cache and prefix in self.listing_cache:
+                logger.info(msg=f"list_s3_objects :: Status: Cached listing :: prefix:{prefix}")
+                return self.listing_cache[prefix]
+            
+            objects = {}
+            paginator = self.s3_client.get_paginator('list_objects_v2')  # type: ignore
+            for page in paginator.paginate(Bucket=bucket_obj.name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    if not obj['Key'].endswith('/'):
+                        objects[obj['Key']] = obj['ETag'].strip('"')
+            if use_cache:
+                self.listing_cache[prefix] = objects
+            logger.info(msg=f"list_s3_objects :: Status: Successful :: prefix:{prefix} :: no_of_files:{len(objects)}")
+            return objects
+        
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"list_s3_objects execution failed :: Error:{error_message}")
+            raise error_message
+    
+    def is_s3_prefix_empty(self, bucket_obj:Bucket, prefix:str, use_cache:bool=False) -> bool:
+        """
+        is_s3_prefix_empty: Checks if S3 prefix has any key other than the folder key itself with single MaxKeys=1 request
+        (answered from cached listing of pipeline run if use_cache is True and prefix is already listed).
+
+        Args:
+            bucket_obj (Bucket): The S3 bucket object.
+            prefix (str): The S3 folder path.
+            use_cache (bool): use the cached listing of pipeline run if available. Defaults to False.
+
+        Raises:
+            SensorFaultException: Custom exception if the check fails.
+
+        Returns:
+            bool: True if the prefix is empty, False otherwise.
+        """
+        try:
+            if use_cache and prefix in self.listing_cache:
+                is_empty = len(self.listing_cache[prefix]) == 0
+            else:
+                # StartAfter skips the folder key (prefix) itself
+                response = self.s3_client.list_objects_v2(Bucket=bucket_obj.name, Prefix=prefix, StartAfter=prefix, MaxKeys=1)  # type: ignore
+                is_empty = response.get('KeyCount', 0) == 0
+            logger.info(f"is_s3_prefix_empty :: Status: Successful :: prefix:{prefix} :: is_empty:{is_empty}")
+            return is_empty
+        
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"is_s3_prefix_empty execution failed :: Error:{error_message}")
+            raise error_message
+    
+    def list_files_in_s3_folder(self,bucket_obj:Bucket, s3_folder_path:str, use_cache:bool=False) -> list[str]: 
         """
         list_files_in_s3_folder: Lists all files in a specified S3 folder.
 
         Args:
             bucket_obj (Bucket): The S3 bucket object.
             s3_folder_path (str): The S3 folder path.
+            use_cache (bool): use the cached listing of pipeline run if available. Defaults to False.
 
         Returns:
             list[str]: A list of file paths within the specified S3 folder.
@@ -194,8 +285,7 @@ class SimpleStorageService:
             SensorFaultException: Custom exception if listing files fails.
         """
         try:
-            files_obj = bucket_obj.objects.filter(Prefix=s3_folder_path)
-            files_path = [file_path.key for file_path in files_obj if not file_path.key.endswith("/")]
+            files_path = list(self.list_s3_objects(bucket_obj=bucket_obj,prefix=s3_folder_path,use_cache=use_cache))
             logger.info(msg=f"list_files_in_s3_folder :: Status: Successful :: Bucket_Obj:{bucket_obj} :: s3_file_path:{s3_folder_path} :: files_path:{files_path} ")
 
             return files_path
@@ -205,32 +295,115 @@ class SimpleStorageService:
             logger.error(msg=f"list_files_in_s3_folder execution failed :: Error:{error_message}")
             raise error_message
     
-    def download_files_from_s3(self, bucket_obj:Bucket, local_folder_path:Path, s3_subfolder_path:str) -> None:
+    def download_files_from_s3(self, bucket_obj:Bucket, local_folder_path:Path, s3_subfolder_path:str,
+                               max_workers:int | None = None,
+                               progress_callback:Callable[[int, int], None] | None = None) -> None:
         """
-        download_files_from_s3: Downloads all files from a specified S3 subfolder to a local folder.
+        download_files_from_s3: Downloads all files from a specified S3 subfolder to a local folder,
+        files are downloaded concurrently on bounded thread pool when max_workers > 1.
 
         Args:
             bucket_obj (Bucket): The S3 bucket object containing the files.
             local_folder_path (Path): The local directory where files will be downloaded.
             s3_subfolder_path (str): The S3 subfolder path containing the files to download.
+            max_workers (int | None): number of download threads. Defaults to None (config download_max_workers).
+            progress_callback (Callable[[int, int], None] | None): called with (no_of_downloaded_files, total_files)
+                after every batch of downloads. Defaults to None (progress is logged).
 
         Raises:
             SensorFaultException: Custom exception if the download process fails.
         """
         try:
             files_path = self.list_files_in_s3_folder(bucket_obj=bucket_obj,s3_folder_path=s3_subfolder_path)
+            self.download_s3_files(bucket_obj=bucket_obj,files_path=files_path,local_folder_path=local_folder_path,
+                                   max_workers=max_workers,progress_callback=progress_callback)
+            logger.info(msg=f"download_files_from_s3 :: Status: Successful :: s3_folder_path:{s3_subfolder_path} :: local_folder_path:{local_folder_path}")
             
-            for file_path in files_path:
-                file_name= os.path.basename(file_path)
-                local_file_path = os.path.join(local_folder_path,file_name)
-                
-                self.download_file_from_s3(bucket_obj=bucket_obj,local_file_path=local_file_path,s3_file_path=file_path)
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"download_files_from_s3 execution failed :: Error:{error_message}")
+            raise error_message
+    
+    def download_s3_files(self, bucket_obj:Bucket, files_path:list[str], local_folder_path:Path,
+                          max_workers:int | None = None,
+                          progress_callback:Callable[[int, int], None] | None = None) -> None:
+        """
+        download_s3_files: Downloads the given S3 files into a local folder (file name is kept) with retries,
+        files are downloaded concurrently on bounded thread pool when max_workers > 1 (serially otherwise).
+
+        Args:
+            bucket_obj (Bucket): The S3 bucket object containing the files.
+            files_path (list[str]): The S3 file paths to download.
+            local_folder_path (Path): The local directory where files will be downloaded.
+            max_workers (int | None): number of download threads. Defaults to None (config download_max_workers).
+            progress_callback (Callable[[int, int], None] | None): called with (no_of_downloaded_files, total_files)
+                after every batch of downloads. Defaults to None (progress is logged).
+
+        Raises:
+            SensorFaultException: Custom exception if the download process fails.
+        """
+        try:
+            max_workers = self.config.download_max_workers if max_workers is None else max_workers
+            max_workers = max(1, min(max_workers, len(files_path)))
+            if progress_callback is None:
+                progress_callback = lambda completed, total: logger.info(msg=f"download_s3_files :: Status: In progress :: downloaded:{completed}/{total} :: local_folder_path:{local_folder_path}")
+            
+            def download_file(file_path:str) -> None:
+                self.download_file_from_s3_with_retries(bucket_name=bucket_obj.name,
+                                                        local_file_path=os.path.join(local_folder_path,os.path.basename(file_path)),
+                                                        s3_file_path=file_path)
+            
+            def report_progress(completed:int) -> None:
+                if completed % self.config.download_progress_batch_size == 0 or completed == len(files_path):
+                    progress_callback(completed, len(files_path))
+            
+            # serial and concurrent downloads share same retries and progress reporting
+            if max_workers == 1:
+                for completed, file_path in enumerate(files_path, start=1):
+                    download_file(file_path)
+                    report_progress(completed)
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(download_file, file_path) for file_path in files_path]
+                    for completed, future in enumerate(as_completed(futures), start=1):
+                        future.result() # raise the download error
+                        report_progress(completed)
                 
-            # logger.info(msg=f"download_files_from_s3 :: Status: Successful :: Bucket_Obj:{bucket_obj} :: s3_folder_path:{s3_subfolder_path} :: local_folder_path:{local_folder_path} ")
+            logger.info(msg=f"download_s3_files :: Status: Successful :: local_folder_path:{local_folder_path} :: no_of_files:{len(files_path)} :: max_workers:{max_workers}")
             
         except Exception as e:
             error_message = SensorFaultException(error_message=str(e),error_detail=sys)
-            logger.error(msg=f"download_files_from_s3 execution failed :: Error:{error_message}")
+            logger.error(msg=f"download_s3_files execution failed :: Error:{error_message}")
+            raise error_message
+    
+    def download_file_from_s3_with_retries(self, bucket_name:str, local_file_path:str, s3_file_path:str) -> None:
+        """
+        download_file_from_s3_with_retries: Downloads a single file from S3 using shared (thread safe) boto3 client,
+        failed download is retried with exponential backoff.
+
+        Args:
+            bucket_name (str): The S3 bucket name.
+            local_file_path (str): The local file path where the downloaded file will be saved.
+            s3_file_path (str): The S3 path of the file to be downloaded.
+
+        Raises:
+            SensorFaultException: Custom exception if the download fails after all retries.
+        """
+        try:
+            for attempt in range(self.config.download_max_retries + 1):
+                try:
+                    self.s3_client.download_file(Bucket=bucket_name, Key=s3_file_path, Filename=local_file_path)  # type: ignore
+                    break
+                except Exception as e:
+                    if attempt == self.config.download_max_retries:
+                        raise e
+                    logger.info(msg=f"download_file_from_s3_with_retries :: Status: Retrying :: attempt:{attempt+1} :: s3_file_path:{s3_file_path} :: Error:{e}")
+                    time.sleep(0.5 * 2**attempt)
+            logger.info(msg=f"download_file_from_s3_with_retries :: Status: Successful :: s3_file_path:{s3_file_path} :: local file path:{local_file_path} ")
+        
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"download_file_from_s3_with_retries execution failed :: s3_file_path:{s3_file_path} :: Error:{error_message}")
             raise error_message
     
     def download_file_from_s3(self, bucket_obj:Bucket, local_file_path:str, s3_file_path:str) -> None:
@@ -269,8 +442,7 @@ class SimpleStorageService:
             SensorFaultException: Custom exception if the folder check process fails.
         """
         try:
-            files_list = [file for file in bucket_object.objects.filter(Prefix=s3_folder_path) if file.key != s3_folder_path]
-            if len(files_list)==0:
+            if self.is_s3_prefix_empty(bucket_obj=bucket_object,prefix=s3_folder_path):
                 logger.info(f"check_s3_folder_empty :: Status: Folder empty :: s3_folder_path:{s3_folder_path}")
                 return True
             else:
@@ -308,6 +480,7 @@ class SimpleStorageService:
                     source_path = obj.key
                     destination_path = source_path.replace(local_models_source_path,target_folder_path,1)
                     self.s3_resource.Object(self.config.bucket_name, destination_path).copy_from(CopySource={'Bucket': self.config.bucket_name, 'Key': source_path})
+                    self.invalidate_listing_cache(key=destination_path)
                     logger.info(f"models_data copied from :{source_path}--->to:{destination_path}") 
                 logger.info(f"store_prediction_models execution :: Status:Success :: source_path:{local_models_source_path} :: destination_path:{target_folder_path}" )    
             else:    
@@ -318,22 +491,20 @@ class SimpleStorageService:
             raise error_message
     
     
-    def get_s3_folder_state(self,bucket_obj:Bucket, prefix: str) -> dict:
+    def get_s3_folder_state(self,bucket_obj:Bucket, prefix: str, use_cache:bool=False) -> dict:
         """Generate a dictionary of S3 file paths and their MD5 (ETag) hashes for a given S3 folder.
 
         Args:
             bucket: The S3 bucket object.
             prefix (str): The S3 folder path to scan.
+            use_cache (bool): use the cached listing of pipeline run. Defaults to False.
 
         Returns:
             dict: A dictionary with S3 file keys as paths and ETag hashes.
         """
         try:
-            folder_state = {}
-            for obj in bucket_obj.objects.filter(Prefix=prefix):
-                if not obj.key.endswith('/'):  # Skip folders, only get files
-                    # Use the S3 object's ETag as an MD5-like hash
-                    folder_state[obj.key] = obj.e_tag.strip('"')
+            # Use the S3 object's ETag as an MD5-like hash (folders are skipped)
+            folder_state = dict(self.list_s3_objects(bucket_obj=bucket_obj, prefix=prefix, use_cache=use_cache))
             logger.info(f"get_s3_folder_state :: Status:Success :: folder_state:{folder_state}")        
             return folder_state
         
@@ -379,6 +550,68 @@ class SimpleStorageService:
             logger.error(msg=f"detect_s3_folder_changes  :: Status:failed :: Error:{error_message}")
             raise error_message
     
+    def sync_s3_folder_to_local(self, bucket_obj:Bucket, s3_folder_path:str, local_folder_path:Path, mirror_folder_path:Path) -> dict:
+        """sync_s3_folder_to_local :Used for incremental sync of S3 folder into local folder based on ETags.
+        files are kept in persistent local mirror (with ETag manifest per S3 folder), only new or changed objects are downloaded,
+        mirror files of removed objects are deleted, and local folder is filled with hard links (copy if not supported) of mirror files.
+
+        Args:
+            bucket_obj (Bucket): The S3 bucket object.
+            s3_folder_path (str): The S3 folder path to sync.
+            local_folder_path (Path): working folder, contains exactly the files of S3 folder after sync.
+            mirror_folder_path (Path): persistent mirror root folder.
+
+        Raises:
+            SensorFaultException: Custom exception if the sync process fails.
+
+        Returns:
+            dict: sync stats (downloaded, removed, unchanged)
+        """
+        try:
+            prefix_mirror_path = Path(mirror_folder_path) / s3_folder_path.strip('/').replace('/', '__')
+            manifest_file_path = prefix_mirror_path / "manifest.json"
+            os.makedirs(prefix_mirror_path, exist_ok=True)
+            os.makedirs(local_folder_path, exist_ok=True)
+            
+            # current state of S3 folder {key: etag} (single listing) and previously synced state
+            current_state = self.get_s3_folder_state(bucket_obj, s3_folder_path, use_cache=True)
+            previous_state = {}
+            if manifest_file_path.exists():
+                with open(manifest_file_path, "r") as f:
+                    previous_state = json.load(f)
+            
+            changed_files = [key for key, etag in current_state.items()
+                             if previous_state.get(key) != etag or not os.path.exists(prefix_mirror_path / os.path.basename(key))]
+            removed_files = [key for key in previous_state if key not in current_state]
+            
+            # remove mirror files of deleted objects and download only new/changed objects
+            for key in removed_files:
+                remove_file(prefix_mirror_path / os.path.basename(key))
+            self.download_s3_files(bucket_obj=bucket_obj, files_path=changed_files, local_folder_path=prefix_mirror_path)
+            with open(manifest_file_path, "w") as f:
+                json.dump(current_state, f, indent=4)
+            
+            # working folder gets exactly the files of S3 folder
+            file_names = {os.path.basename(key) for key in current_state}
+            for file_name in os.listdir(local_folder_path):
+                file_path = os.path.join(local_folder_path, file_name)
+                if os.path.isfile(file_path):
+                    os.remove(file_path)
+            for file_name in file_names:
+                try:
+                    os.link(prefix_mirror_path / file_name, os.path.join(local_folder_path, file_name))
+                except OSError:
+                    shutil.copy2(prefix_mirror_path / file_name, os.path.join(local_folder_path, file_name))
+            
+            sync_stats = {'downloaded': len(changed_files), 'removed': len(removed_files), 'unchanged': len(current_state) - len(changed_files)}
+            logger.info(f"sync_s3_folder_to_local :: Status:Success :: s3_folder_path:{s3_folder_path} :: local_folder_path:{local_folder_path} :: sync_stats:{sync_stats}")
+            return sync_stats
+        
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"sync_s3_folder_to_local  :: Status:failed :: Error:{error_message}")
+            raise error_message
+    
     def get_prediction_models(self,bucket_object:Bucket) -> None:
         """
         get_prediction_models: Downloads the prediction models from S3 if the local MD5 hash does not match the S3 ETag.
@@ -467,6 +700,7 @@ class SimpleStorageService:
         """
         try:
             bucket_object.object_versions.delete()
+            self.clear_listing_cache()
         except Exception as e:
             error_message = SensorFaultException(error_message=str(e),error_detail=sys)
             logger.error(msg=f"clear_bucket  :: Status:failed :: Error:{error_message}")
@@ -491,6 +725,8 @@ class SimpleStorageService:
                 if version.version_id :
                     print(f"Deleting version {version.version_id} for object {version.object_key}")
                     version.delete()
+            # removing delete markers can restore objects, cached listings are not valid
+            self.clear_listing_cache()
             
         except Exception as e:
             error_message = SensorFaultException(error_message=str(e),error_detail=sys)
@@ -0,0 +1,114 @@
+import sys
+import time
+import sqlite3
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.exception import SensorFaultException
+from src.utilities.utils import create_folder_using_file_path
+
+
+class RowHashIndex:
+    def __init__(self,db_file_path:Path,max_age_days:float):
+        """__init__ :Persistent index of predicted rows keyed by row values hash and wafer name with their prediction,
+        rows older than max_age_days are evicted and predicted again
+
+        Args:
+            db_file_path (Path): sqlite file path
+            max_age_days (float): maximum age of indexed rows in days
+        """
+        self.db_file_path = db_file_path
+        self.max_age_seconds = max_age_days * 24 * 60 * 60
+
+    def connect(self) -> sqlite3.Connection:
+        create_folder_using_file_path(self.db_file_path)
+        connection = sqlite3.connect(self.db_file_path)
+        connection.execute("""CREATE TABLE IF NOT EXISTS row_predictions (
+                                  HASH INTEGER, WAFER TEXT, OUTPUT INTEGER, CONFIDENCE REAL, SEEN_AT REAL,
+                                  PRIMARY KEY (HASH, WAFER))""")
+        connection.execute("CREATE INDEX IF NOT EXISTS row_predictions_seen_at ON row_predictions (SEEN_AT)")
+        return connection
+
+    @staticmethod
+    def hash_rows(df:pd.DataFrame,wafer_column:str) -> np.ndarray:
+        """hash_rows :Used for hash the row values (wafer column excluded, wafer is stored separately)
+
+        Args:
+            df (pd.DataFrame): input data with wafer column
+            wafer_column (str): wafer column name
+
+        Returns:
+            np.ndarray: uint64 hash of each row
+        """
+        return pd.util.hash_pandas_object(df.drop(columns=[wafer_column]), index=False).to_numpy()
+
+    @staticmethod
+    def to_sqlite_integers(row_hashes:np.ndarray) -> list[int]:
+        # sqlite integers are signed 64 bit, uint64 hashes are stored with same bits
+        return np.asarray(row_hashes, dtype=np.uint64).view(np.int64).tolist()
+
+    def find_predictions(self,row_hashes:np.ndarray,wafers:list[str]) -> pd.DataFrame:
+        """find_predictions :Used for find the stored prediction of rows already in index (expired rows are evicted first)
+
+        Args:
+            row_hashes (np.ndarray): uint64 hash of row values
+            wafers (list[str]): wafer names of rows
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            pd.DataFrame: OUTPUT and CONFIDENCE of seen rows, indexed by position of row in input
+        """
+        try:
+            with self.connect() as connection:
+                self.evict(connection)
+                connection.execute("CREATE TEMP TABLE query_rows (POSITION INTEGER, HASH INTEGER, WAFER TEXT)")
+                connection.executemany("INSERT INTO query_rows VALUES (?, ?, ?)",
+                                       zip(range(len(wafers)), self.to_sqlite_integers(row_hashes), wafers))
+                predictions = pd.read_sql_query("""SELECT query_rows.POSITION, row_predictions.OUTPUT, row_predictions.CONFIDENCE
+                                                   FROM query_rows JOIN row_predictions
+                                                   ON row_predictions.HASH = query_rows.HASH AND row_predictions.WAFER = query_rows.WAFER""",
+                                                connection, index_col="POSITION")
+            connection.close()
+            logger.info(f"RowHashIndex find_predictions :: Status:Success :: db_file_path:{self.db_file_path} :: no_of_rows:{len(wafers)} :: no_of_seen_rows:{len(predictions)}")
+            return predictions
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"RowHashIndex find_predictions :: Status:Failed :: db_file_path:{self.db_file_path} :: Error:{error_message}")
+            raise error_message
+
+    def add(self,row_hashes:np.ndarray,wafers:list[str],outputs:list[int],confidences:list[float]) -> None:
+        """add :Used for add the predicted rows into index (seen time of already indexed rows is not changed)
+
+        Args:
+            row_hashes (np.ndarray): uint64 hash of row values
+            wafers (list[str]): wafer names of rows
+            outputs (list[int]): predicted output of rows
+            confidences (list[float]): prediction confidence of rows
+
+        Raises:
+            error_message: Custom Exception
+        """
+        try:
+            seen_at = time.time()
+            with self.connect() as connection:
+                connection.executemany("INSERT OR IGNORE INTO row_predictions (HASH, WAFER, OUTPUT, CONFIDENCE, SEEN_AT) VALUES (?, ?, ?, ?, ?)",
+                                       ((row_hash, wafer, int(output), float(confidence), seen_at)
+                                        for row_hash, wafer, output, confidence in zip(self.to_sqlite_integers(row_hashes), wafers, outputs, confidences)))
+            connection.close()
+            logger.info(f"RowHashIndex add :: Status:Success :: db_file_path:{self.db_file_path} :: no_of_rows:{len(wafers)}")
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"RowHashIndex add :: Status:Failed :: db_file_path:{self.db_file_path} :: Error:{error_message}")
+            raise error_message
+
+    def evict(self,connection:sqlite3.Connection) -> None:
+        """evict :Used for remove the rows older than max age from index
+        """
+        cursor = connection.execute("DELETE FROM row_predictions WHERE SEEN_AT < ?", (time.time() - self.max_age_seconds,))
+        if cursor.rowcount:
+            logger.info(f"RowHashIndex evict :: Status:Evicted :: db_file_path:{self.db_file_path} :: no_of_rows:{cursor.rowcount}")
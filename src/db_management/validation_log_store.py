@@ -0,0 +1,158 @@
+import os,sys
+import sqlite3
+from collections import Counter
+from pathlib import Path
+import pandas as pd
+from src.logger import logger
+from src.exception import SensorFaultException
+from src.utilities.utils import (create_folder_using_file_path,
+                                 save_json,
+                                 read_json,
+                                 remove_file,
+                                 save_validation_logs_to_excel)
+
+
+class ValidationLogStore:
+    columns = ['DATE','FILENAME','STATUS','STATUS_REASON','REMARK']
+
+    def __init__(self,db_file_path:Path):
+        self.db_file_path = db_file_path
+
+    def save_logs(self,validation_logs:list[dict]) -> None:
+        """save_logs :Used for append the validation logs into sqlite store in single transaction
+
+        Args:
+            validation_logs (list[dict]): validation log rows (DATE, FILENAME, STATUS, STATUS_REASON, REMARK)
+
+        Raises:
+            error_message: Custom Exception
+        """
+        try:
+            create_folder_using_file_path(self.db_file_path)
+            with sqlite3.connect(self.db_file_path) as connection:
+                connection.execute("""CREATE TABLE IF NOT EXISTS validation_logs (
+                                          SLNO INTEGER PRIMARY KEY AUTOINCREMENT,
+                                          DATE TEXT, FILENAME TEXT, STATUS TEXT, STATUS_REASON TEXT, REMARK TEXT)""")
+                connection.executemany("INSERT INTO validation_logs (DATE, FILENAME, STATUS, STATUS_REASON, REMARK) VALUES (?, ?, ?, ?, ?)",
+                                       [tuple(log[column] for column in self.columns) for log in validation_logs])
+            connection.close()
+            logger.info(f"save_logs :: Status:Success :: db_file_path:{self.db_file_path} :: no_of_logs:{len(validation_logs)}")
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"save_logs :: Status:Failed :: db_file_path:{self.db_file_path} :: Error:{error_message}")
+            raise error_message
+
+    def read_logs(self) -> list[dict]:
+        """read_logs :Used for read all the validation logs from sqlite store
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            list[dict]: validation log rows in insert order
+        """
+        try:
+            with sqlite3.connect(self.db_file_path) as connection:
+                cursor = connection.execute("SELECT DATE, FILENAME, STATUS, STATUS_REASON, REMARK FROM validation_logs ORDER BY SLNO")
+                validation_logs = [dict(zip(self.columns, row)) for row in cursor.fetchall()]
+            connection.close()
+            logger.info(f"read_logs :: Status:Success :: db_file_path:{self.db_file_path} :: no_of_logs:{len(validation_logs)}")
+            return validation_logs
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"read_logs :: Status:Failed :: db_file_path:{self.db_file_path} :: Error:{error_message}")
+            raise error_message
+
+    @staticmethod
+    def summarize(validation_logs:list[dict]) -> dict:
+        """summarize :Used for compute the dashboard summary (passed/failed files count and failed status reasons count)
+
+        Args:
+            validation_logs (list[dict]): validation log rows
+
+        Returns:
+            dict: {"validation_summary": {Passed, Failed}, "status_reasons": {reason: count}}
+        """
+        # every failed file has only one failed log (validation stops at first failed stage)
+        failed_logs = [log for log in validation_logs if log['STATUS']=='Failed']
+        no_of_files = len({log['FILENAME'] for log in validation_logs})
+        return {"validation_summary": {'Passed': no_of_files - len(failed_logs), 'Failed': len(failed_logs)},
+                "status_reasons": dict(Counter(log['STATUS_REASON'] for log in failed_logs))}
+
+    def save_summary(self,summary_file_path:Path) -> None:
+        """save_summary :Used for precompute the summary of stored validation logs for dashboard
+
+        Args:
+            summary_file_path (Path): summary json file path
+
+        Raises:
+            error_message: Custom Exception
+        """
+        try:
+            create_folder_using_file_path(summary_file_path)
+            save_json(file_path=summary_file_path, file_obj=self.summarize(self.read_logs()))
+            logger.info(f"save_summary :: Status:Success :: summary_file_path:{summary_file_path}")
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"save_summary :: Status:Failed :: summary_file_path:{summary_file_path} :: Error:{error_message}")
+            raise error_message
+
+    def render_excel(self,excel_file_path:Path) -> Path:
+        """render_excel :Used for generate the styled validation report excel from sqlite store,
+        excel is generated again only when store is modified after last generation
+
+        Args:
+            excel_file_path (Path): validation report excel file path
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            Path: validation report excel file path
+        """
+        try:
+            if os.path.exists(excel_file_path) and os.path.getmtime(excel_file_path) >= os.path.getmtime(self.db_file_path):
+                logger.info(f"render_excel :: Status:Up to date :: excel_file_path:{excel_file_path}")
+                return excel_file_path
+
+            remove_file(excel_file_path)
+            create_folder_using_file_path(excel_file_path)
+            save_validation_logs_to_excel(validation_logs=self.read_logs(), excel_filename=excel_file_path)
+            logger.info(f"render_excel :: Status:Success :: excel_file_path:{excel_file_path}")
+            return excel_file_path
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"render_excel :: Status:Failed :: excel_file_path:{excel_file_path} :: Error:{error_message}")
+            raise error_message
+
+
+def get_validation_summary(summary_file_path:Path, legacy_excel_file_path:Path) -> dict:
+    """get_validation_summary :Used for getting the precomputed validation summary,
+    summary is computed from legacy validation report excel when summary file not exist
+
+    Args:
+        summary_file_path (Path): summary json file path
+        legacy_excel_file_path (Path): validation report excel file path
+
+    Raises:
+        error_message: Custom Exception
+
+    Returns:
+        dict: {"validation_summary": {Passed, Failed}, "status_reasons": {reason: count}}
+    """
+    try:
+        if os.path.exists(summary_file_path):
+            return read_json(summary_file_path).to_dict()
+
+        logger.info(f"get_validation_summary :: Status:Summary not exist, reading legacy report :: file_path:{legacy_excel_file_path}")
+        validation_data = pd.read_excel(legacy_excel_file_path)
+        return ValidationLogStore.summarize(validation_data[ValidationLogStore.columns].to_dict(orient='records'))
+
+    except Exception as e:
+        error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(msg=f"get_validation_summary :: Status:Failed :: Error:{error_message}")
+        raise error_message
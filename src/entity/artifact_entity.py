@@ -12,6 +12,7 @@ class RawDataValidationArtifacts:
     good_raw_data_folder:Path
     bad_raw_data_folder:Path
     validation_log_file_path:Path
+    validation_manifest_file_path:Optional[Path] = None # None when files are not routed by validation (listing the folders)
     
 # raw data transformation artifacts
 @dataclass
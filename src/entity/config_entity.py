@@ -33,6 +33,8 @@ class DataIngestionConfig:
     target_feature_zero_map = TARGET_FEATURE_ZERO_MAP
     target_feature_one_map = TARGET_FEATURE_ONE_MAP
     final_file_name_prediction = FINAL_FILE_TWO_NAME
+    s3_incremental_sync = S3_INCREMENTAL_SYNC
+    s3_mirror_folder_path = BaseArtifactConfig.data_dir / S3_MIRROR_FOLDER_NAME
 
 @dataclass    
 class LogValidationConfig:
@@ -46,10 +48,19 @@ class TrainingRawDataValidationConfig:
     good_raw_data_folder_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,TRAINING_DATA_FOLDER_NAME,GOOD_RAW_DATA_FOLDER_NAME))
     bad_raw_data_folder_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,TRAINING_DATA_FOLDER_NAME,BAD_RAW_DATA_FOLDER_NAME))
     validation_report_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,TRAINING_DATA_FOLDER_NAME,EVALUATION_DATA_FOLDER_NAME,TRAINING_VALIDATION_LOG_FILE))
+    validation_manifest_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,TRAINING_DATA_FOLDER_NAME,EVALUATION_DATA_FOLDER_NAME,VALIDATION_MANIFEST_FILE_NAME))
     schema_file_path = Path('config') / 'training_schema.json'
     dashboard_validation_show = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / "dashboard_validation_show.json"
     dashboard_validation_report_file_path = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / TRAINING_VALIDATION_LOG_FILE
+    validation_log_store_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,TRAINING_DATA_FOLDER_NAME,EVALUATION_DATA_FOLDER_NAME,TRAINING_VALIDATION_LOG_STORE_FILE))
+    dashboard_validation_log_store_file_path = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / TRAINING_VALIDATION_LOG_STORE_FILE
+    dashboard_validation_summary_file_path = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / TRAINING_VALIDATION_SUMMARY_FILE
     dashboard_bad_raw_zip_file_path = BaseArtifactConfig.data_dir / PREDICTION_DATA_FOLDER_NAME / BAD_RAW_ZIP_FILE_NAME
+    bad_raw_zip_compress_level = BAD_RAW_ZIP_COMPRESS_LEVEL
+    validation_n_jobs = VALIDATION_N_JOBS
+    header_column_names_validation = HEADER_COLUMN_NAMES_VALIDATION
+    validation_cache_file_path = BaseArtifactConfig.data_dir / TRAINING_VALIDATION_CACHE_FILE_NAME
+    validation_cache_max_entries = VALIDATION_CACHE_MAX_ENTRIES
     
 @dataclass
 class PredictionRawDataValidationConfig:
@@ -61,10 +72,19 @@ class PredictionRawDataValidationConfig:
     bad_raw_data_folder_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,PREDICTION_DATA_FOLDER_NAME,BAD_RAW_DATA_FOLDER_NAME))
     schema_file_path = Path('config') / 'prediction_schema.json'
     validation_report_file_path =  Path(os.path.join(BaseArtifactConfig.artifact_dir,PREDICTION_DATA_FOLDER_NAME,EVALUATION_DATA_FOLDER_NAME,PREDICTION_VALIDATION_LOG_FILE))
+    validation_manifest_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,PREDICTION_DATA_FOLDER_NAME,EVALUATION_DATA_FOLDER_NAME,VALIDATION_MANIFEST_FILE_NAME))
     dashboard_validation_show = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / "dashboard_validation_show.json" # this file used only training added here because of avoid annotation error
     dashboard_validation_report_file_path = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / PREDICTION_VALIDATION_LOG_FILE
+    validation_log_store_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,PREDICTION_DATA_FOLDER_NAME,EVALUATION_DATA_FOLDER_NAME,PREDICTION_VALIDATION_LOG_STORE_FILE))
+    dashboard_validation_log_store_file_path = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / PREDICTION_VALIDATION_LOG_STORE_FILE
+    dashboard_validation_summary_file_path = BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / PREDICTION_VALIDATION_SUMMARY_FILE
     dashboard_bad_raw_zip_file_path = BaseArtifactConfig.data_dir / PREDICTION_DATA_FOLDER_NAME / BAD_RAW_ZIP_FILE_NAME
     dashboard_bad_file_names_json_path =  BaseArtifactConfig.data_dir / DASHBOARD_DATA_FOLDER_NAME / BAD_FILE_NAMES_FILE_NAME
+    bad_raw_zip_compress_level = BAD_RAW_ZIP_COMPRESS_LEVEL
+    validation_n_jobs = VALIDATION_N_JOBS
+    header_column_names_validation = HEADER_COLUMN_NAMES_VALIDATION
+    validation_cache_file_path = BaseArtifactConfig.data_dir / PREDICTION_VALIDATION_CACHE_FILE_NAME
+    validation_cache_max_entries = VALIDATION_CACHE_MAX_ENTRIES
     
 @dataclass
 class TrainingRawDataTransformationConfig(TrainingRawDataValidationConfig):
@@ -73,6 +93,12 @@ class TrainingRawDataTransformationConfig(TrainingRawDataValidationConfig):
     new_wafer_column_name = NEW_WAFER_COLUMN_NAME
     new_output_column_name = NEW_OUTPUT_COLUMN_NAME
     merge_file_path =  Path(os.path.join(BaseArtifactConfig.artifact_dir,TRAINING_DATA_FOLDER_NAME,FINAL_TRAINING_FILE_FOLDER_NAME,FINAL_FILE_NAME))
+    streaming_merge = STREAMING_MERGE
+    merge_chunk_size = MERGE_CHUNK_SIZE
+    csv_read_n_threads = CSV_READ_N_THREADS
+    downcast_float = DOWNCAST_SENSOR_FLOAT
+    merged_dataset_cache_folder_path = BaseArtifactConfig.data_dir / ARTIFACT_CACHE_FOLDER_NAME / MERGED_DATASET_CACHE_FOLDER_NAME
+    merged_dataset_cache_max_size_mb = MERGED_DATASET_CACHE_MAX_SIZE_MB
     
     
 @dataclass
@@ -82,6 +108,12 @@ class PredictionRawDataTransformationConfig(PredictionRawDataValidationConfig):
     new_wafer_column_name = NEW_WAFER_COLUMN_NAME
     new_output_column_name = NEW_OUTPUT_COLUMN_NAME
     merge_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,PREDICTION_DATA_FOLDER_NAME,FINAL_PREDICTION_FILE_FOLDER_NAME,FINAL_FILE_NAME))
+    streaming_merge = STREAMING_MERGE
+    merge_chunk_size = MERGE_CHUNK_SIZE
+    csv_read_n_threads = CSV_READ_N_THREADS
+    downcast_float = DOWNCAST_SENSOR_FLOAT
+    merged_dataset_cache_folder_path = BaseArtifactConfig.data_dir / ARTIFACT_CACHE_FOLDER_NAME / MERGED_DATASET_CACHE_FOLDER_NAME
+    merged_dataset_cache_max_size_mb = MERGED_DATASET_CACHE_MAX_SIZE_MB
 
 @dataclass
 class PreprocessorConfig:
@@ -90,11 +122,29 @@ class PreprocessorConfig:
     lower_percentile = LOWER_PERCENTILE
     upper_percentile = UPPER_PERCENTILE
     iqr_multiplier = IQR_MULTIPLIER
+    knn_imputer_n_neighbors = KNN_IMPUTER_N_NEIGHBORS
+    knn_imputer_backend = KNN_IMPUTER_BACKEND
+    fast_knn_n_components = FAST_KNN_N_COMPONENTS
+    fast_knn_n_candidates = FAST_KNN_N_CANDIDATES
+    fast_knn_chunk_size = FAST_KNN_CHUNK_SIZE
+    fast_knn_n_jobs = FAST_KNN_N_JOBS
+    fast_knn_latency_budget_seconds = FAST_KNN_LATENCY_BUDGET_SECONDS
+    fast_knn_validation_sample_size = FAST_KNN_VALIDATION_SAMPLE_SIZE
+    fast_knn_tolerance = FAST_KNN_TOLERANCE
+    save_non_duplicate_data = SAVE_NON_DUPLICATE_DATA
+    wafer_column_name = NEW_WAFER_COLUMN_NAME
+    downcast_float = DOWNCAST_SENSOR_FLOAT # input dtype of sensor columns (part of preprocessor cache key)
     non_duplicate_data_clear_df_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,PREDICTION_DATA_FOLDER_NAME,FINAL_PREDICTION_FILE_FOLDER_NAME,NON_DUPLICATE_DF_NAME))
     preprocessor_object_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,
                                                             MODEL_DATA_FOLDER_NAME,
                                                             PREPROCESSOR_FOLDER_NAME,
                                                             PREPROCESSOR_OBJECT_NAME))
+    preprocessed_data_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,
+                                                    MODEL_DATA_FOLDER_NAME,
+                                                    PREPROCESSOR_FOLDER_NAME,
+                                                    PREPROCESSED_DATA_FILE_NAME))
+    preprocessor_cache_folder_path = BaseArtifactConfig.data_dir / ARTIFACT_CACHE_FOLDER_NAME / PREPROCESSOR_CACHE_FOLDER_NAME
+    preprocessor_cache_max_size_mb = PREPROCESSOR_CACHE_MAX_SIZE_MB
     preprocessor_json_file_path = Path(os.path.join(BaseArtifactConfig.artifact_dir,
                                                         MODEL_DATA_FOLDER_NAME,
                                                         EXCEL_AND_JSON_FILES_FOLDER_NAME,
@@ -182,6 +232,7 @@ class ModelTrainerConfig:
     cluster_dataset_path =  os.path.join(BaseArtifactConfig.artifact_dir,
                                               TRAINING_DATA_FOLDER_NAME,
                                               FINAL_TRAINING_FILE_FOLDER_NAME)
+    cluster_dataset_file_format = INTERMEDIATE_FILE_FORMAT
     
     all_model_result_json_file_name = ALL_MODELS_RESULTS_DATA_JSON_FILE_NAME
     all_model_result_excel_file_name = ALL_MODELS_RESULTS_DATA_EXCEL_FILE_NAME
@@ -212,6 +263,9 @@ class S3Config:
     local_md5_check_file_path = local_prediction_models_path / "bestmodel_obj" / "Cluster_0" / "model.pkl"
     etag_file_path = "prediction_model_data/champion/bestmodel_obj/Cluster_0/model.pkl"
     etag_data_json_file_path = Path(DATA_FOLDER_NAME) /  ETAG_DATA_JSON_FILE_NAME
+    download_max_workers = S3_DOWNLOAD_MAX_WORKERS
+    download_max_retries = S3_DOWNLOAD_MAX_RETRIES
+    download_progress_batch_size = S3_DOWNLOAD_PROGRESS_BATCH_SIZE
 
 @dataclass
 class ModelEvaluationConfig:
@@ -258,6 +312,12 @@ class PredictionPipelineConfig:
     confidence_column_name = CONFIDENCE_COLUMN_NAME
     target_feature_zero_map = TARGET_FEATURE_ZERO_MAP
     target_feature_one_map = TARGET_FEATURE_ONE_MAP
+    preprocessor_kernel_enabled = PREPROCESSOR_KERNEL_ENABLED
+    preprocessor_kernel_verify_sample_size = PREPROCESSOR_KERNEL_VERIFY_SAMPLE_SIZE
+    preprocessor_kernel_tolerance = PREPROCESSOR_KERNEL_TOLERANCE
+    row_hash_index_enabled = PREDICTION_ROW_HASH_INDEX_ENABLED
+    row_hash_index_file_path = BaseArtifactConfig.data_dir / PREDICTION_ROW_HASH_INDEX_FILE_NAME
+    row_hash_index_max_age_days = ROW_HASH_INDEX_MAX_AGE_DAYS
     
 @dataclass
 class AppConfig:
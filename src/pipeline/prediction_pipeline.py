@@ -12,10 +12,12 @@ from src.components.rawdata_validation import RawDataValidation
 from src.components.rawdata_transformation import RawDataTransformation
 from src.components.data_ingestion import DataIngestion
 from src.components.model_evaluation import DataDrift
+from src.components.preprocessor_kernel import load_preprocessor_kernel
+from src.db_management.row_hash_index import RowHashIndex
 from src.entity.artifact_entity import PredictionPipelineArtifacts
 import numpy as np
 import xgboost as xgb
-from src.utilities.utils import load_obj,read_csv_file,remove_file,save_model_result_excel,save_model_result_feedback_excel
+from src.utilities.utils import load_obj,remove_file,save_model_result_excel,save_model_result_feedback_excel
 
 class PredictionPipeline:
     def __init__(self) -> None:
@@ -28,42 +30,36 @@ class PredictionPipeline:
         
 
 
-    def initialize_pipeline(self) -> bool | None:
-        """initialize_pipeline used start the prediction pipeline process
+    def predict_wafers(self,input_file:pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """predict_wafers :Used for preprocess, cluster and predict the input rows
+
+        Args:
+            input_file (pd.DataFrame): ingested prediction data
+
+        Raises:
+            error_message: Custom Exception
 
         Returns:
-           PredictionArtifacts: bool | None: True if properly training process is completed (this is use for update prediction data and further process only prediction process is completed)
+            tuple[pd.DataFrame, pd.DataFrame]: predictions with probabilities (wafer, output, confidence) and non duplicate input rows
         """
         try:
-            logger.info(msg="---------------Started Prediction Pipeline---------------")
-            # remove prediction.xlsx file for avoid getting previous prediction data to client 
-            remove_file(self.config.predictions_data_path) 
-            
-            # Raw Data Validation Process
-            raw_data_validation = RawDataValidation(config=self.prediction_rawdata_validation_config,
-                                                              folder_path=self.folder_path) 
-            
-            raw_data_validation_artifacts = raw_data_validation.initialize_rawdata_validation_process()
-
-            # Raw Data Transformation Process
-            raw_data_transformation = RawDataTransformation(config=self.prediction_rawdata_transformation_config,
-                                                            rawdata_validation_artifacts=raw_data_validation_artifacts)
-            self.raw_data_transformation_artifacts = raw_data_transformation.initialize_data_transformation_process()
-            
-            # Data Ingestion Process (reading the transformed file)
-            input_file = self.raw_data_transformation_artifacts.final_file_path
-            data_ingestion = DataIngestion(input_file)
-            data_ingestion_artifact_file = data_ingestion.get_data()
-            
             # Preprocessing Process
             logger.info("Data Preprocessing :: Status:Started")
             # load preprocessing_stage_one_obj
-            input_file = data_ingestion_artifact_file
-            preprocessor_obj = load_obj(self.config.preprocessor_stage_one_obj_path)
+            preprocessor_pipeline = load_obj(self.config.preprocessor_stage_one_obj_path)
+            preprocessor_obj = preprocessor_pipeline
+            if self.config.preprocessor_kernel_enabled:
+                # compiled kernel gives same output as pipeline without building dataframe for every step
+                preprocessor_obj = load_preprocessor_kernel(pipeline=preprocessor_pipeline, # type: ignore
+                                                            sample_data=input_file,
+                                                            verify_sample_size=self.config.preprocessor_kernel_verify_sample_size,
+                                                            tolerance=self.config.preprocessor_kernel_tolerance)
+            else:
+                logger.info("Data Preprocessing :: Status:Using pipeline :: Reason:preprocessor kernel disabled")
             preprocessed_stage_one_data = preprocessor_obj.transform(input_file) # type: ignore
             
-            # dataset for after duplicates in preprocessor_stage_one  need for wafers column
-            preprocessing_stage_one_data_with_wafer_column = read_csv_file(self.config.preprocessor_stage_one_data_path)
+            # preprocessed rows keep the input index, input rows of non duplicate data are taken by index
+            preprocessing_stage_one_data_with_wafer_column = input_file.loc[preprocessed_stage_one_data.index]
             logger.info("Data Preprocessing :: Status:Ended")
             
             # Cluster Process
@@ -72,28 +68,18 @@ class PredictionPipeline:
             cluster_obj = load_obj(self.config.cluster_obj_path)
             cluster_labels = cluster_obj.predict(preprocessed_stage_one_data) # type: ignore
             
-            # Concatenate the cluster labels with the preprocessed data
-            preprocessed_stage_one_data = pd.concat(
-                [preprocessed_stage_one_data, pd.Series(cluster_labels, name=self.config.cluster_column_name)], 
-                axis=1
-            )            
-            
-            # Now you can copy the DataFrame if needed
-            final_cluster_data = preprocessed_stage_one_data.copy()
-            
-            # combine wafer names final file
-            final_cluster_data = pd.concat(
-                [final_cluster_data, preprocessing_stage_one_data_with_wafer_column[[self.config.wafer_column_name]]],
-                axis=1
-            )
+            # add the cluster labels and wafer names (aligned by index) to the preprocessed data
+            final_cluster_data = preprocessed_stage_one_data
+            final_cluster_data[self.config.cluster_column_name] = cluster_labels
+            final_cluster_data[self.config.wafer_column_name] = preprocessing_stage_one_data_with_wafer_column[self.config.wafer_column_name]
             logger.info("Data Clustering Labels :: Status:Ended")
             
             # Prediction Process
             # Perform predictions cluster-wise and combine all the predictions
             logger.info("Prediction Process :: Status:Started")
-            prediction_files = []
             final_predictions_with_probabilities_files =[]
-            for cluster_no in range(final_cluster_data[self.config.cluster_column_name].nunique()):
+            # clusters present in the data (subset of new rows may not have every cluster)
+            for cluster_no in sorted(final_cluster_data[self.config.cluster_column_name].unique()):
                 cluster_sub_folder_path = Path(os.path.join(self.config.best_models_path, f'Cluster_{cluster_no}'))
                 logger.info(f"Getting the data from Cluster_{cluster_no}")
                 
@@ -144,7 +130,6 @@ class PredictionPipeline:
                 predictions_probabilities_series = pd.Series(predictions_probabilities, name=self.config.confidence_column_name).reset_index(drop=True)
                 
                 # Concatenate predictions with wafer data
-                final_prediction = pd.concat([cluster_wafer, predictions_series], axis=1)
                 final_predictions_with_probabilities = pd.concat([cluster_wafer, predictions_series,predictions_probabilities_series], axis=1)
                 
                 logger.info(f"Cluster {cluster_no} - Number of Wafer IDs: {len(cluster_wafer)}")
@@ -152,12 +137,73 @@ class PredictionPipeline:
                 logger.info(f"Cluster {cluster_no} - Number of Predictions: {len(predictions_probabilities_series)}")
                 
                 # Store the final prediction for this cluster
-                prediction_files.append(final_prediction)
                 final_predictions_with_probabilities_files.append(final_predictions_with_probabilities)
 
             # Combine all the predictions from different clusters
-            final_predictions_combined = pd.concat(prediction_files, axis=0).reset_index(drop=True)
+            logger.info("Prediction Process :: Status:Ended")
             final_predictions_with_probabilities_combined = pd.concat(final_predictions_with_probabilities_files, axis=0).reset_index(drop=True)
+            return final_predictions_with_probabilities_combined, preprocessing_stage_one_data_with_wafer_column
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"predict_wafers :: Status:Failed :: Error:{error_message}")
+            raise error_message
+
+    def initialize_pipeline(self) -> bool | None:
+        """initialize_pipeline used start the prediction pipeline process
+
+        Returns:
+           PredictionArtifacts: bool | None: True if properly training process is completed (this is use for update prediction data and further process only prediction process is completed)
+        """
+        try:
+            logger.info(msg="---------------Started Prediction Pipeline---------------")
+            # remove prediction.xlsx file for avoid getting previous prediction data to client 
+            remove_file(self.config.predictions_data_path) 
+            
+            # Raw Data Validation Process
+            raw_data_validation = RawDataValidation(config=self.prediction_rawdata_validation_config,
+                                                              folder_path=self.folder_path) 
+            
+            raw_data_validation_artifacts = raw_data_validation.initialize_rawdata_validation_process()
+
+            # Raw Data Transformation Process
+            raw_data_transformation = RawDataTransformation(config=self.prediction_rawdata_transformation_config,
+                                                            rawdata_validation_artifacts=raw_data_validation_artifacts)
+            self.raw_data_transformation_artifacts = raw_data_transformation.initialize_data_transformation_process()
+            
+            # Data Ingestion Process (reading the transformed file)
+            input_file = self.raw_data_transformation_artifacts.final_file_path
+            data_ingestion = DataIngestion(input_file,schema_dtypes=raw_data_transformation.schema_dtypes)
+            data_ingestion_artifact_file = data_ingestion.get_data()
+            
+            # Preprocessing, Clustering and Prediction Process
+            input_file = data_ingestion_artifact_file
+            seen_rows = np.zeros(len(input_file), dtype=bool)
+            stored_predictions = []
+            row_hash_index = None
+            if self.config.row_hash_index_enabled:
+                # wafers already predicted with same values take the stored prediction, only new rows are predicted
+                row_hash_index = RowHashIndex(db_file_path=self.config.row_hash_index_file_path,
+                                              max_age_days=self.config.row_hash_index_max_age_days)
+                found_predictions = row_hash_index.find_predictions(row_hashes=RowHashIndex.hash_rows(df=input_file,wafer_column=self.config.wafer_column_name),
+                                                                    wafers=input_file[self.config.wafer_column_name].astype(str).tolist())
+                if len(found_predictions):
+                    seen_positions = found_predictions.index.to_numpy()
+                    seen_rows[seen_positions] = True
+                    stored_predictions.append(pd.DataFrame({self.config.wafer_column_name: input_file[self.config.wafer_column_name].to_numpy()[seen_positions],
+                                                            self.config.output_column_name: found_predictions["OUTPUT"].to_numpy(),
+                                                            self.config.confidence_column_name: found_predictions["CONFIDENCE"].to_numpy()}))
+                logger.info(f"Prediction Process :: Status: Stored predictions used :: no_of_seen_rows:{int(seen_rows.sum())} :: no_of_new_rows:{int((~seen_rows).sum())}")
+
+            if seen_rows.all():
+                new_predictions = pd.DataFrame(columns=[self.config.wafer_column_name, self.config.output_column_name, self.config.confidence_column_name])
+                preprocessing_stage_one_data_with_wafer_column = input_file.iloc[:0]
+            else:
+                new_predictions, preprocessing_stage_one_data_with_wafer_column = self.predict_wafers(input_file=input_file[~seen_rows])
+
+            # Combine the predictions of new rows and stored predictions of seen rows
+            final_predictions_with_probabilities_combined = pd.concat([predictions for predictions in [new_predictions] + stored_predictions if len(predictions)], axis=0).reset_index(drop=True)
+            final_predictions_combined = final_predictions_with_probabilities_combined[[self.config.wafer_column_name, self.config.output_column_name]]
             
             final_prediction_file = final_predictions_combined.copy()
             final_predictions_with_probabilities_file = final_predictions_with_probabilities_combined.copy()
@@ -173,11 +219,20 @@ class PredictionPipeline:
             logger.info(f"Prediction Process :: Status: save feedback file contains prediction with probabilities file Successfully :: {self.config.predictions_with_probabilities_data_path}")
             
             # prediction with raw file for retrain purpose
-            prediction_with_rawdata = pd.merge(preprocessing_stage_one_data_with_wafer_column,final_predictions_combined,how='left')
+            prediction_with_rawdata = pd.merge(pd.concat([preprocessing_stage_one_data_with_wafer_column, input_file[seen_rows].drop_duplicates()]),
+                                               final_predictions_combined,how='left')
 
             prediction_with_rawdata.to_csv(self.config.predicted_data_with_rawdata_file_path,index=False)
             logger.info(f"Prediction Process :: Status: save the prediction data with raw file Successfully :: {self.config.predicted_data_with_rawdata_file_path}")
             
+            if row_hash_index is not None and len(new_predictions):
+                # rows are added only after the run is completed so failed runs are predicted again next time
+                new_row_predictions = new_predictions.drop_duplicates(subset=[self.config.wafer_column_name]).set_index(self.config.wafer_column_name)
+                new_row_predictions = new_row_predictions.reindex(preprocessing_stage_one_data_with_wafer_column[self.config.wafer_column_name])
+                row_hash_index.add(row_hashes=RowHashIndex.hash_rows(df=preprocessing_stage_one_data_with_wafer_column,wafer_column=self.config.wafer_column_name),
+                                   wafers=preprocessing_stage_one_data_with_wafer_column[self.config.wafer_column_name].astype(str).tolist(),
+                                   outputs=new_row_predictions[self.config.output_column_name].tolist(),
+                                   confidences=new_row_predictions[self.config.confidence_column_name].tolist())
             logger.info(msg="---------------Completed Prediction Pipeline-------------")
             prediction_artifacts = PredictionPipelineArtifacts(prediction_status=True)
             
@@ -49,6 +49,8 @@ class TrainingPipeline:
             self.model_evolution_config = ModelEvaluationConfig(self.timestamp)
             
             logger.info(msg="---------------Started Training Pipeline---------------")
+            # S3 prefix listings are shared only within this run
+            self.s3.clear_listing_cache()
             
             # Data Ingestion Process (Getting the training data)
             get_training_data = GetTrainingData(data_ingestion_config=self.data_ingestion_config,
@@ -69,7 +71,7 @@ class TrainingPipeline:
             else:
                 raw_data_validation_artifacts = RawDataValidationArtifacts(good_raw_data_folder=files_path,
                                                                            bad_raw_data_folder=self.rawdata_validation_config.bad_raw_data_folder_path,
-                                                                           validation_log_file_path=self.rawdata_validation_config.validation_report_file_path) 
+                                                                           validation_log_file_path=self.rawdata_validation_config.validation_log_store_file_path) 
             
             # Raw Data Transformation Process
             raw_data_transformation = RawDataTransformation(config=self.rawdata_transformation_config,
@@ -77,7 +79,8 @@ class TrainingPipeline:
             self.raw_data_transformation_artifacts = raw_data_transformation.initialize_data_transformation_process()
             
             # Read the Transformation data
-            data_ingestion = DataIngestion(input_dataset_path=self.raw_data_transformation_artifacts.final_file_path)
+            data_ingestion = DataIngestion(input_dataset_path=self.raw_data_transformation_artifacts.final_file_path,
+                                           schema_dtypes=raw_data_transformation.schema_dtypes)
             data_ingestion_artifacts = data_ingestion.initialize_data_ingestion_process()
             
             # Data Preprocessing Process
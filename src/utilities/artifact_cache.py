@@ -0,0 +1,197 @@
+import os,sys
+import shutil
+import hashlib
+from pathlib import Path
+import pandas as pd
+from src.logger import logger
+from src.exception import SensorFaultException
+from src.utilities.utils import create_folder_using_folder_path, get_local_file_md5
+
+
+class ArtifactCache:
+    def __init__(self,cache_folder_path:Path,max_size_mb:int):
+        """__init__ :Size bounded file cache, least recently used keys (all files of key) are evicted when cache size exceeds max_size_mb
+
+        Args:
+            cache_folder_path (Path): cache folder path
+            max_size_mb (int): maximum size of cache folder in MB
+        """
+        self.cache_folder_path = Path(cache_folder_path)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+    @staticmethod
+    def fingerprint_files(file_paths:list[Path],extra_keys:list[str] | None=None) -> str:
+        """fingerprint_files :Used for build the fingerprint of file set from file names and content hashes (order independent)
+
+        Args:
+            file_paths (list[Path]): file paths
+            extra_keys (list[str] | None): other values output depends on (config values). Defaults to None.
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            str: fingerprint
+        """
+        try:
+            fingerprint = hashlib.md5()
+            for file_path in sorted(file_paths, key=lambda file_path: os.path.basename(file_path)):
+                fingerprint.update(f"{os.path.basename(file_path)}:{get_local_file_md5(file_path)}\n".encode())
+            for extra_key in extra_keys or []:
+                fingerprint.update(f"{extra_key}\n".encode())
+            logger.info(f"fingerprint_files :: Status:Success :: no_of_files:{len(file_paths)} :: fingerprint:{fingerprint.hexdigest()}")
+            return fingerprint.hexdigest()
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"fingerprint_files :: Status:Failed :: Error:{error_message}")
+            raise error_message
+
+    @staticmethod
+    def fingerprint_dataframe(df:pd.DataFrame,extra_keys:list[str] | None=None) -> str:
+        """fingerprint_dataframe :Used for build the fingerprint of dataframe content (columns, dtypes, index and values)
+
+        Args:
+            df (pd.DataFrame): dataframe
+            extra_keys (list[str] | None): other values output depends on (config values). Defaults to None.
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            str: fingerprint
+        """
+        try:
+            fingerprint = hashlib.md5()
+            fingerprint.update(f"{list(df.columns)}:{df.dtypes.astype(str).tolist()}\n".encode())
+            fingerprint.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+            for extra_key in extra_keys or []:
+                fingerprint.update(f"{extra_key}\n".encode())
+            logger.info(f"fingerprint_dataframe :: Status:Success :: shape:{df.shape} :: fingerprint:{fingerprint.hexdigest()}")
+            return fingerprint.hexdigest()
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"fingerprint_dataframe :: Status:Failed :: Error:{error_message}")
+            raise error_message
+
+    def get_cache_file_path(self,key:str,file_name:str) -> Path:
+        return self.cache_folder_path / f"{key}_{file_name}"
+
+    def get(self,key:str,file_path:Path) -> bool:
+        """get :Used for copy the cached file of key into file_path
+
+        Args:
+            key (str): cache key
+            file_path (Path): destination file path (file name is part of cache entry)
+
+        Returns:
+            bool: True if cache hit else False
+        """
+        return self.get_entry(key=key,file_paths=[file_path])
+
+    def get_entry(self,key:str,file_paths:list[Path]) -> bool:
+        """get_entry :Used for copy all cached files of key into file_paths, entry with any file missing is a miss
+        (its remaining files are removed)
+
+        Args:
+            key (str): cache key
+            file_paths (list[Path]): destination file paths (file names are part of cache entry)
+
+        Raises:
+            error_message: Custom Exception
+
+        Returns:
+            bool: True if cache hit else False
+        """
+        try:
+            cache_file_paths = [self.get_cache_file_path(key=key,file_name=os.path.basename(file_path)) for file_path in file_paths]
+            if not all(os.path.exists(cache_file_path) for cache_file_path in cache_file_paths):
+                if any(os.path.exists(cache_file_path) for cache_file_path in cache_file_paths):
+                    self.remove_key(key)
+                    logger.info(f"artifact cache get :: Status:Miss (partial entry removed) :: key:{key}")
+                else:
+                    logger.info(f"artifact cache get :: Status:Miss :: key:{key}")
+                return False
+
+            for cache_file_path, file_path in zip(cache_file_paths, file_paths):
+                shutil.copyfile(cache_file_path,file_path)
+                os.utime(cache_file_path) # mark as recently used
+            logger.info(f"artifact cache get :: Status:Hit :: key:{key} :: no_of_files:{len(file_paths)}")
+            return True
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"artifact cache get :: Status:Failed :: key:{key} :: Error:{error_message}")
+            raise error_message
+
+    def put(self,key:str,file_path:Path) -> None:
+        """put :Used for store the file into cache under key and evict least recently used keys above max size
+
+        Args:
+            key (str): cache key
+            file_path (Path): file path to cache
+        """
+        self.put_entry(key=key,file_paths=[file_path])
+
+    def put_entry(self,key:str,file_paths:list[Path]) -> None:
+        """put_entry :Used for store all files of entry into cache under key and evict least recently used keys above max size
+
+        Args:
+            key (str): cache key
+            file_paths (list[Path]): file paths to cache
+
+        Raises:
+            error_message: Custom Exception
+        """
+        try:
+            create_folder_using_folder_path(self.cache_folder_path)
+            for file_path in file_paths:
+                cache_file_path = self.get_cache_file_path(key=key,file_name=os.path.basename(file_path))
+                # copy into temporary file first, partially copied file never looks like cache hit
+                temp_cache_file_path = Path(f"{cache_file_path}.tmp")
+                shutil.copyfile(file_path,temp_cache_file_path)
+                os.replace(temp_cache_file_path,cache_file_path)
+            logger.info(f"artifact cache put :: Status:Success :: key:{key} :: no_of_files:{len(file_paths)}")
+            self.evict()
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"artifact cache put :: Status:Failed :: key:{key} :: Error:{error_message}")
+            raise error_message
+
+    def remove_key(self,key:str) -> None:
+        """remove_key :Used for remove all cached files of key
+        """
+        for entry in os.scandir(self.cache_folder_path):
+            if entry.is_file() and entry.name.startswith(f"{key}_"):
+                os.remove(entry.path)
+
+    def evict(self) -> None:
+        """evict :Used for remove least recently used keys (all files of key together) until cache size is under max size
+
+        Raises:
+            error_message: Custom Exception
+        """
+        try:
+            # cache file name is <key>_<file name>, files of key are grouped and used time of key is its latest file
+            key_sizes, key_used_times = {}, {}
+            for entry in os.scandir(self.cache_folder_path):
+                if not entry.is_file() or entry.name.endswith(".tmp"):
+                    continue
+                key = entry.name.split("_", 1)[0]
+                stat = entry.stat()
+                key_sizes[key] = key_sizes.get(key, 0) + stat.st_size
+                key_used_times[key] = max(key_used_times.get(key, 0.0), stat.st_mtime)
+
+            cache_size = 0
+            for key in sorted(key_sizes, key=lambda key: key_used_times[key], reverse=True):
+                cache_size += key_sizes[key]
+                if cache_size > self.max_size_bytes:
+                    self.remove_key(key)
+                    logger.info(f"artifact cache evict :: Status:Evicted :: key:{key}")
+
+        except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"artifact cache evict :: Status:Failed :: Error:{error_message}")
+            raise error_message
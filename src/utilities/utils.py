@@ -7,7 +7,9 @@ import shutil
 import hashlib
 import pickle
 import dill
-import os,sys
+import os,sys,time
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 import pandas as pd
 import matplotlib
@@ -27,6 +29,7 @@ from email.mime.text import MIMEText
 from dotenv import load_dotenv
 from src.logger import logger
 from src.exception import SensorFaultException
+from src.constants import ZIP_STORED_FILE_EXTENSIONS
 from src.entity.config_entity import (BaseArtifactConfig,
                                       ModelTrainerConfig,
                                       ModelTunerConfig,
@@ -133,17 +136,261 @@ def read_csv_file(file_path:Path) -> pd.DataFrame:
         os._exit(1)
         raise error_message
         
-def style_excel(excel_filename):
-    """style_excel : Used for style the append_log_to_excel method
+def get_schema_dtypes(schema_file_path:Path, downcast_float:bool=False, column_renames:dict[str, str] | None=None) -> dict[str, str]:
+    """get_schema_dtypes :Used for build the column dtype map from schema file for reading the sensor data
 
     Args:
-        excel_filename (_type_): Excel file name
+        schema_file_path (Path): schema json file path
+        downcast_float (bool): use float32 for float64 columns (half memory). Defaults to False.
+        column_renames (dict[str, str] | None): {old column name: new column name}, dtype is added for renamed column also. Defaults to None.
+
+    Raises:
+        SensorFaultException: Custom Exception
+
+    Returns:
+        dict[str, str]: {column name: dtype}
     """
+    try:
+        schema_dtypes = dict(read_json(file_path=schema_file_path).ColName)
+        if downcast_float:
+            schema_dtypes = {column: 'float32' if dtype=='float64' else dtype for column, dtype in schema_dtypes.items()}
+        
+        # renamed columns (after transformation) get the same dtype of the raw column
+        for old_column, new_column in (column_renames or {}).items():
+            if old_column in schema_dtypes:
+                schema_dtypes[new_column] = schema_dtypes[old_column]
+        logger.info(f"get_schema_dtypes :: Status:Success :: schema_file_path:{schema_file_path} :: downcast_float:{downcast_float}")
+        return schema_dtypes
     
-    # Load the workbook and select the active worksheet
-    wb = load_workbook(excel_filename)
-    ws = wb.active
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"get_schema_dtypes :: schema_file_path:{schema_file_path} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def read_csv_file_with_schema(file_path:Path, schema_dtypes:dict[str, str]) -> pd.DataFrame:
+    """read_csv_file_with_schema :: Used for read the csv file with schema dtypes (skips dtype inference),
+    file is read with inferred dtypes if data can't be cast to schema dtypes (float columns are still downcast to schema float dtype)
+
+    Args:
+        file_path (Path): File path of the file
+        schema_dtypes (dict[str, str]): {column name: dtype}, columns not in file are ignored
+
+    Raises:
+        SensorFaultException: Custom Exception
+
+    Returns:
+        pd.DataFrame: dataframe
+    """
+    try:
+        try:
+            dataframe = pd.read_csv(file_path, dtype=schema_dtypes)
+        except (ValueError, TypeError):
+            logger.info(f"read csv file with schema : file_path: {file_path} : Status: schema dtypes not matched, reading with inferred dtypes")
+            dataframe = pd.read_csv(file_path)
+            float_dtypes = {column: dtype for column, dtype in schema_dtypes.items()
+                            if column in dataframe.columns and dtype.startswith('float') and dataframe[column].dtype.kind=='f'}
+            dataframe = dataframe.astype(float_dtypes)
+        logger.info(f"read csv file with schema : file_path: {file_path} : Status: Successful")
+        return dataframe
+    
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"read csv file with schema :: file_path:{file_path} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def read_csv_file_timed(file_path:Path, schema_dtypes:dict[str, str] | None=None) -> pd.DataFrame:
+    """read_csv_file_timed :: Used for read the csv file with pyarrow engine (when installed) and log the parse time of file,
+    empty column names are named like C parser ("Unnamed: <position>"), file is read with C parser if pyarrow engine fails
+
+    Args:
+        file_path (Path): File path of the file
+        schema_dtypes (dict[str, str] | None): {column name: dtype}. Defaults to None.
+
+    Raises:
+        SensorFaultException: Custom Exception
 
+    Returns:
+        pd.DataFrame: dataframe
+    """
+    try:
+        start_time = time.perf_counter()
+        engine = "pyarrow" if importlib.util.find_spec("pyarrow") is not None else "c"
+        if engine == "pyarrow":
+            try:
+                dataframe = pd.read_csv(file_path, engine="pyarrow")
+                dataframe.columns = [column if column!="" else f"Unnamed: {slno}" for slno, column in enumerate(dataframe.columns)]
+                if schema_dtypes is not None:
+                    dataframe = dataframe.astype({column: dtype for column, dtype in schema_dtypes.items() if column in dataframe.columns})
+            except (ValueError, TypeError) as e:
+                logger.info(f"read csv file timed : file_path: {file_path} : Status: pyarrow engine failed, reading with c engine : Error:{e}")
+                engine = "c"
+        if engine == "c":
+            dataframe = read_csv_file_with_schema(file_path=file_path, schema_dtypes=schema_dtypes) if schema_dtypes is not None else pd.read_csv(file_path)
+        logger.info(f"read csv file timed : file_path: {file_path} : Status: Successful : engine:{engine} : parse_time:{time.perf_counter()-start_time:.4f}s")
+        return dataframe
+    
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"read csv file timed :: file_path:{file_path} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def read_csv_files(file_paths:list[Path], schema_dtypes:dict[str, str] | None=None, n_threads:int=1) -> list[pd.DataFrame]:
+    """read_csv_files :: Used for read many csv files at once on thread pool, frames are returned in the same order of file_paths
+
+    Args:
+        file_paths (list[Path]): File paths
+        schema_dtypes (dict[str, str] | None): {column name: dtype}. Defaults to None.
+        n_threads (int): number of reader threads. Defaults to 1.
+
+    Raises:
+        SensorFaultException: Custom Exception
+
+    Returns:
+        list[pd.DataFrame]: dataframes of files
+    """
+    try:
+        start_time = time.perf_counter()
+        n_threads = max(1, min(n_threads, len(file_paths)))
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            dataframes = list(executor.map(lambda file_path: read_csv_file_timed(file_path=file_path, schema_dtypes=schema_dtypes), file_paths))
+        logger.info(f"read csv files : Status: Successful : no_of_files:{len(file_paths)} : n_threads:{n_threads} : total_time:{time.perf_counter()-start_time:.4f}s")
+        return dataframes
+    
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"read csv files :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def read_excel_file_fast(file_path:Path) -> pd.DataFrame:
+    """read_excel_file_fast :: Used for read the first sheet of excel file in openpyxl read only (streaming) mode,
+    first row is used as header
+
+    Args:
+        file_path (Path): File path of the excel file
+
+    Raises:
+        SensorFaultException: Custom Exception
+
+    Returns:
+        pd.DataFrame: dataframe
+    """
+    try:
+        workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = next(rows, ())
+            # read only mode gives empty rows for formatted cells
+            dataframe = pd.DataFrame(list(rows), columns=list(header)).dropna(how='all').reset_index(drop=True)
+        finally:
+            workbook.close()
+        logger.info(f"read excel file fast : file_path: {file_path} : Status: Successful : no_of_rows:{len(dataframe)}")
+        return dataframe
+    
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"read excel file fast :: file_path:{file_path} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def read_csv_header(file_path:Path) -> list[str]:
+    """read_csv_header :: Used for read only the header row of the csv file (column names same as pandas read_csv)
+
+    Args:
+        file_path (Path): File path of the file
+
+    Raises:
+        SensorFaultException: Custom Exception
+
+    Returns:
+        list[str]: column names, empty list if the file is empty
+    """
+    try:
+        try:
+            columns = pd.read_csv(file_path, nrows=0).columns.to_list()
+        except pd.errors.EmptyDataError:
+            columns = []
+        logger.info(f"read csv header : file_path: {file_path} : Status: Successful :: no_of_columns:{len(columns)}")
+        return columns
+    
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"read csv header :: file_path:{file_path} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def save_intermediate_file(df:pd.DataFrame, file_path:Path, index:bool=False) -> None:
+    """save_intermediate_file :Used for save the dataframe passed between pipeline stages, format is taken from file extension
+    (.parquet, .feather or .csv)
+
+    Args:
+        df (pd.DataFrame): dataframe
+        file_path (Path): file path
+        index (bool): store the dataframe index. Defaults to False.
+
+    Raises:
+        SensorFaultException: Custom Exception
+    """
+    try:
+        file_format = Path(file_path).suffix.lower()
+        if file_format == ".parquet":
+            df.to_parquet(file_path, index=index)
+        elif file_format == ".feather":
+            # feather can't store the index, store it as column
+            df.reset_index(drop=not index).to_feather(file_path)
+        else:
+            df.to_csv(file_path, index=index)
+        logger.info(f"save intermediate file : file_path: {file_path} : Status: Successful")
+    
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"save intermediate file :: file_path:{file_path} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def read_intermediate_file(file_path:Path, schema_dtypes:dict[str, str] | None=None, index:bool=False) -> pd.DataFrame:
+    """read_intermediate_file :Used for read the dataframe passed between pipeline stages, format is taken from file extension
+    (.parquet, .feather or .csv)
+
+    Args:
+        file_path (Path): file path
+        schema_dtypes (dict[str, str] | None): dtypes for reading csv file (parquet/feather keep the stored dtypes). Defaults to None.
+        index (bool): restore the index stored by save_intermediate_file(index=True). Defaults to False.
+
+    Raises:
+        SensorFaultException: Custom Exception
+
+    Returns:
+        pd.DataFrame: dataframe
+    """
+    try:
+        file_format = Path(file_path).suffix.lower()
+        if file_format == ".parquet":
+            # parquet restores the stored index itself
+            dataframe = pd.read_parquet(file_path)
+        elif file_format == ".feather":
+            dataframe = pd.read_feather(file_path)
+            if index:
+                # index is stored as first column, unnamed index is named "index" by reset_index
+                dataframe = dataframe.set_index(dataframe.columns[0])
+                if dataframe.index.name == "index":
+                    dataframe.index.name = None
+        elif index:
+            dataframe = pd.read_csv(file_path, index_col=0)
+        elif schema_dtypes is not None:
+            return read_csv_file_with_schema(file_path=file_path, schema_dtypes=schema_dtypes)
+        else:
+            return read_csv_file(file_path=file_path)
+        logger.info(f"read intermediate file : file_path: {file_path} : Status: Successful")
+        return dataframe
+    
+    except Exception as e:
+        error_message =  SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(f"read intermediate file :: file_path:{file_path} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
+def style_worksheet(ws) -> None:
+    """style_worksheet : Used for style the header, borders and column widths of a worksheet
+
+    Args:
+        ws (Worksheet): openpyxl worksheet object
+    """
     # Define border style
     thin_border = Border(
         left=Side(style='thin'),
@@ -180,6 +427,19 @@ def style_excel(excel_filename):
         adjusted_width = max_length + 2  # Add some padding
         ws.column_dimensions[column_letter].width = adjusted_width# type: ignore
 
+def style_excel(excel_filename):
+    """style_excel : Used for style the append_log_to_excel method
+
+    Args:
+        excel_filename (_type_): Excel file name
+    """
+    
+    # Load the workbook and select the active worksheet
+    wb = load_workbook(excel_filename)
+    ws = wb.active
+
+    style_worksheet(ws)
+
     # Save the styled workbook
     wb.save(excel_filename)
 
@@ -305,6 +565,41 @@ def append_log_to_excel(filename:str, status:str, status_reason: str, remark:str
         # logger.info(f"File:log_file.xlsx Data added :: Status:Successful :: Data:{new_df.to_dict()}")
         logger.info(f"append_log_to_excel :: file_name:{excel_filename} :: Status:Data added")
 
+def save_validation_logs_to_excel(validation_logs:list[dict], excel_filename:Path) -> None:
+    """save_validation_logs_to_excel :Used for store the buffered validation logs into styled excel file in one pass
+
+    Args:
+        validation_logs (list[dict]): validation log rows (DATE, FILENAME, STATUS, STATUS_REASON, REMARK)
+        excel_filename (Path): validation store file name
+
+    Raises:
+        error_message: Custom Exception
+    """
+    try:
+        new_df = pd.DataFrame(validation_logs, columns=['DATE','FILENAME','STATUS','STATUS_REASON','REMARK'])
+        
+        # keep the previous logs of the same run folder (same behaviour of append_log_to_excel)
+        if os.path.exists(excel_filename):
+            existing_df = pd.read_excel(excel_filename)
+            updated_df = pd.concat([existing_df.drop(columns=['SLNO'],errors='ignore'), new_df], ignore_index=True)
+        else:
+            updated_df = new_df
+        
+        # Define slno automatically based on the number of rows
+        updated_df.insert(0,'SLNO',range(1,len(updated_df)+1))
+        
+        # write and style the excel file in single pass
+        with pd.ExcelWriter(excel_filename, engine='openpyxl', mode='w') as writer:
+            updated_df.to_excel(writer, index=False)
+            style_worksheet(writer.sheets[next(iter(writer.sheets))])
+        
+        logger.info(f"save_validation_logs_to_excel :: file_name:{excel_filename} :: Status:Success :: no_of_logs:{len(new_df)}")
+    
+    except Exception as e:
+        error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+        logger.error(msg=f"save_validation_logs_to_excel :: file_name:{excel_filename} :: Status:Failed :: Error:{error_message}")
+        raise error_message
+
 def format_as_s3_path(path:Path) -> str:
     """format_as_s3_path :Used for convert path to s3_path format
 
@@ -678,6 +973,29 @@ def copy_file(src_file_path:Path,dst_folder_path:Path):
             logger.error(msg=f"get_dir_path_from_file_path :: Status:Failed :: Error:{error_message}")
             raise error_message    
 
+def add_file_to_zip(zip_file:zipfile.ZipFile, file_path:Path, arcname:str, compress_level:int | None = None) -> None:
+    """add_file_to_zip :Used for add the file into opened zip, already compressed files (ZIP_STORED_FILE_EXTENSIONS) are stored without compression
+
+    Args:
+        zip_file (zipfile.ZipFile): zip file opened in write/append mode
+        file_path (Path): file path
+        arcname (str): file name inside the zip
+        compress_level (int | None): deflate compress level. Defaults to None (zlib default).
+
+    Raises:
+        error_message: Custom Exception
+    """
+    try:
+        if str(file_path).lower().endswith(ZIP_STORED_FILE_EXTENSIONS):
+            zip_file.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+        else:
+            zip_file.write(file_path, arcname, compress_type=zipfile.ZIP_DEFLATED, compresslevel=compress_level)
+        logger.info(f'Added {file_path} as {arcname}')
+    except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"add_file_to_zip :: Status:Failed :: file_path:{file_path} :: Error:{error_message}")
+            raise error_message
+
 def create_zip_from_folder(folder_path:Path, output_zip_path:Path):
     """create_zip_from_folder :Used for create zip for folder data
 
@@ -697,8 +1015,7 @@ def create_zip_from_folder(folder_path:Path, output_zip_path:Path):
                     file_path = os.path.join(root, file)
                     # Add file to the zip, preserving the folder structure
                     arcname = os.path.relpath(file_path, folder_path)  # Relative path inside the zip
-                    zipf.write(file_path, arcname)
-                    logger.info(f'Added {file_path} as {arcname}')                    
+                    add_file_to_zip(zip_file=zipf, file_path=Path(file_path), arcname=arcname)
         logger.info(f"create_zip_from_folder :: Status:Success :: folder_path__path:{folder_path} :: output_zip_path:{output_zip_path}")
     except Exception as e:
             error_message = SensorFaultException(error_message=str(e),error_detail=sys)
@@ -862,18 +1179,45 @@ def check_folder_empty(folder_path:Path) -> bool:
             logger.error(msg=f"check_folder_empty :: Status:Failed :: error_message:{error_message}")
             raise error_message
                          
-def save_bad_file_names() -> None:
+def get_file_names_from_manifest(manifest_file_path:Path, status:str) -> list[str]:
+    """get_file_names_from_manifest :Used for getting the routed file names of given validation status from validation manifest
+
+    Args:
+        manifest_file_path (Path): validation manifest json file path
+        status (str): validation status (Passed/Failed)
+
+    Raises:
+        error_message: Custom Exception
+
+    Returns:
+        list[str]: file names routed with the given status
+    """
+    try:
+        manifest = read_json(manifest_file_path)
+        file_names = [file_name for file_name, file_data in manifest.files.items() if file_data.status==status]
+        logger.info(f"get_file_names_from_manifest :: Status:Success :: validation_status:{status} :: no_of_files:{len(file_names)}")
+        return file_names
+    
+    except Exception as e:
+            error_message = SensorFaultException(error_message=str(e),error_detail=sys)
+            logger.error(msg=f"get_file_names_from_manifest :: Status:Failed :: error_message:{error_message}")
+            raise error_message
+
+def save_bad_file_names(manifest_file_path:Path | None = None) -> None:
     """
     Saves the names of bad files to a JSON file.
 
-    This function retrieves the list of files from the specified directory 
-    containing bad raw data. It then creates a folder for the JSON file (if it 
-    does not already exist) and saves the list of bad file names into a JSON 
-    format.
+    This function retrieves the list of bad files from the validation manifest
+    (or lists the directory containing bad raw data when no manifest is given). 
+    It then creates a folder for the JSON file (if it does not already exist) 
+    and saves the list of bad file names into a JSON format.
 
     The JSON file is stored at the path specified by 
     `PredictionRawDataValidationConfig.dashboard_bad_file_names_json_path`.
 
+    Args:
+        manifest_file_path (Path | None): validation manifest json file path. Defaults to None.
+
     Raises:
         SensorFaultException: If an error occurs while attempting to read the 
         file names, create a folder, or save the JSON data, an exception is raised 
@@ -881,7 +1225,10 @@ def save_bad_file_names() -> None:
     """
     try:
         files_data = {}
-        files_list = os.listdir(PredictionRawDataValidationConfig.bad_raw_data_folder_path)
+        if manifest_file_path is not None and os.path.exists(manifest_file_path):
+            files_list = get_file_names_from_manifest(manifest_file_path=manifest_file_path,status="Failed")
+        else:
+            files_list = os.listdir(PredictionRawDataValidationConfig.bad_raw_data_folder_path)
         files_data['bad_files'] = files_list
         create_folder_using_file_path(PredictionRawDataValidationConfig.dashboard_bad_file_names_json_path)
         save_json(PredictionRawDataValidationConfig.dashboard_bad_file_names_json_path,files_data)
@@ -0,0 +1,16 @@
+import logging
+import pytest
+from src.logger import CloudWatchHandler
+
+
+@pytest.fixture(autouse=True)
+def local_logging_only():
+    """local_logging_only :Used for keep the test logs out of CloudWatch (handler is added back after test)
+    """
+    root_logger = logging.getLogger()
+    cloudwatch_handlers = [handler for handler in root_logger.handlers if isinstance(handler, CloudWatchHandler)]
+    for handler in cloudwatch_handlers:
+        root_logger.removeHandler(handler)
+    yield
+    for handler in cloudwatch_handlers:
+        root_logger.addHandler(handler)
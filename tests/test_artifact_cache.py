@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+import pandas as pd
+from src.components.data_preprocessing import Preprocessor
+from src.entity.config_entity import PreprocessorConfig
+from src.utilities.artifact_cache import ArtifactCache
+
+
+def make_entry_files(folder_path:Path, size:int) -> list[Path]:
+    file_paths = [folder_path / "preprocessed_data.parquet", folder_path / "preprocessor.pkl", folder_path / "preprocessor.json"]
+    for file_path in file_paths:
+        file_path.write_bytes(b"0" * size)
+    return file_paths
+
+
+def test_preprocessor_cache_key_same_for_runs_with_different_timestamps():
+    input_file = pd.DataFrame({"Sensor-1": [0.5, 1.5]})
+    config_keys = []
+    for timestamp in ["2026_10_18_06_00_00", "2026_10_18_07_30_00"]:
+        config = PreprocessorConfig()
+        artifact_dir = Path("artifacts") / timestamp
+        config.preprocessor_object_path = artifact_dir / "preprocessor.pkl"
+        config.preprocessed_data_file_path = artifact_dir / "preprocessed_data.parquet"
+        config.preprocessor_json_file_path = artifact_dir / "preprocessor.json"
+        config.non_duplicate_data_clear_df_path = artifact_dir / "final_non_duplicate_df.parquet"
+        config_keys.append(Preprocessor(config=config, input_file=input_file).get_config_keys())
+
+    assert config_keys[0] == config_keys[1]
+    assert not any(timestamp in key for key in config_keys[0] for timestamp in ["2026_10_18_06_00_00", "2026_10_18_07_30_00"])
+
+
+def test_preprocessor_cache_key_changes_with_threshold():
+    input_file = pd.DataFrame({"Sensor-1": [0.5, 1.5]})
+    config = PreprocessorConfig()
+    config_keys = Preprocessor(config=config, input_file=input_file).get_config_keys()
+    config.iqr_multiplier = config.iqr_multiplier * 2
+
+    assert Preprocessor(config=config, input_file=input_file).get_config_keys() != config_keys
+
+
+def test_evict_removes_whole_entries(tmp_path):
+    artifact_cache = ArtifactCache(cache_folder_path=tmp_path / "cache", max_size_mb=1)
+    file_paths = make_entry_files(tmp_path, size=300 * 1024)
+    artifact_cache.put_entry(key="oldkey", file_paths=file_paths)
+    for file_path in file_paths:
+        os.utime(artifact_cache.get_cache_file_path(key="oldkey", file_name=file_path.name), (0, 0))
+    artifact_cache.put_entry(key="newkey", file_paths=file_paths)
+
+    assert sorted(os.listdir(tmp_path / "cache")) == sorted(f"newkey_{file_path.name}" for file_path in file_paths)
+    assert artifact_cache.get_entry(key="newkey", file_paths=file_paths)
+    assert not artifact_cache.get_entry(key="oldkey", file_paths=file_paths)
+
+
+def test_partial_entry_is_miss(tmp_path):
+    artifact_cache = ArtifactCache(cache_folder_path=tmp_path / "cache", max_size_mb=10)
+    file_paths = make_entry_files(tmp_path, size=10)
+    artifact_cache.put_entry(key="key", file_paths=file_paths)
+    os.remove(artifact_cache.get_cache_file_path(key="key", file_name="preprocessor.pkl"))
+
+    assert not artifact_cache.get_entry(key="key", file_paths=file_paths)
+    assert os.listdir(tmp_path / "cache") == []
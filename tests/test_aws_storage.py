@@ -0,0 +1,63 @@
+import threading
+from types import SimpleNamespace
+import pytest
+from src.configuration.aws_connection import S3Client
+from src.db_management import aws_storage
+from src.db_management.aws_storage import SimpleStorageService
+from src.entity.config_entity import S3Config
+
+
+class StubS3Client:
+    """StubS3Client :boto3 client stand-in, download of key fails for its first failures_per_key[key] attempts
+    """
+    def __init__(self, failures_per_key:dict[str, int]):
+        self.failures_per_key = dict(failures_per_key)
+        self.attempts = []
+        self.lock = threading.Lock()
+
+    def download_file(self, Bucket:str, Key:str, Filename:str) -> None:
+        with self.lock:
+            self.attempts.append(Key)
+            if self.failures_per_key.get(Key, 0) > 0:
+                self.failures_per_key[Key] -= 1
+                raise ConnectionError(f"connection reset :: key:{Key}")
+        with open(Filename, "w") as f:
+            f.write(Key)
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    def make_storage(stub_client:StubS3Client) -> SimpleStorageService:
+        monkeypatch.setattr(S3Client, "s3_client", stub_client)
+        monkeypatch.setattr(S3Client, "s3_resource", object())
+        monkeypatch.setattr(aws_storage.time, "sleep", lambda seconds: None) # no backoff wait
+        config = S3Config()
+        config.download_progress_batch_size = 2
+        return SimpleStorageService(config=config)
+    return make_storage
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_download_s3_files_retries_and_reports_progress(storage, tmp_path, max_workers):
+    files_path = [f"training_data/wafer_{file_no}.csv" for file_no in range(5)]
+    stub_client = StubS3Client(failures_per_key={files_path[1]: 2, files_path[3]: 1})
+    progress = []
+
+    storage(stub_client).download_s3_files(bucket_obj=SimpleNamespace(name="bucket"), files_path=files_path,
+                                           local_folder_path=tmp_path, max_workers=max_workers,
+                                           progress_callback=lambda completed, total: progress.append((completed, total)))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"wafer_{file_no}.csv" for file_no in range(5)]
+    assert (tmp_path / "wafer_1.csv").read_text() == files_path[1]
+    assert len(stub_client.attempts) == len(files_path) + 3
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+
+
+def test_download_s3_files_fails_after_max_retries(storage, tmp_path):
+    files_path = [f"training_data/wafer_{file_no}.csv" for file_no in range(3)]
+    stub_client = StubS3Client(failures_per_key={files_path[0]: S3Config.download_max_retries + 1})
+
+    with pytest.raises(Exception, match="connection reset"):
+        storage(stub_client).download_s3_files(bucket_obj=SimpleNamespace(name="bucket"), files_path=files_path,
+                                               local_folder_path=tmp_path, max_workers=3)
+    assert stub_client.attempts.count(files_path[0]) == S3Config.download_max_retries + 1
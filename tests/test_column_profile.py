@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from src.components.data_preprocessing import Preprocessor, preprocessing_results
+from src.entity.config_entity import PreprocessorConfig
+
+
+def make_training_data(config:PreprocessorConfig) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    no_of_rows = 120
+    training_data = pd.DataFrame({
+        "Sensor-1": rng.normal(size=no_of_rows),
+        "Sensor-2": rng.lognormal(sigma=1.5, size=no_of_rows),
+        "Sensor-3": rng.exponential(size=no_of_rows),
+        "Sensor-4": rng.normal(loc=10, scale=2, size=no_of_rows),
+        "Sensor-5": np.full(no_of_rows, 3.0),
+    })
+    features = ["Sensor-1", "Sensor-2", "Sensor-3"]
+    training_data[features] = training_data[features].mask(rng.random((no_of_rows, len(features))) < 0.15)
+    training_data.insert(0, config.wafer_column_name, [f"Wafer-{row}" for row in range(no_of_rows)])
+    training_data[config.target_feature] = np.where(np.arange(no_of_rows) % 3, 1, -1)
+    return training_data
+
+
+def test_shared_profile_fits_same_as_step_wise_statistics():
+    config = PreprocessorConfig()
+    training_data = make_training_data(config)
+    preprocessor = Preprocessor(config=config, input_file=training_data)
+    pipeline = preprocessor.build_pipeline()
+    pipeline.fit_transform(training_data.copy())
+
+    # each step computing statistics on its own input (no shared profile)
+    X = preprocessor.drop_unwanted_columns(preprocessor.drop_duplicate_rows(training_data.copy()))
+    zero_std = Preprocessor.HandleZeroStdColumns(config=config)
+    X = zero_std.fit_transform(X)
+    handle_nan = Preprocessor.HandleNaNValues(config=config)
+    X = handle_nan.fit_transform(X)
+    handle_skew = Preprocessor.HandleHighSkewColumns(config=config)
+    X = handle_skew.fit_transform(X)
+    outlier = Preprocessor.OutlierHandler(config=config).fit(X)
+
+    steps = pipeline.named_steps
+    assert [name for name in steps if name.endswith("profile")] == ["column_profile"]
+    assert steps["drop_zero_std_columns"].zero_std_columns == zero_std.zero_std_columns
+    assert steps["handle_nan_values"].columns_to_drop == handle_nan.columns_to_drop
+    assert steps["handle_high_skew_columns"].skewed_columns == handle_skew.skewed_columns
+    assert steps["handle_outlier"].limit_columns == outlier.limit_columns
+    np.testing.assert_array_equal(steps["handle_outlier"].lower_limit_array, outlier.lower_limit_array)
+    np.testing.assert_array_equal(steps["handle_outlier"].upper_limit_array, outlier.upper_limit_array)
+
+
+def test_column_profile_feeds_preprocessing_report():
+    config = PreprocessorConfig()
+    training_data = make_training_data(config)
+    Preprocessor(config=config, input_file=training_data).build_pipeline().fit_transform(training_data.copy())
+
+    column_profile = preprocessing_results["column_profile"]
+    assert set(column_profile["Sensor-1"]) == {"null_ratio", "std", "skew", f"p_{config.lower_percentile}", f"p_{config.upper_percentile}"}
+    assert column_profile["Sensor-5"]["std"] == 0
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.impute import KNNImputer
+from src.components.data_preprocessing import Preprocessor, preprocessing_results
+from src.entity.config_entity import PreprocessorConfig
+
+
+@pytest.fixture
+def sensor_matrix() -> np.ndarray:
+    rng = np.random.default_rng(42)
+    matrix = rng.normal(size=(200, 12))
+    matrix[rng.random(matrix.shape) < 0.1] = np.nan
+    return matrix
+
+
+def test_fast_knn_imputer_matches_knn_imputer(sensor_matrix):
+    expected = KNNImputer(n_neighbors=5, weights='uniform').fit(sensor_matrix).transform(sensor_matrix)
+    fast_knn_imputer = Preprocessor.FastKNNImputer(n_neighbors=5, n_components=12, n_candidates=len(sensor_matrix),
+                                                   chunk_size=16, n_jobs=2).fit(sensor_matrix)
+
+    np.testing.assert_allclose(fast_knn_imputer.transform(sensor_matrix), expected, atol=1e-8)
+
+
+def test_handle_nan_values_falls_back_to_knn_imputer_above_tolerance(sensor_matrix):
+    config = PreprocessorConfig()
+    config.knn_imputer_backend = 'fast'
+    config.fast_knn_tolerance = -1.0 # any difference (even zero) is above tolerance
+    sensor_data = pd.DataFrame(sensor_matrix, columns=[f"Sensor-{column}" for column in range(sensor_matrix.shape[1])])
+    sensor_data[config.target_feature] = 1
+
+    handle_nan_values = Preprocessor.HandleNaNValues(config=config).fit(sensor_data)
+
+    assert isinstance(handle_nan_values.knn_imputer, KNNImputer)
+
+
+def test_fast_knn_imputer_validated_on_held_out_rows(sensor_matrix):
+    fast_knn_imputer = Preprocessor.FastKNNImputer(n_neighbors=5, n_components=12, n_candidates=len(sensor_matrix),
+                                                   validation_sample_size=30).fit(sensor_matrix)
+
+    assert fast_knn_imputer.fit_X_.shape == sensor_matrix.shape # held-out rows are used for fitting after validation
+    assert preprocessing_results['knn_imputer_max_abs_error'] == fast_knn_imputer.validation_max_abs_error_
+    assert fast_knn_imputer.validation_max_abs_error_ < 1e-8
+
+
+def test_brute_force_value_skips_nan_distance_donors():
+    # first donor has no feature in common with the row, it gets zero weight in KNNImputer (scikit-learn>=1.6)
+    donors = np.array([[np.nan, 10.0, np.nan],
+                       [1.1, 20.0, 5.0],
+                       [0.5, np.nan, 4.0]])
+    row = np.array([1.0, np.nan, np.nan])
+    fast_knn_imputer = Preprocessor.FastKNNImputer(n_neighbors=2).fit(donors)
+
+    # only second donor has column value and common features
+    assert fast_knn_imputer.brute_force_value(row, column=1) == pytest.approx(20.0)
@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+from src.components.data_preprocessing import Preprocessor
+from src.entity.config_entity import PreprocessorConfig
+
+
+def test_outlier_handler_keeps_column_dtypes():
+    config = PreprocessorConfig()
+    rng = np.random.default_rng(3)
+    training_data = pd.DataFrame({"Sensor-1": rng.normal(size=100).astype(np.float32),
+                                  "Sensor-2": rng.normal(loc=10, size=100)})
+    training_data.iloc[:2] = 500.0 # outliers
+    outlier_handler = Preprocessor.OutlierHandler(config=config).fit(training_data)
+
+    clipped_data = outlier_handler.transform(training_data.copy())
+
+    assert clipped_data.dtypes.tolist() == [np.dtype(np.float32), np.dtype(np.float64)]
+    # float32 clipping gives same values as float64 clipping cast back to float32
+    expected = training_data.astype(np.float64).clip(lower=outlier_handler.lower_limit_array, upper=outlier_handler.upper_limit_array, axis=1)
+    np.testing.assert_array_equal(clipped_data["Sensor-1"].to_numpy(), expected["Sensor-1"].to_numpy(dtype=np.float32))
+    np.testing.assert_array_equal(clipped_data["Sensor-2"].to_numpy(), expected["Sensor-2"].to_numpy())
+    assert clipped_data["Sensor-1"].max() < 500.0
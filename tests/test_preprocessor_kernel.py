@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.utils.validation import check_is_fitted
+from src.components.data_preprocessing import Preprocessor
+from src.components.preprocessor_kernel import PreprocessorKernel, load_preprocessor_kernel
+from src.entity.config_entity import PreprocessorConfig
+
+
+def make_sensor_data(config:PreprocessorConfig, no_of_rows:int, seed:int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    sensor_data = pd.DataFrame({
+        "Sensor-1": rng.normal(size=no_of_rows),
+        "Sensor-2": rng.lognormal(sigma=1.5, size=no_of_rows), # high skew
+        "Sensor-3": -rng.exponential(size=no_of_rows), # high skew with negative values
+        "Sensor-4": rng.normal(loc=10, scale=2, size=no_of_rows),
+        "Sensor-5": rng.uniform(size=no_of_rows),
+        "Sensor-6": np.full(no_of_rows, 3.0), # zero std
+    })
+    sensor_data.iloc[:3, 3] = 500.0 # outliers
+    features = sensor_data.columns[:5]
+    sensor_data[features] = sensor_data[features].mask(rng.random((no_of_rows, len(features))) < 0.1)
+    sensor_data.insert(0, config.wafer_column_name, [f"Wafer-{seed}-{row}" for row in range(no_of_rows)])
+    return sensor_data
+
+
+@pytest.fixture
+def fitted_pipeline():
+    config = PreprocessorConfig()
+    config.save_non_duplicate_data = False
+    training_data = make_sensor_data(config, no_of_rows=150, seed=1)
+    training_data[config.target_feature] = np.where(np.arange(len(training_data)) % 3, 1, -1)
+    pipeline = Preprocessor(config=config, input_file=training_data).build_pipeline().fit(training_data)
+    return config, pipeline
+
+
+def test_fitted_pipeline_is_recognised_as_fitted(fitted_pipeline):
+    _, pipeline = fitted_pipeline
+    remaining_steps = [name for name, _ in pipeline.steps].index("drop_unwanted_columns")
+
+    # sklearn>=1.8 raises NotFittedError in transform of pipeline whose last step is not recognised as fitted
+    check_is_fitted(pipeline)
+    check_is_fitted(pipeline[remaining_steps:])
+
+
+def test_kernel_output_matches_pipeline_transform(fitted_pipeline):
+    config, pipeline = fitted_pipeline
+    prediction_data = make_sensor_data(config, no_of_rows=40, seed=2)
+    kernel = PreprocessorKernel.compile(pipeline)
+
+    expected = pipeline.transform(prediction_data.copy())
+    actual = kernel.transform(prediction_data.copy())
+
+    assert len(kernel.skew_positions) > 0
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_index_equal(actual.index, expected.index)
+    np.testing.assert_allclose(actual.to_numpy(dtype=np.float64), expected.to_numpy(dtype=np.float64), atol=1e-8)
+
+
+def test_kernel_not_used_without_stored_standardization(fitted_pipeline, caplog):
+    config, pipeline = fitted_pipeline
+    # preprocessor objects saved before standardization parameters were stored
+    skew_handler = pipeline.named_steps["handle_high_skew_columns"]
+    del skew_handler.standardize_mean, skew_handler.standardize_scale
+
+    assert load_preprocessor_kernel(pipeline, sample_data=make_sensor_data(config, no_of_rows=5, seed=3),
+                                    verify_sample_size=5, tolerance=1e-6) is pipeline
+    assert "load_preprocessor_kernel :: Status:Using pipeline" in caplog.text
@@ -0,0 +1,66 @@
+import json
+import pandas as pd
+import pytest
+from src.components.rawdata_validation import RawDataValidation
+from src.entity.config_entity import TrainingRawDataValidationConfig
+
+RAW_FILE_NAME = "wafer_08012024_122518.csv"
+
+
+@pytest.fixture
+def raw_data_validation(tmp_path):
+    schema_file_path = tmp_path / "training_schema.json"
+    schema_file_path.write_text(json.dumps({"SampleFileName": RAW_FILE_NAME,
+                                            "NumberofColumns": 3,
+                                            "ColName": {"Unnamed: 0": "object", "Sensor-1": "float64", "Sensor-2": "float64"}}))
+    config = TrainingRawDataValidationConfig()
+    config.schema_file_path = schema_file_path
+    config.validation_log_store_file_path = tmp_path / "artifact" / "validation_logs.db"
+    config.validation_report_file_path = tmp_path / "artifact" / "validation_logs.xlsx"
+    config.dashboard_validation_log_store_file_path = tmp_path / "dashboard" / "validation_logs.db"
+    config.dashboard_validation_report_file_path = tmp_path / "dashboard" / "validation_logs.xlsx"
+    config.dashboard_validation_summary_file_path = tmp_path / "dashboard" / "validation_summary.json"
+    return RawDataValidation(config=config, folder_path=tmp_path)
+
+
+def test_integer_valued_column_fails_dtype_validation(raw_data_validation, tmp_path):
+    (tmp_path / RAW_FILE_NAME).write_text(",Sensor-1,Sensor-2\nWafer-1,0.5,3\nWafer-2,1.5,4\n")
+
+    status, file_logs = raw_data_validation.validate_file(RAW_FILE_NAME)
+
+    assert status == "Failed"
+    assert file_logs[-1]["STATUS_REASON"] == "COLUMN DATA VALIDATION"
+    assert "Column_name:Sensor-2, Column_dtype:int64" in file_logs[-1]["REMARK"]
+    assert "Sensor-1" not in file_logs[-1]["REMARK"]
+
+
+def test_float_columns_pass_dtype_validation(raw_data_validation, tmp_path):
+    (tmp_path / RAW_FILE_NAME).write_text(",Sensor-1,Sensor-2\nWafer-1,0.5,3.0\nWafer-2,1.5,4.5\n")
+
+    status, file_logs = raw_data_validation.validate_file(RAW_FILE_NAME)
+
+    assert status == "Passed"
+    assert file_logs[-1]["REMARK"] == "COLUMN DATA VALIDATION COMPLETED"
+
+
+def test_column_name_mismatch_rejected_from_header(raw_data_validation, tmp_path, monkeypatch):
+    (tmp_path / RAW_FILE_NAME).write_text(",Sensor-1,Sensor-9\nWafer-1,0.5,3.0\n")
+    monkeypatch.setattr(raw_data_validation, "read_raw_file", lambda file_path: pytest.fail("body parsed for rejected file"))
+
+    status, file_logs = raw_data_validation.validate_file(RAW_FILE_NAME)
+
+    assert status == "Failed"
+    assert file_logs[-1]["STATUS_REASON"] == "COLUMN DATA VALIDATION"
+    assert "'raw_file': 'Column_name:Sensor-9'" in file_logs[-1]["REMARK"]
+
+
+def test_validation_report_written_into_artifacts_during_run(raw_data_validation, tmp_path):
+    (tmp_path / RAW_FILE_NAME).write_text(",Sensor-1,Sensor-2\nWafer-1,0.5,3.0\nWafer-2,1.5,4.5\n")
+    status, file_logs = raw_data_validation.validate_file(RAW_FILE_NAME)
+    raw_data_validation.validation_logs.extend(file_logs)
+
+    raw_data_validation.save_validation_logs()
+
+    validation_report = pd.read_excel(tmp_path / "artifact" / "validation_logs.xlsx")
+    assert validation_report["FILENAME"].tolist() == [RAW_FILE_NAME] * len(file_logs)
+    assert (tmp_path / "dashboard" / "validation_logs.xlsx").exists()
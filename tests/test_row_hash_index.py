@@ -0,0 +1,27 @@
+import pandas as pd
+from src.db_management.row_hash_index import RowHashIndex
+
+
+def test_find_predictions_returns_stored_prediction_of_same_rows(tmp_path):
+    row_hash_index = RowHashIndex(db_file_path=tmp_path / "row_hash_index.db", max_age_days=1)
+    input_file = pd.DataFrame({"Wafer": ["Wafer-1", "Wafer-2", "Wafer-3"], "Sensor-1": [0.5, 1.5, 2.5]})
+    row_hashes = RowHashIndex.hash_rows(df=input_file, wafer_column="Wafer")
+    row_hash_index.add(row_hashes=row_hashes[:2], wafers=["Wafer-1", "Wafer-2"], outputs=[0, 1], confidences=[0.9, 0.75])
+
+    # Wafer-2 values changed, only Wafer-1 is seen
+    input_file.loc[1, "Sensor-1"] = 9.5
+    predictions = row_hash_index.find_predictions(row_hashes=RowHashIndex.hash_rows(df=input_file, wafer_column="Wafer"),
+                                                  wafers=input_file["Wafer"].tolist())
+
+    assert predictions.index.tolist() == [0]
+    assert predictions.loc[0, "OUTPUT"] == 0
+    assert predictions.loc[0, "CONFIDENCE"] == 0.9
+
+
+def test_find_predictions_skips_expired_rows(tmp_path):
+    row_hash_index = RowHashIndex(db_file_path=tmp_path / "row_hash_index.db", max_age_days=-1)
+    input_file = pd.DataFrame({"Wafer": ["Wafer-1"], "Sensor-1": [0.5]})
+    row_hashes = RowHashIndex.hash_rows(df=input_file, wafer_column="Wafer")
+    row_hash_index.add(row_hashes=row_hashes, wafers=["Wafer-1"], outputs=[1], confidences=[0.6])
+
+    assert row_hash_index.find_predictions(row_hashes=row_hashes, wafers=["Wafer-1"]).empty